@@ -0,0 +1,53 @@
+"""hot path indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 17:20:12.418305
+
+Indexes for the list and filter queries the API runs on every page load.
+They are built CONCURRENTLY so upgrading a live database does not block
+writes to these tables.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # (name, table, columns)
+    ('ix_task_assignments_intern_id', 'task_assignments', ['intern_id']),
+    ('ix_candidateinterviews_candidate_id', 'candidateinterviews', ['candidate_id']),
+    ('ix_candidate_status_college_id', 'candidate', ['status', 'college_id']),
+    ('ix_task_position', 'task', ['position']),
+    ('ix_student_resumes_college_id_uploaded_at', 'student_resumes', ['college_id', 'uploaded_at']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -0,0 +1,39 @@
+"""uploaded files keyset index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 17:48:31.902114
+
+Supports cursor pagination of GET /college-portal/uploads
+(ORDER BY uploaded_at DESC, id DESC).
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_uploaded_files_uploaded_at_id', 'uploaded_files', ['uploaded_at', 'id'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_uploaded_files_uploaded_at_id', table_name='uploaded_files',
+            postgresql_concurrently=True, if_exists=True,
+        )
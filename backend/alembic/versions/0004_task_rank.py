@@ -0,0 +1,57 @@
+"""task rank
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 18:20:05.417263
+
+Adds task.rank, the lexicographic board order key (app/services/task_rank.py).
+Existing tasks are ranked in their current position order.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    rank_type = sa.String(length=255).with_variant(sa.String(length=255, collation='C'), 'postgresql')
+    op.add_column('task', sa.Column('rank', rank_type, nullable=True))
+
+    # Zero-padded row numbers are valid, ordered rank keys (the trailing 'i'
+    # keeps them from ending in '0'); a later rebalance respaces them
+    op.execute(
+        """
+        UPDATE task SET rank = ranked.rank
+        FROM (
+            SELECT task_id, lpad(row_number() OVER (ORDER BY position, task_id)::text, 10, '0') || 'i' AS rank
+            FROM task
+        ) AS ranked
+        WHERE task.task_id = ranked.task_id
+        """
+    )
+    op.alter_column('task', 'rank', existing_type=rank_type, nullable=False)
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_task_rank'), 'task', ['rank'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_task_rank'), table_name='task',
+            postgresql_concurrently=True, if_exists=True,
+        )
+    op.drop_column('task', 'rank')
@@ -0,0 +1,56 @@
+"""list filter indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 17:20:24.513907
+
+Indexes for the fields list endpoints can filter and sort on
+(app/db/filters.py). Built CONCURRENTLY, like 0002, so upgrading a live
+database does not block writes.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, Sequence[str], None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    # (name, table, columns)
+    ('ix_candidate_college_id', 'candidate', ['college_id']),
+    ('ix_candidate_application_date', 'candidate', ['application_date']),
+    ('ix_intern_status', 'intern', ['status']),
+    ('ix_intern_start_date', 'intern', ['start_date']),
+    ('ix_task_status', 'task', ['status']),
+    ('ix_task_priority', 'task', ['priority']),
+    ('ix_task_due_date', 'task', ['due_date']),
+    ('ix_task_created_by', 'task', ['created_by']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -0,0 +1,72 @@
+"""candidate search
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 17:20:28.236104
+
+Full-text and fuzzy candidate search: candidate.resume_text, the generated
+candidate.search_vector (kept current by Postgres on every insert and
+update) with a GIN index, and pg_trgm GIN indexes on full_name and
+university. Adding the stored generated column rewrites the table once;
+the indexes are then built CONCURRENTLY.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(full_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(skills, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(university, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(resume_text, '')), 'C')"
+)
+
+INDEXES = [
+    # (name, column, operator class)
+    ('ix_candidate_search_vector', 'search_vector', None),
+    ('ix_candidate_full_name_trgm', 'full_name', 'gin_trgm_ops'),
+    ('ix_candidate_university_trgm', 'university', 'gin_trgm_ops'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('candidate', sa.Column('resume_text', sa.Text(), nullable=True))
+    op.add_column('candidate', sa.Column(
+        'search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True
+    ))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, column, ops in INDEXES:
+            op.create_index(
+                name, 'candidate', [column], unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: ops} if ops else {},
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, column, ops in reversed(INDEXES):
+            op.drop_index(
+                name, table_name='candidate',
+                postgresql_concurrently=True, if_exists=True,
+            )
+    op.drop_column('candidate', 'search_vector')
+    op.drop_column('candidate', 'resume_text')
+    # pg_trgm is left installed: other objects may depend on it
@@ -7,6 +7,9 @@ from app.api.api_v1.endpoints import college
 from app.api.api_v1.endpoints import interview_rounds
 from app.api.api_v1.endpoints import candidate_interviews
 from app.api.api_v1.endpoints import college_portal
+from app.api.api_v1.endpoints import email_outbox
+from app.api.api_v1.endpoints import monitoring
+from app.api.api_v1.endpoints import events
 from fastapi import APIRouter
 
 api_router = APIRouter()
@@ -18,4 +21,7 @@ api_router.include_router(task_assignment.router,prefix="/task_assignment",tags=
 api_router.include_router(college.router,prefix="/colleges",tags=["colleges"])
 api_router.include_router(interview_rounds.router,prefix="/interview_rounds",tags=["interview_rounds"])
 api_router.include_router(candidate_interviews.router,prefix="/candidate_interviews",tags=["candidate_interviews"])
-api_router.include_router(college_portal.router, prefix="/college-portal", tags=["college-portal"])
\ No newline at end of file
+api_router.include_router(college_portal.router, prefix="/college-portal", tags=["college-portal"])
+api_router.include_router(email_outbox.router, prefix="/email-outbox", tags=["email-outbox"])
+api_router.include_router(monitoring.router, prefix="/monitoring", tags=["monitoring"])
+api_router.include_router(events.router, prefix="/events", tags=["events"])
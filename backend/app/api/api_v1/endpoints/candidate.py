@@ -1,10 +1,13 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from collections import defaultdict
 
 from app.api import deps
-from app.schemas.candidate import Candidate, CandidateCreate, CandidateUpdate
+from app.db.pagination import page_items
+from app.schemas.candidate import (
+    Candidate, CandidateCreate, CandidateRankRequest, CandidateRankResult, CandidateSearchResult, CandidateUpdate
+)
 from app.services.candidate_service import candidate_service
 from app.services.text_extract import pdf_extraction_service
 from app.services.user_service import get_college_id_by_user_id
@@ -14,20 +17,30 @@ router = APIRouter()
 
 @router.get("/", response_model=List[Candidate])
 def read_candidates(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None
 ) -> Any:
     """
-    Retrieve all candidates with pagination.
+    Retrieve candidates one page at a time. The cursor for the next page is
+    returned in the X-Next-Cursor header; the header is absent on the last page.
+
+    Narrow the list with repeated filter=field:operator:value parameters and
+    order it with sort=field[,-field]; see CANDIDATE_FILTERS for the allowed fields.
     """
-    return candidate_service.get_candidates(db, skip=skip, limit=limit)
+    page = candidate_service.get_candidates(
+        db, cursor=cursor, limit=limit, filters=filters, sort=sort
+    )
+    return page_items(response, page)
 
 
 @router.post("/", response_model=Candidate, status_code=status.HTTP_201_CREATED)
 def create_candidate(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     candidate_in: CandidateCreate
 ) -> Any:
     """
@@ -47,10 +60,74 @@ def create_candidate(
     )
 
 
+@router.get("/by-skills", response_model=List[Candidate])
+def read_candidates_by_skills(
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    all_of: List[str] = Query([], alias="all", max_length=20),
+    any_of: List[str] = Query([], alias="any", max_length=20),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None
+) -> Any:
+    """
+    Candidates with every skill given as all= and at least one given as any=,
+    e.g. ?all=python&all=docker&any=aws&any=gcp. Spellings and common
+    synonyms ("js", "JavaScript") are matched through the skill aliases.
+    Paged and filtered like the candidate list.
+    """
+    if not all_of and not any_of:
+        raise HTTPException(status_code=400, detail="Give at least one skill in 'all' or 'any'")
+    page = candidate_service.get_candidates_by_skills(
+        db, all_of=all_of, any_of=any_of, cursor=cursor, limit=limit, filters=filters, sort=sort
+    )
+    return page_items(response, page)
+
+
+@router.get("/search", response_model=List[CandidateSearchResult])
+def search_candidates(
+    q: str = Query(..., min_length=2, max_length=200),
+    db: Session = Depends(deps.get_db, scope="function"),
+    limit: int = Query(20, ge=1, le=100),
+    filters: List[str] = Query([], alias="filter")
+) -> Any:
+    """
+    Search candidates by name, skills, university and resume text, best
+    match first. q takes web search syntax ("exact phrase", -exclude, or);
+    names and universities also match when misspelt. filter= narrows the
+    results like on the candidate list.
+    """
+    results = candidate_service.search_candidates(db, q, limit=limit, filters=filters)
+    return [
+        CandidateSearchResult(**Candidate.model_validate(candidate).model_dump(), score=score)
+        for candidate, score in results
+    ]
+
+
+@router.post("/rank", response_model=List[CandidateRankResult])
+def rank_candidates(
+    request: CandidateRankRequest,
+    db: Session = Depends(deps.get_db, scope="function")
+) -> Any:
+    """
+    Rank candidates by how well their skills and resume match a job
+    description, best first. Scored in process against an index refreshed
+    every few seconds, so very recent edits may not count yet.
+    """
+    results = candidate_service.rank_candidates(
+        db, request.job_description, limit=request.limit, college_id=request.college_id
+    )
+    return [
+        CandidateRankResult(**Candidate.model_validate(candidate).model_dump(), score=score)
+        for candidate, score in results
+    ]
+
+
 @router.get("/{candidate_id}", response_model=Candidate)
 def read_candidate_by_id(
     candidate_id: int,
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Get a specific candidate by ID.
@@ -69,7 +146,7 @@ def read_candidate_by_id(
 @router.put("/{candidate_id}", response_model=Candidate)
 def update_candidate(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     candidate_id: int,
     candidate_in: CandidateUpdate
 ) -> Any:
@@ -95,7 +172,7 @@ def update_candidate(
 @router.delete("/{candidate_id}", response_model=Candidate)
 def delete_candidate(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     candidate_id: int
 ) -> Any:
     """
@@ -117,7 +194,7 @@ def delete_candidate(
 
 @router.post("/extract-resumes", response_model=dict[str, str])
 def extract_resumes(
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Extract text from resumes and process them to create candidates.
@@ -131,16 +208,22 @@ def extract_resumes(
 @router.get("/status/{status}", response_model=List[Candidate])
 def read_candidates_by_status(
     status: str,
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None
 ) -> Any:
     """
-    Retrieve all candidates with a specific status.
+    Retrieve candidates with a specific status, one page at a time
+    (next page cursor in the X-Next-Cursor header). filter and sort take
+    the fields in CANDIDATE_FILTERS, as on the full list.
     """
-    candidates = candidate_service.get_candidates_by_status(
-        db, status=status, skip=skip, limit=limit
+    page = candidate_service.get_candidates_by_status(
+        db, status=status, cursor=cursor, limit=limit, filters=filters, sort=sort
     )
+    candidates = page_items(response, page)
     if not candidates:
         raise HTTPException(
             status_code=404,
@@ -152,25 +235,30 @@ def read_candidates_by_status(
 @router.get("/hired/{user_id}", response_model=List[Candidate])
 def read_hired_candidates_by_user(
     user_id: int,
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None
 ) -> Any:
     """
-    Retrieve all hired candidates filtered by user_id.
+    Retrieve the hired candidates of the college linked to user_id, one page
+    at a time (next page cursor in the X-Next-Cursor header). filter and sort
+    take the fields in CANDIDATE_FILTERS, as on the full list.
     """
     # Fetch the college_id using the user_id
     college_id = get_college_id_by_user_id(db, user_id=user_id)
 
-    # Fetch all candidates with "hired" status
-    candidates = candidate_service.get_candidates_by_status(
-        db, status="HIRED", skip=skip, limit=limit
-    )
-
-    # Filter candidates by college_id
-    filtered_candidates = [
-        candidate for candidate in candidates if candidate.college_id == college_id
-    ]
+    # Status and college are both matched in SQL, so every page is full.
+    # A user without a college has no hired candidates (not everyone's).
+    filtered_candidates = []
+    if college_id is not None:
+        page = candidate_service.get_candidates_by_status(
+            db, status="HIRED", cursor=cursor, limit=limit, college_id=college_id,
+            filters=filters, sort=sort,
+        )
+        filtered_candidates = page_items(response, page)
 
     if not filtered_candidates:
         raise HTTPException(
@@ -1,8 +1,10 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.db.pagination import page_items
+from app.db.unit_of_work import save, unit_of_work
 from app.schemas.candidate_interviews import CandidateInterviews, CandidateInterviewsCreate, CandidateInterviewsUpdate
 from app.services.candidate_interviews_service import candidate_interviews_service
 from app.services.candidate_service import candidate_service
@@ -14,20 +16,23 @@ router = APIRouter()
 
 @router.get("/", response_model=List[CandidateInterviews])
 def read_candidate_interviews(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
     limit: int = 100
 ) -> Any:
     """
-    Retrieve all candidate interviews with pagination.
+    Retrieve candidate interviews one page at a time. The cursor for the next page is
+    returned in the X-Next-Cursor header; the header is absent on the last page.
     """
-    return candidate_interviews_service.get_candidate_interviews(db, skip=skip, limit=limit)
+    page = candidate_interviews_service.get_candidate_interviews(db, cursor=cursor, limit=limit)
+    return page_items(response, page)
 
 
 @router.post("/", response_model=CandidateInterviews, status_code=status.HTTP_201_CREATED)
 def create_candidate_interview(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     candidate_interview_in: CandidateInterviewsCreate
 ) -> Any:
     """
@@ -41,7 +46,7 @@ def create_candidate_interview(
 @router.get("/{candidate_interview_id}", response_model=List[CandidateInterviews])
 def read_candidate_interview_by_id(
     candidate_interview_id: int,
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Get a specific candidate interview by ID.
@@ -60,7 +65,7 @@ def read_candidate_interview_by_id(
 @router.put("/{candidate_interview_id}", response_model=CandidateInterviews)
 def update_candidate_interview(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     candidate_interview_id: int,
     candidate_interview_in: CandidateInterviewsUpdate
 ) -> Any:
@@ -86,7 +91,7 @@ def update_candidate_interview(
 @router.delete("/{candidate_interview_id}", response_model=CandidateInterviews)
 def delete_candidate_interview(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     candidate_interview_id: int
 ) -> Any:
     """
@@ -109,7 +114,7 @@ def delete_candidate_interview(
 @router.post("/save-feedback", status_code=status.HTTP_200_OK)
 def save_feedback(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     feedback_data: dict
 ) -> Any:
     """
@@ -139,39 +144,34 @@ def save_feedback(
         status= "rejected" if rating == 6 else "selected"  # Default status
     )
 
-    # Create a new candidate interview entry
-    candidate_interview = candidate_interviews_service.create_candidate_interview(
-        db=db,
-        candidate_interview_in=candidate_interview_in
-    )
-
-    # Commit the new entry
-    db.add(candidate_interview)
-    db.commit()
-    db.refresh(candidate_interview)
-
-    # Update the candidate's status to the name of the current round
-    candidate = candidate_service.get_candidate_by_id(db, candidate_id)
-
-    if not candidate:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Candidate not found."
-        )
-
-    # Fetch the round name from the InterviewRounds table
-    interview_round = interview_rounds_service.get_interview_round_by_id(db, round_id)
-    if not interview_round:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Round ID not found in InterviewRounds table."
+    # Feedback and the status change are stored together or not at all
+    with unit_of_work(db):
+        # Create a new candidate interview entry
+        candidate_interview = candidate_interviews_service.create_candidate_interview(
+            db=db,
+            candidate_interview_in=candidate_interview_in
         )
-    print(f"The value from db is : {interview_round.round_name}")
-    round_name = interview_round.round_name
 
-    candidate.status = round_name
-    db.add(candidate)
-    db.commit()
-    db.refresh(candidate)
+        # Update the candidate's status to the name of the current round
+        candidate = candidate_service.get_candidate_by_id(db, candidate_id)
+
+        if not candidate:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Candidate not found."
+            )
+
+        # Fetch the round name from the InterviewRounds table
+        interview_round = interview_rounds_service.get_interview_round_by_id(db, round_id)
+        if not interview_round:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Round ID not found in InterviewRounds table."
+            )
+        print(f"The value from db is : {interview_round.round_name}")
+        round_name = interview_round.round_name
+
+        candidate.status = round_name
+        save(db, candidate)
 
     return {"message": "Feedback saved successfully."}
\ No newline at end of file
@@ -1,122 +1,100 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.db.pagination import page_items
 from app.schemas.college import College, CollegeCreate, CollegeUpdate
+from app.schemas.college_campaign import CollegeCampaign, CollegeCampaignCreate
 from app.services.college_service import college_service
-from app.services.email_service import email_service
+from app.services.college_campaign_service import college_campaign_service
+from app.services.email_outbox_service import email_outbox_service
+from app.services.email_templates import COLLEGE_INVITATION_SUBJECT, render_college_invitation
 
 router = APIRouter()
 
 @router.get("/", response_model=List[College])
 def read_colleges(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None
 ) -> Any:
     """
-    Retrieve all colleges with pagination.
+    Retrieve colleges one page at a time. The cursor for the next page is
+    returned in the X-Next-Cursor header; the header is absent on the last page.
+
+    Narrow the list with repeated filter=field:operator:value parameters and
+    order it with sort=field[,-field]; see COLLEGE_FILTERS for the allowed fields.
     """
-    return college_service.get_colleges(db, skip=skip, limit=limit)
+    page = college_service.get_colleges(
+        db, cursor=cursor, limit=limit, filters=filters, sort=sort
+    )
+    return page_items(response, page)
 
 @router.post("/", response_model=College, status_code=status.HTTP_201_CREATED)
 async def create_college(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db, scope="function"),
     college_in: CollegeCreate
 ) -> Any:
     """
     Create a new college and send an email to the college.
     """
-    db_college = college_service.get_college_by_email(db, email=college_in.email)
+    db_college = await college_service.get_college_by_email_async(db, email=college_in.email)
     if db_college:
         raise HTTPException(
             status_code=400,
             detail="A college with this email already exists."
         )
 
-    try:
-        # Create the college in the database
-        new_college = college_service.create_college(db=db, college_in=college_in)
-
-        # Send email to the college
-        email_body = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .greeting {{ margin-bottom: 20px; }}
-                .content {{ margin-bottom: 15px; }}
-                ul {{ margin: 15px 0; padding-left: 25px; }}
-                li {{ margin: 8px 0; }}
-                .signature {{ margin-top: 30px; }}
-                .signature p {{ margin: 5px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="greeting">
-                    <p>Dear {college_in.college_name},</p>
-                </div>
-                
-                <div class="content">
-                    <p>Greetings from <strong>Wissen Technology</strong>.</p>
-                </div>
-                
-                <div class="content">
-                    <p>We are planning to conduct a recruitment drive and would like to invite your institution to participate in our hiring process.</p>
-                </div>
-                
-                <div class="content">
-                    <p>To proceed, we request the placement team to sign up on our hiring portal: <strong>WWW.wissen.com</strong>. Once registered, you will be able to:</p>
-                    <ul>
-                        <li>Shortlist 100 eligible students as per your internal criteria</li>
-                        <li>Upload the resumes of the shortlisted students on our portal</li>
-                        <li>Enable us to schedule and conduct interviews for the selected candidates</li>
-                    </ul>
-                </div>
-                
-                <div class="content">
-                    <p>After the resumes are uploaded, our hiring team will review the profiles and share the next steps regarding interview timelines.</p>
-                </div>
-                
-                <div class="content">
-                    <p>For any queries or assistance, please feel free to reach out to us at <strong>www.wissen.com</strong>.</p>
-                </div>
-                
-                <div class="content">
-                    <p>We look forward to collaborating with your institution.</p>
-                </div>
-                
-                <div class="signature">
-                    <p>Warm regards,</p>
-                    <p><strong>Abhay</strong><br>
-                    Senior Software Engineer<br>
-                    Wissen Technology<br>
-                    +91 0000000</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
+    # The invitation is queued in the same transaction as the college insert
+    # and delivered by the outbox dispatcher, so a slow or failing Graph call
+    # never delays or loses it.
+    email_outbox_service.enqueue(
+        db,
+        email_to=[college_in.email],
+        subject=COLLEGE_INVITATION_SUBJECT,
+        html_content=render_college_invitation(college_in.college_name)
+    )
+    new_college = await college_service.create_college_async(db=db, college_in=college_in)
 
-        await email_service.send_email(
-            email_to=[college_in.email],
-            subject="Invitation to Participate in Recruitment Drive",
-            html_content=email_body
-        )
+    return new_college
 
-    except Exception as e:
-        print(f"Warning: Failed to send email: {str(e)}")
+@router.post("/campaigns", response_model=CollegeCampaign, status_code=status.HTTP_201_CREATED)
+def create_college_campaign(
+    *,
+    db: Session = Depends(deps.get_db, scope="function"),
+    campaign_in: CollegeCampaignCreate
+) -> Any:
+    """
+    Import colleges in bulk and invite them at a controlled send rate.
+    """
+    db_campaign = college_campaign_service.create_campaign(db, campaign_in)
+    return college_campaign_service.build_report(db_campaign)
 
-    return new_college
+@router.get("/campaigns/{campaign_id}", response_model=CollegeCampaign)
+def read_college_campaign(
+    campaign_id: int,
+    db: Session = Depends(deps.get_db, scope="function")
+) -> Any:
+    """
+    Get the per-college delivery state of a campaign.
+    """
+    db_campaign = college_campaign_service.get_campaign(db, campaign_id)
+    if not db_campaign:
+        raise HTTPException(
+            status_code=404,
+            detail="Campaign not found"
+        )
+    return college_campaign_service.build_report(db_campaign)
 
 @router.get("/{college_id}", response_model=College)
 def read_college(
     college_id: int,
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Retrieve a specific college by ID.
@@ -133,7 +111,7 @@ def read_college(
 def update_college(
     college_id: int,
     college_in: CollegeUpdate,
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Update a college.
@@ -149,7 +127,7 @@ def update_college(
 @router.delete("/{college_id}", response_model=College)
 def delete_college(
     college_id: int,
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Delete a college.
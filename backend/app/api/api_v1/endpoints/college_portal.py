@@ -1,6 +1,9 @@
-from typing import Any, List
+from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import os
 import shutil
@@ -8,7 +11,7 @@ from datetime import datetime
 import uuid
 from pathlib import Path
 from app.services.text_extract import pdf_extraction_service
-from app.services.user_service import get_college_id_by_user_id
+from app.services.user_service import get_college_id_by_user_id, get_college_id_by_user_id_async
 
 from app import models
 from app.schemas.college_portal import (
@@ -19,6 +22,7 @@ from app.schemas.college_portal import (
     StudentResume as ResumeSchema
 )
 from app.api import deps
+from app.db.pagination import page_items, paginate
 from app.models.college_portal import CollegeStudent, UploadedFile, StudentResume
 
 router = APIRouter()
@@ -36,14 +40,28 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(RESUMES_DIR, exist_ok=True)
 
 
+def _save_upload(file: UploadFile, file_path: str) -> int:
+    """Copy an uploaded file to disk and return its size in bytes."""
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer)
+    return os.path.getsize(file_path)
+
+
 # --- Student Endpoints ---
 
 @router.get("/students", response_model=List[StudentSchema])
-def get_students(db: Session = Depends(deps.get_db)) -> Any:
-    return db.query(CollegeStudent).order_by(CollegeStudent.created_at.asc()).all()
+def get_students(
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Any:
+    # id follows insertion order, so this is the created_at order served from the PK index
+    page = paginate(db.query(CollegeStudent), [CollegeStudent.id], cursor, limit)
+    return page_items(response, page)
 
 @router.get("/students/{id}", response_model=StudentSchema)
-def get_student(id: int, db: Session = Depends(deps.get_db)) -> Any:
+def get_student(id: int, db: Session = Depends(deps.get_db, scope="function")) -> Any:
     student = db.query(CollegeStudent).filter(CollegeStudent.id == id).first()
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
@@ -52,7 +70,7 @@ def get_student(id: int, db: Session = Depends(deps.get_db)) -> Any:
 @router.post("/students", response_model=StudentSchema)
 def create_student(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     student_in: StudentCreate
 ) -> Any:
     # Check if student with roll number or email already exists
@@ -75,7 +93,7 @@ def create_student(
 @router.put("/students/{id}", response_model=StudentSchema)
 def update_student(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     id: int,
     student_in: StudentUpdate
 ) -> Any:
@@ -95,7 +113,7 @@ def update_student(
 @router.delete("/students/{id}")
 def delete_student(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     id: int
 ) -> Any:
     db_student = db.query(CollegeStudent).filter(CollegeStudent.id == id).first()
@@ -114,10 +132,10 @@ def delete_student(
 async def upload_files(
     candidateId: int = Form(...),
     files: List[UploadFile] = File(...),
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db, scope="function")
 ) -> Any:
     # Verify candidate exists
-    candidate = db.query(models.Candidate).filter(models.Candidate.id == candidateId).first()
+    candidate = await db.scalar(select(models.Candidate).where(models.Candidate.id == candidateId))
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
 
@@ -130,12 +148,8 @@ async def upload_files(
         unique_filename = f"offer-letter-{uuid.uuid4().hex}{file_ext}"
         file_path = os.path.join(UPLOAD_DIR, unique_filename)
 
-        # Save file to disk
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        # Get file size
-        file_size = os.path.getsize(file_path)
+        # Save file to disk and get its size
+        file_size = await run_in_threadpool(_save_upload, file, file_path)
 
         # Save to database
         db_file = UploadedFile(
@@ -145,8 +159,8 @@ async def upload_files(
             file_size=file_size
         )
         db.add(db_file)
-        db.commit()
-        db.refresh(db_file)
+        await db.commit()
+        await db.refresh(db_file)
 
         uploaded_files_data.append({
             "id": db_file.id,
@@ -167,10 +181,10 @@ async def upload_files(
 async def upload_resumes(
     user_id: int,
     resumes: List[UploadFile] = File(...),
-    db: Session = Depends(deps.get_db)
+    db: AsyncSession = Depends(deps.get_async_db, scope="function")
 ) -> Any:
     # Get the college_id using the user_id
-    college_id = get_college_id_by_user_id(db, user_id)
+    college_id = await get_college_id_by_user_id_async(db, user_id)
     if not college_id:
         raise HTTPException(status_code=404, detail="College ID not found for the user")
 
@@ -183,10 +197,7 @@ async def upload_resumes(
         unique_filename = f"resume-{uuid.uuid4().hex}{file_ext}"
         file_path = os.path.join(RESUMES_DIR, unique_filename)
 
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        file_size = os.path.getsize(file_path)
+        file_size = await run_in_threadpool(_save_upload, file, file_path)
 
         db_resume = StudentResume(
             file_name=file.filename,
@@ -195,8 +206,8 @@ async def upload_resumes(
             college_id = college_id
         )
         db.add(db_resume)
-        db.commit()
-        db.refresh(db_resume)
+        await db.commit()
+        await db.refresh(db_resume)
 
         uploaded_resumes_data.append({
             "id": db_resume.id,
@@ -206,7 +217,8 @@ async def upload_resumes(
             "college_id": college_id
         })
 
-        results = pdf_extraction_service.extract_and_process_resumes(college_id)
+        # PDF parsing and the LLM calls are blocking; run them in the threadpool
+        results = await run_in_threadpool(pdf_extraction_service.extract_and_process_resumes, college_id)
 
     return {
         "message": f"{len(uploaded_resumes_data)} resume(s) uploaded successfully",
@@ -216,16 +228,28 @@ async def upload_resumes(
 # --- Management Endpoints ---
 
 @router.get("/resumes/{user_id}", response_model=List[ResumeSchema])
-def get_resumes(user_id:int , db: Session = Depends(deps.get_db)) -> Any:
+def get_resumes(
+    user_id: int,
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Any:
 
     college_id = get_college_id_by_user_id(db, user_id)
     if not college_id:
         raise HTTPException(status_code=404, detail="College ID not found for the user")
 
-    return db.query(StudentResume).filter(StudentResume.college_id == college_id).order_by(StudentResume.uploaded_at.desc()).all()
+    page = paginate(
+        db.query(StudentResume).filter(StudentResume.college_id == college_id),
+        [StudentResume.uploaded_at.desc(), StudentResume.id.desc()],
+        cursor,
+        limit
+    )
+    return page_items(response, page)
 
 @router.delete("/resumes/{resume_id}")
-def delete_resume(resume_id: int, db: Session = Depends(deps.get_db)) -> Any:
+def delete_resume(resume_id: int, db: Session = Depends(deps.get_db, scope="function")) -> Any:
     db_resume = db.query(StudentResume).filter(StudentResume.id == resume_id).first()
     if not db_resume:
         raise HTTPException(status_code=404, detail="Resume not found")
@@ -241,15 +265,26 @@ def delete_resume(resume_id: int, db: Session = Depends(deps.get_db)) -> Any:
     return {"message": "Resume deleted successfully"}
 
 @router.get("/uploads", response_model=List[FileSchema])
-def get_all_uploads(db: Session = Depends(deps.get_db)) -> Any:
-    return db.query(UploadedFile).order_by(UploadedFile.uploaded_at.desc()).all()
+def get_all_uploads(
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Any:
+    page = paginate(
+        db.query(UploadedFile),
+        [UploadedFile.uploaded_at.desc(), UploadedFile.id.desc()],
+        cursor,
+        limit
+    )
+    return page_items(response, page)
 
 @router.get("/uploads/student/{candidateId}", response_model=List[FileSchema])
-def get_student_uploads(candidateId: int, db: Session = Depends(deps.get_db)) -> Any:
+def get_student_uploads(candidateId: int, db: Session = Depends(deps.get_db, scope="function")) -> Any:
     return db.query(UploadedFile).filter(UploadedFile.student_id == candidateId).order_by(UploadedFile.uploaded_at.desc()).all()
 
 @router.get("/uploads/download/{id}")
-def download_file(id: int, db: Session = Depends(deps.get_db)):
+def download_file(id: int, db: Session = Depends(deps.get_db, scope="function")):
     db_file = db.query(UploadedFile).filter(UploadedFile.id == id).first()
     if not db_file:
         raise HTTPException(status_code=404, detail="File not found")
@@ -264,7 +299,7 @@ def download_file(id: int, db: Session = Depends(deps.get_db)):
     )
 
 @router.delete("/uploads/{id}")
-def delete_upload(id: int, db: Session = Depends(deps.get_db)):
+def delete_upload(id: int, db: Session = Depends(deps.get_db, scope="function")):
     db_file = db.query(UploadedFile).filter(UploadedFile.id == id).first()
     if not db_file:
         raise HTTPException(status_code=404, detail="Upload not found")
@@ -0,0 +1,55 @@
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.db.pagination import page_items
+from app.models.email_outbox import OutboxStatus
+from app.schemas.email_outbox import EmailOutbox
+from app.services.email_outbox_service import email_outbox_service
+
+router = APIRouter()
+
+
+@router.get("/dead", response_model=List[EmailOutbox])
+def read_dead_letters(
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100
+) -> Any:
+    """
+    Retrieve emails that exhausted their delivery attempts, one page at a
+    time (next page cursor in the X-Next-Cursor header).
+    """
+    page = email_outbox_service.get_dead_letters(db, cursor=cursor, limit=limit)
+    return page_items(response, page)
+
+
+@router.get("/{message_id}", response_model=EmailOutbox)
+def read_outbox_message(
+    message_id: int,
+    db: Session = Depends(deps.get_db, scope="function")
+) -> Any:
+    """
+    Get the delivery state of a queued email.
+    """
+    db_message = email_outbox_service.get_message_by_id(db, message_id)
+    if not db_message:
+        raise HTTPException(status_code=404, detail="Outbox message not found")
+    return db_message
+
+
+@router.post("/{message_id}/retry", response_model=EmailOutbox)
+def retry_dead_letter(
+    message_id: int,
+    db: Session = Depends(deps.get_db, scope="function")
+) -> Any:
+    """
+    Put a dead-lettered email back in the queue.
+    """
+    db_message = email_outbox_service.get_message_by_id(db, message_id)
+    if not db_message:
+        raise HTTPException(status_code=404, detail="Outbox message not found")
+    if db_message.status != OutboxStatus.DEAD:
+        raise HTTPException(status_code=400, detail="Only dead-lettered messages can be retried")
+    return email_outbox_service.requeue(db, db_message)
@@ -0,0 +1,66 @@
+import asyncio
+import time
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
+from sqlalchemy import select
+from app.db.session import AsyncSessionLocal
+from app.models.user import User
+from app.services.event_hub import Subscriber, event_hub
+from app.services.user_service import decode_access_token
+
+router = APIRouter()
+
+
+async def _authenticate(token: str):
+    """The active user behind an access token, or None."""
+    try:
+        payload = decode_access_token(token)
+    except ValueError:
+        return None, None
+    async with AsyncSessionLocal() as db:
+        user = await db.scalar(select(User).where(User.email == payload.get("sub")))
+    if user is None or not user.is_active:
+        return None, None
+    return user, payload.get("exp")
+
+
+@router.websocket("/ws")
+async def events_socket(websocket: WebSocket, token: str):
+    """
+    Push channel for task, assignment, candidate and interview changes.
+
+    Browsers cannot set headers on a WebSocket, so the access token comes as
+    ?token=. Each message is one event; {"type": "resync"} means events were
+    missed and the client should refetch. The socket is closed when the
+    token expires, and the client reconnects with a fresh one.
+    """
+    user, expires_at = await _authenticate(token)
+    if user is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscriber = event_hub.subscribe(Subscriber(user.role, user.intern_id, user.college_id))
+
+    async def send_events():
+        while True:
+            await websocket.send_json(await subscriber.queue.get())
+
+    async def wait_for_disconnect():
+        # Clients do not send anything; receiving only notices them leaving
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+
+    tasks = {asyncio.create_task(send_events()), asyncio.create_task(wait_for_disconnect())}
+    # exp is a Unix timestamp; compare it with the epoch clock, not a naive UTC datetime
+    timeout = max(expires_at - time.time(), 0) if expires_at else None
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if not done:
+            await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Token expired")
+    finally:
+        for task in tasks:
+            task.cancel()
+        event_hub.unsubscribe(subscriber)
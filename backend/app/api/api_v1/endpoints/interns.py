@@ -1,76 +1,97 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.api import deps
+from app.db.pagination import page_items
 from app.schemas.intern import Intern, InternCreate, InternUpdate
 from app.services.intern_service import intern_service
 from app.services.document_service import generate_internship_letter,generate_offer_letter
 from datetime import date, datetime
-from app.services.email_service import email_service
+from app.services.email_outbox_service import email_outbox_service
+from app.core.logger import logger
 router = APIRouter()
 
 @router.get("/", response_model=List[Intern])
 def read_interns(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None
 ) -> Any:
     """
-    Retrieve all interns with pagination.
+    Retrieve interns one page at a time. The cursor for the next page is
+    returned in the X-Next-Cursor header; the header is absent on the last page.
+
+    Narrow the list with repeated filter=field:operator:value parameters and
+    order it with sort=field[,-field]; see INTERN_FILTERS for the allowed fields.
     """
-    return intern_service.get_interns(db, skip=skip, limit=limit)
+    page = intern_service.get_interns(
+        db, cursor=cursor, limit=limit, filters=filters, sort=sort
+    )
+    return page_items(response, page)
 
 @router.post("/", response_model=Intern, status_code=status.HTTP_201_CREATED)
 async def create_intern(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db, scope="function"),
     intern_in: InternCreate
 ) -> Any:
     """
     Create a new intern during onboarding.
     """
-    db_intern = intern_service.get_intern_by_email(db, email=intern_in.email)
+    db_intern = await intern_service.get_intern_by_email_async(db, email=intern_in.email)
     if db_intern:
         raise HTTPException(
             status_code=400,
             detail="An intern with this email already exists in the system."
         )
-    created_intern =  intern_service.create_intern(db=db, intern_in=intern_in)
 
     intern_data = {
-         "full_name": created_intern.full_name,
-         "email":intern_in.email,
-        "gender": created_intern.gender,
-        "address": created_intern.address,
-        "start_date": created_intern.start_date,
-        "end_date": created_intern.end_date,
-        "deadline_date": date.today() ,
-        "salary": created_intern.salary or "25,000",
-        "job_position": created_intern.job_position,
+        "full_name": intern_in.full_name,
+        "email": intern_in.email,
+        "gender": intern_in.gender,
+        "address": intern_in.address,
+        "start_date": intern_in.start_date,
+        "end_date": intern_in.end_date,
+        "deadline_date": date.today(),
+        "salary": intern_in.salary or "25,000",
+        "job_position": intern_in.job_position,
     }
 
     try:
-        generate_offer = generate_offer_letter(intern_data)
-        generate_internship = generate_internship_letter(intern_data)
+        # Rendering the .docx letters is blocking file work; keep it off the event loop
+        generate_offer = await run_in_threadpool(generate_offer_letter, intern_data)
+        generate_internship = await run_in_threadpool(generate_internship_letter, intern_data)
 
-        await email_service.send_email(
+        # Queued in the same transaction as the intern insert below and
+        # delivered by the outbox dispatcher
+        email_outbox_service.enqueue(
+            db,
             email_to=[intern_in.email],
             subject=f"Offer letter for {intern_in.full_name}",
             html_content=f"<p>Dear {intern_in.full_name},</p><p>Please find attached your offer and internship letters.</p>",
             attachments=[generate_offer, generate_internship]
         )
-    
-    except Exception as e :
-        print(f"Warning: Failed to generate document or send email: {str(e)}")
-
-
+    except Exception as e:
+        # Without the outbox row the onboarding email would never be sent;
+        # create the intern only together with it
+        logger.error(f"Failed to generate onboarding documents for {intern_in.email}: {str(e)}")
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Could not prepare the onboarding documents; the intern was not created."
+        )
 
-    return created_intern
+    return await intern_service.create_intern_async(db=db, intern_in=intern_in)
 
 @router.get("/{intern_id}", response_model=Intern)
 def read_intern_by_id(
     intern_id: int,
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Get a specific intern by ID.
@@ -86,7 +107,7 @@ def read_intern_by_id(
 @router.put("/{intern_id}", response_model=Intern)
 def update_intern(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     intern_id: int,
     intern_in: InternUpdate
 ) -> Any:
@@ -104,7 +125,7 @@ def update_intern(
 @router.delete("/{intern_id}", response_model=Intern)
 def delete_intern(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     intern_id: int
 ) -> Any:
     """
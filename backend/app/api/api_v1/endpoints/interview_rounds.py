@@ -1,8 +1,9 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.db.pagination import page_items
 from app.schemas.interview_rounds import InterviewRounds, InterviewRoundsCreate, InterviewRoundsUpdate
 from app.services.interview_rounds_service import interview_rounds_service
 
@@ -11,20 +12,23 @@ router = APIRouter()
 
 @router.get("/", response_model=List[InterviewRounds])
 def read_interview_rounds(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
+    response: Response,
+    db: Session = Depends(deps.get_db, scope="function"),
+    cursor: Optional[str] = None,
     limit: int = 100
 ) -> Any:
     """
-    Retrieve all interview rounds with pagination.
+    Retrieve interview rounds one page at a time. The cursor for the next page is
+    returned in the X-Next-Cursor header; the header is absent on the last page.
     """
-    return interview_rounds_service.get_interview_rounds(db, skip=skip, limit=limit)
+    page = interview_rounds_service.get_interview_rounds(db, cursor=cursor, limit=limit)
+    return page_items(response, page)
 
 
 @router.post("/", response_model=InterviewRounds, status_code=status.HTTP_201_CREATED)
 def create_interview_round(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     interview_round_in: InterviewRoundsCreate
 ) -> Any:
     """
@@ -38,7 +42,7 @@ def create_interview_round(
 @router.get("/{interview_round_id}", response_model=InterviewRounds)
 def read_interview_round_by_id(
     interview_round_id: int,
-    db: Session = Depends(deps.get_db)
+    db: Session = Depends(deps.get_db, scope="function")
 ) -> Any:
     """
     Get a specific interview round by ID.
@@ -57,7 +61,7 @@ def read_interview_round_by_id(
 @router.put("/{interview_round_id}", response_model=InterviewRounds)
 def update_interview_round(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     interview_round_id: int,
     interview_round_in: InterviewRoundsUpdate
 ) -> Any:
@@ -83,7 +87,7 @@ def update_interview_round(
 @router.delete("/{interview_round_id}", response_model=InterviewRounds)
 def delete_interview_round(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_db, scope="function"),
     interview_round_id: int
 ) -> Any:
     """
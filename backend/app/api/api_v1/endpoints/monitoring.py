@@ -0,0 +1,26 @@
+from typing import Any, Dict, List
+from fastapi import APIRouter
+from app.db.pool_metrics import get_pool_snapshots
+from app.db.query_stats import route_query_metrics
+
+router = APIRouter()
+
+
+@router.get("/db-pool", response_model=List[Dict[str, Any]])
+def read_db_pool_metrics() -> Any:
+    """
+    Live connection pool metrics for every database engine: checked out
+    and overflow connections, pool timeouts and a checkout wait histogram
+    (cumulative counts per upper bound in milliseconds).
+    """
+    return get_pool_snapshots()
+
+
+@router.get("/db-queries", response_model=List[Dict[str, Any]])
+def read_db_query_metrics() -> Any:
+    """
+    Per-route query counts and database time since startup, heaviest
+    routes first. n_plus_one_warnings counts requests in which a single
+    statement repeated more than DB_N_PLUS_ONE_THRESHOLD times.
+    """
+    return route_query_metrics.snapshot()
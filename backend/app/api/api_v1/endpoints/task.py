@@ -1,39 +1,117 @@
-from fastapi import APIRouter, HTTPException, Depends
+import hashlib
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
-from app.services.task_service import create_task, get_task, get_tasks, update_task, delete_task
-from app.schemas.task import TaskCreate, TaskUpdate, Task
+from datetime import date
+from typing import List, Optional
+from app.services.task_service import (
+    create_task, create_tasks, get_task, get_tasks, get_tasks_by_ids, get_tasks_version, get_intern_tasks, move_task,
+    update_task, update_tasks_status, delete_task
+)
+from app.services.task_rank import needs_rebalance, rebalance_task_ranks
+from app.services.task_sync_service import SyncCursorExpiredError, get_task_changes
+from app.schemas.task import (
+    Task, TaskBulkAssign, TaskBulkAssignResult, TaskBulkCreate, TaskBulkStatus, TaskBulkStatusResult,
+    TaskChanges, TaskCreate, TaskMove, TaskUpdate,
+)
 from app.api.deps import get_db
-from app.services.task_assignment_service import create_task_assignment, get_task_assignment
+from app.db.pagination import NEXT_CURSOR_HEADER
+from app.db.session import use_primary
+from app.db.unit_of_work import save, unit_of_work
+from app.services.task_assignment_service import assign_tasks, create_task_assignment, get_task_assignment
 from app.schemas.task_assignment import TaskAssignmentCreate
-from app.models.taskAssignment import TaskAssignment
+from app.models.task import Task as TaskModel, TaskPriority, TaskStatus
+from app.models.intern import Intern
 from app.models.user import User  # Import User model
 
 router = APIRouter()
 
+_task_list = TypeAdapter(List[Task])
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
 @router.post("/tasks", response_model=Task)
-def create_new_task(task_data: TaskCreate, db: Session = Depends(get_db), user_id: int = 1):
+def create_new_task(
+    task_data: TaskCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db, scope="function"),
+    user_id: int = 1,
+):
     """Create a new task."""
-    task = create_task(db, task_data, user_id)
+    # The task and its assignment are committed together
+    with unit_of_work(db):
+        task = create_task(db, task_data, user_id)
 
-    # Convert the SQLAlchemy model instance to a dictionary
-    task_dict = task.__dict__.copy()
-    task_dict.pop("_sa_instance_state", None)  # Remove SQLAlchemy internal state
+        # Assign the task to the provided intern
+        if task_data.assigned_intern:
+            task_assignment = TaskAssignmentCreate(task_id=task.task_id, intern_id=task_data.assigned_intern)
+            create_task_assignment(db, task_assignment)
 
-    # Assign the task to the provided intern
-    assigned_intern = None
-    if task_data.assigned_intern:
-        task_assignment = TaskAssignmentCreate(task_id=task.task_id, intern_id=task_data.assigned_intern)
-        create_task_assignment(db, task_assignment)
-        assigned_intern = str(task_data.assigned_intern)
+    if needs_rebalance(task.rank):
+        background_tasks.add_task(rebalance_task_ranks)
 
-    # Add assignedIntern to the task response
-    task_dict["assignedIntern"] = assigned_intern
+    # assignedIntern comes from the assignment just committed (Task.assigned_intern)
+    return task
 
-    return Task(**task_dict)
+def _check_ids_exist(db: Session, column, ids, label: str) -> None:
+    """404 listing any ids that do not exist (one query), before a bulk write trips a foreign key."""
+    missing = set(ids) - set(db.scalars(select(column).where(column.in_(set(ids)))))
+    if missing:
+        raise HTTPException(status_code=404, detail=f"{label} not found: {sorted(missing)}")
+
+@router.post("/tasks/bulk", response_model=List[Task])
+def create_tasks_in_bulk(
+    bulk: TaskBulkCreate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db, scope="function"),
+    user_id: int = 1,
+):
+    """Create many tasks (and their assignments) in one transaction, appended in the given order."""
+    intern_ids = [task.assigned_intern for task in bulk.tasks if task.assigned_intern]
+    if intern_ids:
+        _check_ids_exist(db, Intern.id, intern_ids, "Interns")
+
+    with unit_of_work(db):
+        tasks = create_tasks(db, bulk.tasks, user_id)
+
+    if needs_rebalance(tasks[-1].rank):
+        background_tasks.add_task(rebalance_task_ranks)
+    return tasks
+
+@router.post("/tasks/bulk/assign", response_model=TaskBulkAssignResult)
+def assign_tasks_in_bulk(bulk: TaskBulkAssign, db: Session = Depends(get_db, scope="function")):
+    """Assign every listed task to every listed intern in one statement."""
+    _check_ids_exist(db, TaskModel.task_id, bulk.task_ids, "Tasks")
+    _check_ids_exist(db, Intern.id, bulk.intern_ids, "Interns")
+    return {"assigned": assign_tasks(db, bulk.task_ids, bulk.intern_ids)}
+
+@router.put("/tasks/bulk/status", response_model=TaskBulkStatusResult)
+def update_status_in_bulk(bulk: TaskBulkStatus, db: Session = Depends(get_db, scope="function")):
+    """Move many tasks to one status in one statement; unknown ids are reported, not fatal."""
+    updated_ids = update_tasks_status(db, bulk.task_ids, bulk.status)
+    return {"updated_ids": updated_ids, "missing_ids": sorted(set(bulk.task_ids) - set(updated_ids))}
+
+@router.get("/tasks/changes", response_model=TaskChanges)
+def read_task_changes(cursor: Optional[str] = None, db: Session = Depends(get_db, scope="function")):
+    """
+    Tasks and assignments changed since `cursor`, plus deletions. Call it
+    without a cursor before the first full fetch to get one.
+    """
+    # A lagging replica would hand out cursors ahead of the data it has
+    use_primary(db)
+    try:
+        return get_task_changes(db, cursor)
+    except SyncCursorExpiredError as e:
+        raise HTTPException(status_code=410, detail=str(e))
 
 @router.get("/tasks/{task_id}", response_model=Task)
-def read_task(task_id: int, db: Session = Depends(get_db)):
+def read_task(task_id: int, db: Session = Depends(get_db, scope="function")):
     """Get a task by ID."""
     task = get_task(db, task_id)
     if not task:
@@ -41,36 +119,82 @@ def read_task(task_id: int, db: Session = Depends(get_db)):
     return task
 
 @router.get("/tasks", response_model=List[Task])
-def read_tasks(db: Session = Depends(get_db)):
-    """Get all tasks for the current user."""
-    tasks = get_tasks(db)
-
-    # Add assignedIntern field to each task as a string
-    tasks_with_interns = []
-    for task in tasks:
-        # Fetch task assignments for the current task
-        task_assignments = db.query(TaskAssignment).filter(TaskAssignment.task_id == task.task_id).all()
-        assigned_intern = str(task_assignments[0].intern_id) if task_assignments else None  # Get the first intern_id or None
-
-        # Convert task to dictionary and add assignedInterns field
-        task_dict = task.__dict__.copy()
-        task_dict.pop("_sa_instance_state", None)  # Remove SQLAlchemy internal state
-        task_dict["assignedIntern"] = assigned_intern  # Add assignedInterns field
-
-        tasks_with_interns.append(task_dict)
-
-    return tasks_with_interns
+def read_tasks(
+    request: Request,
+    db: Session = Depends(get_db, scope="function"),
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: List[str] = Query([], alias="filter"),
+    sort: Optional[str] = None,
+):
+    """
+    Get one page of tasks in board order (next page cursor in the X-Next-Cursor header).
+    Each page carries its own ETag, tied to the cursor, limit, filters and sort it was
+    requested with; send it back as If-None-Match to get 304 while the matching tasks are
+    unchanged. filter=field:operator:value (repeatable) and sort=field[,-field] take the
+    fields in TASK_FILTERS.
+    """
+    # Checked before the page is loaded, so a 304 costs one aggregate query
+    version = get_tasks_version(db, filters)
+    key = repr((version, cursor, limit, sorted(filters), sort)).encode()
+    etag = f'"{hashlib.sha256(key).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    # Assignees come with the tasks (Task.assignments is selectin-loaded)
+    page = get_tasks(db, cursor=cursor, limit=limit, filters=filters, sort=sort)
+    if page.next_cursor:
+        headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    body = _task_list.dump_json(_task_list.validate_python(page.items, from_attributes=True))
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.put("/tasks/{task_id}", response_model=Task)
-def update_existing_task(task_id: int, task_data: TaskUpdate, db: Session = Depends(get_db)):
+def update_existing_task(task_id: int, task_data: TaskUpdate, db: Session = Depends(get_db, scope="function")):
     """Update an existing task."""
     task = update_task(db, task_id, task_data)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     return task
 
+@router.post("/tasks/{task_id}/move", response_model=Task)
+def move_existing_task(
+    task_id: int,
+    move: TaskMove,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db, scope="function"),
+):
+    """Move a task between two others on the board, writing only the moved task."""
+    if task_id in (move.before_id, move.after_id):
+        raise HTTPException(status_code=400, detail="A task cannot be moved next to itself")
+
+    neighbour_ids = [id for id in (move.before_id, move.after_id) if id is not None]
+    tasks = {task.task_id: task for task in get_tasks_by_ids(db, [task_id, *neighbour_ids])}
+    for id in (task_id, *neighbour_ids):
+        if id not in tasks:
+            raise HTTPException(status_code=404, detail=f"Task {id} not found")
+
+    try:
+        task = move_task(
+            db, tasks[task_id], tasks.get(move.before_id), tasks.get(move.after_id), move.status
+        )
+    except ValueError:
+        # Tasks created concurrently can share a rank; respace after
+        # answering so a retry works. A raised HTTPException would drop
+        # background tasks, hence the explicit response.
+        background_tasks.add_task(rebalance_task_ranks)
+        return JSONResponse(
+            status_code=409,
+            content={"detail": "Board order has changed, reload and retry"},
+            background=background_tasks,
+        )
+
+    if needs_rebalance(task.rank):
+        background_tasks.add_task(rebalance_task_ranks)
+    return task
+
 @router.delete("/tasks/{task_id}")
-def delete_existing_task(task_id: int, db: Session = Depends(get_db)):
+def delete_existing_task(task_id: int, db: Session = Depends(get_db, scope="function")):
     """Delete a task by ID."""
     success = delete_task(db, task_id)
     if not success:
@@ -78,55 +202,52 @@ def delete_existing_task(task_id: int, db: Session = Depends(get_db)):
     return {"message": "Task deleted successfully"}
 
 @router.put("/tasks/{task_id}/status")
-def update_task_status(task_id: int, status: str, db: Session = Depends(get_db))->str:
+def update_task_status(task_id: int, status: TaskStatus, db: Session = Depends(get_db, scope="function"))->str:
     """Update the status of a task."""
     task = get_task(db, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
 
     task.status = status
-    db.commit()
+    save(db, task)
     return "Success"
 
 @router.get("/tasks/intern/{id}", response_model=List[Task])
-def get_tasks_by_intern(id: int, id_type: str = "intern", db: Session = Depends(get_db)):
-    """Get all tasks assigned to a specific intern.
+def get_tasks_by_intern(
+    id: int,
+    id_type: str = "intern",
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    due_after: Optional[date] = None,
+    due_before: Optional[date] = None,
+    db: Session = Depends(get_db, scope="function"),
+):
+    """Get all tasks assigned to a specific intern, in board order.
     
     Args:
         id: The ID value (either intern_id or user_id based on id_type)
         id_type: Either 'intern' or 'user' to specify the type of ID provided
+        status, priority: Only return tasks with this status / priority
+        due_after, due_before: Only return tasks due within these dates (inclusive)
         db: Database session
     """
-    intern_id = None
-    
-    # Determine the intern_id based on id_type
-    if id_type == "user":
-        # If user_id is provided, fetch intern_id from user table
-        user = db.query(User).filter(User.id == id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-        if not user.intern_id:
-            raise HTTPException(status_code=400, detail="User is not associated with an intern")
-        intern_id = user.intern_id
-    elif id_type == "intern":
-        # If intern_id is provided directly
-        intern_id = id
-    else:
+    if id_type not in ("intern", "user"):
         raise HTTPException(status_code=400, detail="Invalid id_type. Must be 'intern' or 'user'")
-    
-    # Fetch tasks for the intern
-    tasks = db.query(TaskAssignment).filter(TaskAssignment.intern_id == intern_id).all()
+
+    # One joined query resolves user -> intern -> assignments -> tasks
+    ids = {"user_id": id} if id_type == "user" else {"intern_id": id}
+    tasks = get_intern_tasks(
+        db, status=status, priority=priority, due_after=due_after, due_before=due_before, **ids
+    )
 
     if not tasks:
+        # Only an empty result needs the user looked up, to explain why
+        if id_type == "user":
+            user = db.query(User).filter(User.id == id).first()
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+            if not user.intern_id:
+                raise HTTPException(status_code=400, detail="User is not associated with an intern")
         raise HTTPException(status_code=404, detail="No tasks found for the given intern ID")
 
-    tasks_with_details = []
-    for task_assignment in tasks:
-        task = get_task(db, task_assignment.task_id)
-        if task:
-            task_dict = task.__dict__.copy()
-            task_dict.pop("_sa_instance_state", None)  # Remove SQLAlchemy internal state
-            task_dict["assignedIntern"] = str(intern_id)
-            tasks_with_details.append(task_dict)
-
-    return tasks_with_details
\ No newline at end of file
+    return tasks
@@ -14,13 +14,13 @@ router = APIRouter()
 
 @router.post("/task-assignments/", response_model=TaskAssignmentBase)
 def create_task_assignment_endpoint(
-    task_assignment: TaskAssignmentCreate, db: Session = Depends(get_db)
+    task_assignment: TaskAssignmentCreate, db: Session = Depends(get_db, scope="function")
 ):
     return create_task_assignment(db, task_assignment)
 
 @router.get("/task-assignments/{task_id}/{intern_id}", response_model=TaskAssignmentBase)
 def get_task_assignment_endpoint(
-    task_id: int, intern_id: int, db: Session = Depends(get_db)
+    task_id: int, intern_id: int, db: Session = Depends(get_db, scope="function")
 ):
     task_assignment = get_task_assignment(db, task_id, intern_id)
     if not task_assignment:
@@ -32,7 +32,7 @@ def update_task_assignment_endpoint(
     task_id: int,
     intern_id: int,
     task_assignment_update: TaskAssignmentUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
 ):
     updated_task_assignment = update_task_assignment(db, task_id, intern_id, task_assignment_update)
     if not updated_task_assignment:
@@ -41,7 +41,7 @@ def update_task_assignment_endpoint(
 
 @router.delete("/task-assignments/{task_id}/{intern_id}", response_model=TaskAssignmentBase)
 def delete_task_assignment_endpoint(
-    task_id: int, intern_id: int, db: Session = Depends(get_db)
+    task_id: int, intern_id: int, db: Session = Depends(get_db, scope="function")
 ):
     deleted_task_assignment = delete_task_assignment(db, task_id, intern_id)
     if not deleted_task_assignment:
@@ -4,10 +4,9 @@ from app.services.user_service import create_access_token, decode_access_token,
 from app.models.user import User
 from app.models.intern import Intern  # Import Intern model
 from app.models.college import College  # Import College model
-from app.db.session import SessionLocal
+from app.api.deps import get_db
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-from typing import Generator
 from app.models.user import UserRole  # Import UserRole enum
 
 router = APIRouter()
@@ -33,15 +32,8 @@ class UserLogin(BaseModel):
     email: str
     password: str
 
-def get_db() -> Generator:
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
-
 @router.post("/register", response_model=Token)
-def register_user(user: UserCreate, db: Session = Depends(get_db)):
+def register_user(user: UserCreate, db: Session = Depends(get_db, scope="function")):
     """Endpoint to register a new user."""
     # Check if user already exists
     existing_user = db.query(User).filter(User.email == user.email).first()
@@ -101,7 +93,7 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
     }
 
 @router.post("/login", response_model=Token)
-def login_user(login_data: UserLogin, db: Session = Depends(get_db)):
+def login_user(login_data: UserLogin, db: Session = Depends(get_db, scope="function")):
     """Endpoint to login a user."""
     # Check if user exists
     user = db.query(User).filter(User.email == login_data.email).first()
@@ -1,9 +1,27 @@
-from typing import Generator
-from app.db.session import SessionLocal
+from typing import AsyncGenerator, Generator
+from fastapi import Request
+from app.db.session import AsyncSessionLocal, SessionLocal, use_primary
 
-def get_db() -> Generator:
+# Requests with these methods may read from a replica; any other request
+# runs entirely on the primary so its validation reads are never stale.
+READ_ONLY_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Declare these with Depends(..., scope="function"): the session is then
+# closed, and its connection returned to the pool, as soon as the handler
+# returns instead of after the response has been serialized and sent.
+
+def get_db(request: Request) -> Generator:
+    # A Session checks out a connection only when its first statement runs
+    db = SessionLocal()
+    if request.method not in READ_ONLY_METHODS:
+        use_primary(db)
     try:
-        db = SessionLocal()
         yield db
     finally:
         db.close()
+
+async def get_async_db(request: Request) -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        if request.method not in READ_ONLY_METHODS:
+            use_primary(db)
+        yield db
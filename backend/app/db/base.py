@@ -1,9 +1,17 @@
+# Import all the models, so that Base has them before being
+# imported by Alembic
 from app.db.base_class import Base  # noqa
 
 from app.models.user import User  # noqa
 from app.models.task import Task  # noqa
+from app.models.taskAssignment import TaskAssignment  # noqa
+from app.models.tombstone import Tombstone  # noqa
 from app.models.intern import Intern  # noqa
 from app.models.candidate import Candidate  # noqa
-from app.models.college import College
-from app.models.college import College
-from app.models.college_portal import CollegeStudent, UploadedFile, StudentResume
\ No newline at end of file
+from app.models.skill import Skill, SkillAlias, CandidateSkill  # noqa
+from app.models.candidate_interviews import CandidateInterviews  # noqa
+from app.models.interviewRounds import InterviewRounds  # noqa
+from app.models.college import College  # noqa
+from app.models.college_portal import CollegeStudent, UploadedFile, StudentResume  # noqa
+from app.models.email_outbox import EmailOutbox  # noqa
+from app.models.college_campaign import CollegeCampaign, CollegeCampaignRecipient  # noqa
@@ -5,6 +5,10 @@ class Base(DeclarativeBase):
     id: Any
     __name__: str
 
+    # Fetch server-generated values in the INSERT/UPDATE itself (RETURNING),
+    # so flushed objects are complete without a refresh per object
+    __mapper_args__ = {"eager_defaults": True}
+
     # Generate __tablename__ automatically
     @declared_attr
     def __tablename__(cls) -> str:
@@ -0,0 +1,145 @@
+"""
+Change events for real-time push.
+
+ORM writes to tasks, task assignments, candidates and interview feedback
+queue an event on the session; bulk Core statements queue theirs with
+publish(). Right before the transaction commits, the queued events are
+sent with pg_notify on the transaction's own connection. PostgreSQL only
+delivers notifications of committed transactions, in commit order, to
+every worker LISTENing on the channel (app/services/event_hub.py), which
+passes them on to its WebSocket subscribers.
+
+Events are small: what changed and who may see it. Clients fetch the
+data itself (e.g. through task delta sync).
+
+    {"type": "task", "action": "updated", "id": 12, "intern_ids": [3], "college_id": null}
+"""
+import json
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.candidate import Candidate
+from app.models.candidate_interviews import CandidateInterviews
+from app.models.task import Task
+from app.models.taskAssignment import TaskAssignment
+
+_PENDING = "pending_change_events"
+
+# NOTIFY payloads must stay under 8000 bytes; events are sent in JSON arrays of at most this size
+MAX_PAYLOAD_BYTES = 7000
+
+
+def publish(
+    db: Session,
+    type: str,
+    action: str,
+    id: Optional[int] = None,
+    intern_ids: Optional[List[int]] = None,
+    college_id: Optional[int] = None,
+    **extra: Any,
+) -> None:
+    """Queue an event, sent when the session's transaction commits."""
+    db.info.setdefault(_PENDING, []).append({
+        "type": type,
+        "action": action,
+        "id": id,
+        "intern_ids": intern_ids,
+        "college_id": college_id,
+        **extra,
+    })
+
+
+def _event_for(instance, action: str) -> Optional[Dict[str, Any]]:
+    if isinstance(instance, Task):
+        assignments = instance.__dict__.get("assignments")
+        intern_ids = None if assignments is None else [a.intern_id for a in assignments]
+        return {"type": "task", "action": action, "id": instance.task_id, "intern_ids": intern_ids}
+    if isinstance(instance, TaskAssignment):
+        return {
+            "type": "assignment", "action": action, "id": instance.task_id, "intern_ids": [instance.intern_id]
+        }
+    if isinstance(instance, Candidate):
+        return {"type": "candidate", "action": action, "id": instance.id, "college_id": instance.college_id}
+    if isinstance(instance, CandidateInterviews):
+        return {
+            "type": "interview", "action": action, "id": instance.id, "candidate_id": instance.candidate_id
+        }
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect(session, flush_context):
+    changes = (
+        (session.new, "created"),
+        ((obj for obj in session.dirty if session.is_modified(obj, include_collections=False)), "updated"),
+        (session.deleted, "deleted"),
+    )
+    for instances, action in changes:
+        for instance in instances:
+            change = _event_for(instance, action)
+            if change is not None:
+                publish(session, **change)
+
+
+def _resolve_scopes(session, events: List[Dict[str, Any]]) -> None:
+    """Fill in the audience the flush could not see, with one query per kind."""
+    task_ids = {e["id"] for e in events if e["type"] == "task" and e["intern_ids"] is None and e["id"]}
+    if task_ids:
+        interns: Dict[int, List[int]] = {}
+        rows = session.execute(
+            select(TaskAssignment.task_id, TaskAssignment.intern_id).where(TaskAssignment.task_id.in_(task_ids))
+        )
+        for task_id, intern_id in rows:
+            interns.setdefault(task_id, []).append(intern_id)
+        for e in events:
+            if e["type"] == "task" and e["intern_ids"] is None and e["id"] in task_ids:
+                e["intern_ids"] = interns.get(e["id"], [])
+
+    candidate_ids = {e["candidate_id"] for e in events if e["type"] == "interview" and e.get("college_id") is None}
+    if candidate_ids:
+        colleges = dict(session.execute(
+            select(Candidate.id, Candidate.college_id).where(Candidate.id.in_(candidate_ids))
+        ).all())
+        for e in events:
+            if e["type"] == "interview":
+                e["college_id"] = colleges.get(e["candidate_id"])
+
+
+def _payloads(events: Iterable[Dict[str, Any]]) -> List[str]:
+    payloads, batch, size = [], [], 2
+    for e in events:
+        encoded = json.dumps(e, separators=(",", ":"), default=str)
+        if batch and size + len(encoded) + 1 > MAX_PAYLOAD_BYTES:
+            payloads.append("[" + ",".join(batch) + "]")
+            batch, size = [], 2
+        batch.append(encoded)
+        size += len(encoded) + 1
+    if batch:
+        payloads.append("[" + ",".join(batch) + "]")
+    return payloads
+
+
+@event.listens_for(Session, "before_commit")
+def _notify(session):
+    if not settings.REALTIME_ENABLED:
+        session.info.pop(_PENDING, None)
+        return
+    # commit() flushes after this hook; flush now so that flush's events are included
+    session.flush()
+    events = session.info.pop(_PENDING, None)
+    if not events:
+        return
+    _resolve_scopes(session, events)
+    # Any write pinned the session to the primary, so this is the writing connection
+    connection = session.connection()
+    for payload in _payloads(events):
+        connection.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": settings.REALTIME_CHANNEL, "payload": payload},
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard(session):
+    session.info.pop(_PENDING, None)
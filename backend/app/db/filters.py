@@ -0,0 +1,161 @@
+"""
+Whitelisted filtering and sorting for list endpoints.
+
+Clients pass conditions as repeated `filter` query parameters of the form
+field:operator:value, and an optional comma-separated `sort`:
+
+    ?filter=status:eq:HIRED&filter=college_id:in:3,7&sort=-due_date
+
+Each endpoint declares a FilterSet naming the fields and operators it
+accepts. Conditions become WHERE clauses and the sort becomes the keyset
+order (see app/db/pagination.py), so filtering happens in SQL before the
+LIMIT and every page is complete. Only indexed columns may be filtered or
+sorted, and sort columns must be NOT NULL to serve as keyset keys;
+FilterSet checks this when the module defining it is imported.
+"""
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from sqlalchemy import types
+
+MAX_FILTERS = 10
+MAX_IN_VALUES = 100
+
+OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "in": lambda column, values: column.in_(values),
+}
+EQUALITY = ("eq", "ne", "in")
+ALL = tuple(OPERATORS)
+
+
+class InvalidFilterError(ValueError):
+    """Raised for a filter or sort the endpoint does not allow."""
+
+
+def _is_indexed(attribute) -> bool:
+    """True if the column leads some index (the primary key, its own or a composite one)."""
+    column = attribute.property.columns[0]
+    if column.primary_key or column.index or column.unique:
+        return True
+    return any(
+        next(iter(index.columns)) is column for index in column.table.indexes
+    )
+
+
+def _coerce(column, raw: str) -> Any:
+    column_type = column.type
+    if isinstance(column_type, types.Enum) and column_type.enum_class is not None:
+        enum_class = column_type.enum_class
+        if raw in enum_class.__members__:
+            return enum_class[raw]
+        return enum_class(raw)
+    if isinstance(column_type, types.Integer):
+        return int(raw)
+    if isinstance(column_type, types.DateTime):
+        return datetime.fromisoformat(raw)
+    if isinstance(column_type, types.Date):
+        return date.fromisoformat(raw)
+    if isinstance(column_type, types.Boolean):
+        if raw.lower() not in ("true", "false"):
+            raise ValueError("expected true or false")
+        return raw.lower() == "true"
+    return raw
+
+
+class FilterSet:
+    """
+    The filters and sort keys one list endpoint accepts.
+
+        FilterSet(
+            fields={"status": (Candidate.status, EQUALITY), "college_id": (Candidate.college_id, EQUALITY)},
+            sorts={"id": Candidate.id},
+            tiebreaker=Candidate.id,
+        )
+
+    The tiebreaker (normally the primary key) ends every sort, which keeps
+    the keyset order total.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Tuple[Any, Sequence[str]]],
+        sorts: Dict[str, Any],
+        tiebreaker,
+        default_sort: Optional[Sequence[Any]] = None,
+    ):
+        for name, (column, ops) in fields.items():
+            if not _is_indexed(column):
+                raise ValueError(f"Filter field '{name}' is not backed by an index")
+            unknown = set(ops) - set(OPERATORS)
+            if unknown:
+                raise ValueError(f"Filter field '{name}' has unknown operators {sorted(unknown)}")
+        for name, column in sorts.items():
+            if not _is_indexed(column):
+                raise ValueError(f"Sort field '{name}' is not backed by an index")
+            if column.nullable:
+                raise ValueError(f"Sort field '{name}' is nullable and cannot be a keyset key")
+        self.fields = fields
+        self.sorts = sorts
+        self.tiebreaker = tiebreaker
+        self.default_sort = list(default_sort or [tiebreaker])
+
+    def where(self, filters: Optional[Iterable[str]]) -> List[Any]:
+        """WHERE clauses for field:operator:value strings."""
+        filters = list(filters or [])
+        if len(filters) > MAX_FILTERS:
+            raise InvalidFilterError(f"At most {MAX_FILTERS} filters are allowed")
+        clauses = []
+        for condition in filters:
+            try:
+                name, op, raw = condition.split(":", 2)
+            except ValueError:
+                raise InvalidFilterError(f"Invalid filter '{condition}': expected field:operator:value")
+            if name not in self.fields:
+                raise InvalidFilterError(
+                    f"Cannot filter on '{name}'; allowed fields: {', '.join(sorted(self.fields))}"
+                )
+            column, ops = self.fields[name]
+            if op not in ops:
+                raise InvalidFilterError(
+                    f"Operator '{op}' is not allowed on '{name}'; allowed: {', '.join(ops)}"
+                )
+            try:
+                if op == "in":
+                    values = [_coerce(column, value) for value in raw.split(",") if value]
+                    if not values or len(values) > MAX_IN_VALUES:
+                        raise ValueError(f"expected 1 to {MAX_IN_VALUES} comma-separated values")
+                    clauses.append(OPERATORS[op](column, values))
+                else:
+                    clauses.append(OPERATORS[op](column, _coerce(column, raw)))
+            except (ValueError, KeyError) as e:
+                raise InvalidFilterError(f"Invalid value for filter '{condition}': {e}") from e
+        return clauses
+
+    def order_by(self, sort: Optional[str]) -> List[Any]:
+        """Keyset sort keys for a sort string like "-due_date,title"."""
+        if not sort:
+            return list(self.default_sort)
+        keys, has_tiebreaker = [], False
+        for name in sort.split(","):
+            name = name.strip()
+            descending = name.startswith("-")
+            name = name.lstrip("-+")
+            if name not in self.sorts:
+                raise InvalidFilterError(
+                    f"Cannot sort on '{name}'; allowed fields: {', '.join(sorted(self.sorts))}"
+                )
+            column = self.sorts[name]
+            has_tiebreaker = has_tiebreaker or column is self.tiebreaker
+            keys.append(column.desc() if descending else column)
+        if not has_tiebreaker:
+            keys.append(self.tiebreaker)
+        return keys
+
+    def apply(self, query, filters: Optional[Iterable[str]], sort: Optional[str]) -> Tuple[Any, List[Any]]:
+        """Filter a Query or Select; returns it with the sort keys to paginate on."""
+        return query.where(*self.where(filters)), self.order_by(sort)
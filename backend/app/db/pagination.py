@@ -0,0 +1,151 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are selected with a WHERE clause on the sort key instead of OFFSET,
+so every page costs one index range scan however deep the client goes.
+The cursor is an opaque token encoding the sort key of the last row served.
+
+Sort keys are given the way they would be passed to order_by, e.g.
+[Candidate.id] or [UploadedFile.uploaded_at.desc(), UploadedFile.id.desc()].
+The last key must be unique (normally the primary key) and the keys should
+be NOT NULL and covered by an index.
+"""
+import base64
+import enum
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+from sqlalchemy import and_, or_, types
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client sends a cursor this endpoint did not issue."""
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def _split_key(key) -> Tuple[Any, bool]:
+    """Return (column, descending) for an order_by expression."""
+    if isinstance(key, UnaryExpression) and key.modifier in (operators.desc_op, operators.asc_op):
+        return key.element, key.modifier is operators.desc_op
+    return key, False
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(column, value: Any) -> Any:
+    if value is None:
+        return None
+    column_type = column.type
+    if isinstance(column_type, types.Enum) and column_type.enum_class is not None:
+        return column_type.enum_class[value]
+    if isinstance(column_type, types.DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, types.Date):
+        return date.fromisoformat(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: Sequence[Any]) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(order_by):
+            raise ValueError("cursor does not match the sort keys")
+        return [_from_json(_split_key(key)[0], value) for key, value in zip(order_by, values)]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}") from e
+
+
+def _after(order_by: Sequence[Any], values: Sequence[Any]):
+    """
+    Rows strictly after `values` in the given order:
+    (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...  (< for descending keys)
+    """
+    clauses = []
+    for i, key in enumerate(order_by):
+        column, descending = _split_key(key)
+        equal_prefix = [
+            _split_key(prefix_key)[0] == values[j] for j, prefix_key in enumerate(order_by[:i])
+        ]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal_prefix, step))
+    return or_(*clauses)
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def keyset(query, order_by: Sequence[Any], cursor: Optional[str], limit: int):
+    """
+    Apply ordering, the cursor condition and limit + 1 (to detect a next
+    page) to a Query or a Select.
+    """
+    query = query.order_by(*order_by)
+    if cursor:
+        query = query.where(_after(order_by, decode_cursor(cursor, order_by)))
+    return query.limit(limit + 1)
+
+
+def build_page(rows: Sequence[T], order_by: Sequence[Any], limit: int) -> Page[T]:
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            [getattr(last, _split_key(key)[0].key) for key in order_by]
+        )
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def paginate(query, order_by: Sequence[Any], cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+    """Fetch one page of an ORM Query."""
+    limit = clamp_limit(limit)
+    return build_page(keyset(query, order_by, cursor, limit).all(), order_by, limit)
+
+
+async def paginate_async(
+    db: AsyncSession, stmt, order_by: Sequence[Any], cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+) -> Page:
+    """Fetch one page of a Select on an AsyncSession."""
+    limit = clamp_limit(limit)
+    result = await db.scalars(keyset(stmt, order_by, cursor, limit))
+    return build_page(result.all(), order_by, limit)
+
+
+def page_items(response, page: Page) -> List[Any]:
+    """
+    Put the next-page cursor in the response headers and return the items,
+    so list endpoints keep returning a plain JSON array.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
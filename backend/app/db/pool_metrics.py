@@ -0,0 +1,112 @@
+"""
+Connection pool instrumentation.
+
+Each engine gets a QueuePool subclass bound to its own PoolMetrics, which
+times every checkout (including time spent waiting for a free connection)
+and counts pool timeouts, new connections and invalidations. Snapshots are
+served by the monitoring endpoint.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Type
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool, QueuePool
+
+# Upper bounds (milliseconds) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+class PoolMetrics:
+    def __init__(self, name: str):
+        self.name = name
+        self.engine: Engine = None
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)  # last bucket is +Inf
+
+    def observe_wait(self, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            self.wait_buckets[bisect_left(WAIT_BUCKETS_MS, wait_ms)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self.engine.pool if self.engine is not None else None
+        with self._lock:
+            observed = self.checkouts + self.timeouts
+            cumulative, histogram = 0, {}
+            for bound, count in zip([*map(str, WAIT_BUCKETS_MS), "+Inf"], self.wait_buckets):
+                cumulative += count
+                histogram[bound] = cumulative
+            data = {
+                "name": self.name,
+                "checkouts_total": self.checkouts,
+                "timeouts_total": self.timeouts,
+                "connects_total": self.connects,
+                "invalidations_total": self.invalidations,
+                "wait_ms_avg": round(self.wait_total_ms / observed, 3) if observed else 0.0,
+                "wait_ms_max": round(self.wait_max_ms, 3),
+                "wait_ms_histogram": histogram,
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "status": pool.status(),
+            })
+        return data
+
+
+_registry: Dict[str, PoolMetrics] = {}
+
+
+def instrumented_pool_class(metrics: PoolMetrics, base: Type[Pool] = QueuePool) -> Type[Pool]:
+    """
+    Build a pool class that reports checkout waits to `metrics`.
+    Binding through the class keeps metrics across pool.recreate().
+    """
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = base._do_get(self)
+        except exc.TimeoutError:
+            metrics.observe_wait((time.perf_counter() - start) * 1000, timed_out=True)
+            raise
+        metrics.observe_wait((time.perf_counter() - start) * 1000)
+        return connection
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+
+def register_engine(metrics: PoolMetrics, engine: Engine) -> None:
+    """Attach connection-level listeners and expose the engine's pool metrics."""
+    metrics.engine = engine
+    _registry[metrics.name] = metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        with metrics._lock:
+            metrics.connects += 1
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        with metrics._lock:
+            metrics.invalidations += 1
+
+
+def get_pool_snapshots() -> List[Dict[str, Any]]:
+    return [metrics.snapshot() for metrics in _registry.values()]
@@ -0,0 +1,113 @@
+"""
+Per-request query statistics.
+
+Cursor execution events on every engine feed the QueryStats of the request
+being served (held in a context variable, so it follows the request into
+threadpool workers). The HTTP middleware in main.py reports the totals as
+response headers, logs statement shapes that repeat suspiciously often
+(typical of N+1 loops) and folds the request into per-route metrics.
+"""
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_ms += elapsed_ms
+            # Parameters are bound, so the SQL text already is the statement shape
+            self.shapes[statement] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        with self._lock:
+            return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+def start_request_stats() -> Tuple[QueryStats, Any]:
+    """Begin collecting for the current request; the token goes to stop_request_stats."""
+    stats = QueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def stop_request_stats(token) -> None:
+    _current_stats.reset(token)
+
+
+def get_request_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    starts = conn.info.get("query_start")
+    if stats is not None and starts:
+        stats.record(statement, (time.perf_counter() - starts.pop()) * 1000)
+
+
+def route_template(path: str, path_params: Dict[str, Any]) -> str:
+    """/api/v1/interns/5 with {"intern_id": 5} -> /api/v1/interns/{intern_id}"""
+    names = {str(value): name for name, value in path_params.items()}
+    return "/".join(
+        f"{{{names[segment]}}}" if segment in names else segment for segment in path.split("/")
+    )
+
+
+class RouteQueryMetrics:
+    """Query totals aggregated per route template (e.g. GET /api/v1/tasks/tasks)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, route: str, stats: QueryStats, n_plus_one: bool) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(route, {
+                "requests": 0,
+                "queries_total": 0,
+                "queries_max": 0,
+                "db_time_ms_total": 0.0,
+                "n_plus_one_warnings": 0,
+            })
+            entry["requests"] += 1
+            entry["queries_total"] += stats.count
+            entry["queries_max"] = max(entry["queries_max"], stats.count)
+            entry["db_time_ms_total"] += stats.total_ms
+            entry["n_plus_one_warnings"] += int(n_plus_one)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = []
+            for route, entry in self._routes.items():
+                requests = entry["requests"]
+                rows.append({
+                    "route": route,
+                    **entry,
+                    "db_time_ms_total": round(entry["db_time_ms_total"], 3),
+                    "queries_avg": round(entry["queries_total"] / requests, 2),
+                    "db_time_ms_avg": round(entry["db_time_ms_total"] / requests, 3),
+                })
+        return sorted(rows, key=lambda row: row["queries_avg"], reverse=True)
+
+
+route_query_metrics = RouteQueryMetrics()
@@ -1,26 +1,160 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import random
+from datetime import datetime
+from sqlalchemy import Delete, Insert, Update, create_engine, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql.elements import TextClause
 from app.core.config import settings
 from app.core.logger import logger
+from app.db.pool_metrics import PoolMetrics, instrumented_pool_class, register_engine
+
+# Session.info flag: once set, every statement of the session goes to the primary
+USE_PRIMARY = "use_primary"
+
+
+def _connect_options() -> str:
+    """Server settings applied to every new connection."""
+    options = [f"-c timezone={settings.DB_TIMEZONE}"]
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        options.append(f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}")
+    return " ".join(options)
+
+
+def _async_server_settings() -> dict:
+    """The same server settings in the form asyncpg expects."""
+    server_settings = {"timezone": settings.DB_TIMEZONE}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    return server_settings
+
+
+def _pool_options() -> dict:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _create_engine(url: str, name: str):
+    metrics = PoolMetrics(name)
+    db_engine = create_engine(
+        url,
+        poolclass=instrumented_pool_class(metrics),
+        # Force the session timezone (and statement timeout) at the driver level
+        connect_args={
+            "options": _connect_options()
+        },
+        **_pool_options()
+    )
+    register_engine(metrics, db_engine)
+    return db_engine
+
+
+def _create_async_engine(url: str, name: str):
+    metrics = PoolMetrics(name)
+    db_engine = create_async_engine(
+        make_url(url).set(drivername="postgresql+asyncpg"),
+        poolclass=instrumented_pool_class(metrics, AsyncAdaptedQueuePool),
+        connect_args={
+            "server_settings": _async_server_settings()
+        },
+        **_pool_options()
+    )
+    register_engine(metrics, db_engine.sync_engine)
+    return db_engine
+
+
+def _is_write(clause) -> bool:
+    if isinstance(clause, (Insert, Update, Delete, TextClause)):
+        # Raw SQL is treated as a write: we cannot tell what it does
+        return True
+    return getattr(clause, "_for_update_arg", None) is not None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a read replica and writes to the primary.
+
+    The first write (flush, INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE or
+    raw SQL) pins the session to the primary for the rest of its life, so a
+    request always reads its own writes. Sessions created with
+    info={USE_PRIMARY: True} never touch a replica.
+
+    Each session reads from one replica, picked on its first read, so its
+    reads never mix replicas that are lagging by different amounts.
+    Background work outside a request (workers, backfills, index refreshes)
+    should call use_primary: it acts on what it reads and cannot tolerate
+    replica lag.
+    """
+    primary_bind = None
+    replica_binds = []
+    _replica_bind = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self.replica_binds or self.info.get(USE_PRIMARY):
+            return self.primary_bind
+        if self._flushing or _is_write(clause):
+            self.info[USE_PRIMARY] = True
+            return self.primary_bind
+        if self._replica_bind is None:
+            self._replica_bind = random.choice(self.replica_binds)
+        return self._replica_bind
+
+
+def use_primary(db) -> None:
+    """Pin a session (sync or async) to the primary before its first query."""
+    db.info[USE_PRIMARY] = True
+
+
+def db_now(db: Session) -> datetime:
+    """The database clock, as naive local time like the TIMESTAMP columns."""
+    now = db.scalar(select(func.now()))
+    if isinstance(now, str):
+        now = datetime.fromisoformat(now)
+    return now.replace(tzinfo=None)
+
 
 try:
     logger.info("Attempting to connect to database...")
     #logger.debug(f"Database URI: {settings.SQLALCHEMY_DATABASE_URI}")
-    
-    engine = create_engine(
-        settings.SQLALCHEMY_DATABASE_URI,
-        # Force the session timezone at the driver level
-        connect_args={
-            "options": "-c timezone=Asia/Kolkata"
-        }
-    )
-    logger.info("Database engine created successfully")
 
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = _create_engine(settings.SQLALCHEMY_DATABASE_URI, "primary")
+    replica_engines = [
+        _create_engine(url, f"replica_{i}") for i, url in enumerate(settings.SQLALCHEMY_REPLICA_URIS)
+    ]
+    logger.info(f"Database engine created successfully ({len(replica_engines)} read replica(s))")
+
+    class PrimaryReplicaSession(RoutingSession):
+        primary_bind = engine
+        replica_binds = replica_engines
+
+    SessionLocal = sessionmaker(class_=PrimaryReplicaSession, autocommit=False, autoflush=False)
     logger.info("SessionLocal configured successfully")
 
+    # asyncpg-backed engine for async endpoints. It has its own pool, sized
+    # by the same settings, so async traffic never waits on threadpool slots.
+    async_engine = _create_async_engine(settings.SQLALCHEMY_DATABASE_URI, "primary_async")
+    async_replica_engines = [
+        _create_async_engine(url, f"replica_{i}_async") for i, url in enumerate(settings.SQLALCHEMY_REPLICA_URIS)
+    ]
+    logger.info("Async database engine created successfully")
+
+    class AsyncPrimaryReplicaSession(RoutingSession):
+        primary_bind = async_engine.sync_engine
+        replica_binds = [replica.sync_engine for replica in async_replica_engines]
+
+    # expire_on_commit=False: attributes stay loaded after commit, since lazy
+    # loads cannot run implicitly under asyncio
+    AsyncSessionLocal = async_sessionmaker(
+        sync_session_class=AsyncPrimaryReplicaSession, autoflush=False, expire_on_commit=False
+    )
+    logger.info("AsyncSessionLocal configured successfully")
+
 except Exception as e:
     logger.error(f"Error connecting to database: {e}")
     raise
-
-
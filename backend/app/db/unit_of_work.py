@@ -0,0 +1,107 @@
+"""
+Caller-controlled transactions for the service layer.
+
+Service methods persist through save()/remove(). Called on their own they
+behave as before: commit and refresh per call. Inside unit_of_work(db)
+they only flush, so generated ids and server defaults are available to
+the next call, and the block commits once on exit (or rolls back on error):
+
+    with unit_of_work(db):
+        task = create_task(db, task_in, user_id)
+        create_task_assignment(db, TaskAssignmentCreate(task_id=task.task_id, ...))
+
+Blocks nest; only the outermost one commits.
+"""
+from contextlib import asynccontextmanager, contextmanager
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+_UOW_DEPTH = "unit_of_work_depth"
+
+
+def in_unit_of_work(db) -> bool:
+    return db.info.get(_UOW_DEPTH, 0) > 0
+
+
+def _enter(db) -> bool:
+    """Returns True for the outermost block."""
+    depth = db.info.get(_UOW_DEPTH, 0)
+    db.info[_UOW_DEPTH] = depth + 1
+    return depth == 0
+
+
+def _exit(db) -> None:
+    db.info[_UOW_DEPTH] -= 1
+
+
+@contextmanager
+def unit_of_work(db: Session):
+    outermost = _enter(db)
+    try:
+        yield db
+        if outermost:
+            # Objects were flushed with eager defaults, so they are complete;
+            # keeping them loaded avoids one SELECT per object on serialization
+            expire_on_commit, db.expire_on_commit = db.expire_on_commit, False
+            try:
+                db.commit()
+            finally:
+                db.expire_on_commit = expire_on_commit
+    except BaseException:
+        if outermost:
+            db.rollback()
+        raise
+    finally:
+        _exit(db)
+
+
+def save(db: Session, *instances) -> None:
+    """Persist instances: flush inside a unit of work, commit + refresh outside."""
+    db.add_all(instances)
+    if in_unit_of_work(db):
+        db.flush()
+        return
+    db.commit()
+    for instance in instances:
+        db.refresh(instance)
+
+
+def remove(db: Session, instance) -> None:
+    db.delete(instance)
+    if in_unit_of_work(db):
+        db.flush()
+    else:
+        db.commit()
+
+
+@asynccontextmanager
+async def async_unit_of_work(db: AsyncSession):
+    outermost = _enter(db)
+    try:
+        yield db
+        if outermost:
+            await db.commit()
+    except BaseException:
+        if outermost:
+            await db.rollback()
+        raise
+    finally:
+        _exit(db)
+
+
+async def save_async(db: AsyncSession, *instances) -> None:
+    db.add_all(instances)
+    if in_unit_of_work(db):
+        await db.flush()
+        return
+    await db.commit()
+    for instance in instances:
+        await db.refresh(instance)
+
+
+async def remove_async(db: AsyncSession, instance) -> None:
+    await db.delete(instance)
+    if in_unit_of_work(db):
+        await db.flush()
+    else:
+        await db.commit()
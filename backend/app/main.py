@@ -1,16 +1,22 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
 from app.api.api_v1.api import api_router
-from app.db.base_class import Base
-from app.db.session import engine
+from app.db.session import async_engine, async_replica_engines
+from app.db.filters import InvalidFilterError
+from app.db.pagination import NEXT_CURSOR_HEADER, InvalidCursorError
+from app.db.query_stats import route_query_metrics, route_template, start_request_stats, stop_request_stats
 from app.core.logger import logger
+from app.services.email_service import email_service
+from app.services.email_dispatcher import email_dispatcher
+from app.services.event_hub import event_hub
+from app.services.candidate_ranking import candidate_ranking_index
+from app.db import change_events  # noqa: registers the session hooks that publish change events
 import os
 
-# Create tables for demo purpose. In production, use Alembic migrations.
-Base.metadata.create_all(bind=engine)
-
+# The schema is managed by Alembic: run `alembic upgrade head` before starting the app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json"
@@ -23,8 +29,44 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all methods (GET, POST, PUT, DELETE, etc.)
     allow_headers=["*"],  # Allow all headers
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "X-DB-Query-Count", "X-DB-Time-Ms"],  # Readable by the browser
 )
 
+@app.middleware("http")
+async def db_query_stats(request: Request, call_next):
+    """Count the queries each request runs and flag N+1 patterns"""
+    if not settings.DB_QUERY_STATS_ENABLED:
+        return await call_next(request)
+
+    stats, token = start_request_stats()
+    try:
+        response = await call_next(request)
+    finally:
+        stop_request_stats(token)
+
+    route_name = f"{request.method} {route_template(request.url.path, request.path_params)}"
+    repeated = stats.repeated_shapes(settings.DB_N_PLUS_ONE_THRESHOLD)
+    for statement, times in repeated:
+        logger.warning(
+            f"Possible N+1 in {route_name}: statement ran {times} times in one request: "
+            f"{' '.join(statement.split())[:300]}"
+        )
+    # Unmatched paths (404s) would only add unbounded noise to the per-route table
+    if "route" in request.scope:
+        route_query_metrics.observe(route_name, stats, n_plus_one=bool(repeated))
+
+    response.headers["X-DB-Query-Count"] = str(stats.count)
+    response.headers["X-DB-Time-Ms"] = f"{stats.total_ms:.1f}"
+    return response
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
+@app.exception_handler(InvalidFilterError)
+async def invalid_filter_handler(request: Request, exc: InvalidFilterError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
 # Mount static files for resume PDFs
 app.mount(
     "/resumes",
@@ -35,7 +77,7 @@ app.mount(
 @app.on_event("startup")
 async def startup_event():
     """Check email authentication on startup"""
-    token_cache_path = "token_cache.bin"
+    token_cache_path = settings.GRAPH_TOKEN_CACHE_PATH
     
     if not os.path.exists(token_cache_path):
         logger.warning("="*70)
@@ -49,6 +91,26 @@ async def startup_event():
     else:
         logger.info("Email service token cache found")
 
+    if settings.EMAIL_OUTBOX_ENABLED:
+        await email_dispatcher.start()
+
+    if settings.REALTIME_ENABLED:
+        await event_hub.start()
+
+    if settings.RANKING_ENABLED:
+        await candidate_ranking_index.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the background workers, and close pooled Graph HTTP and database connections"""
+    await email_dispatcher.stop()
+    await event_hub.stop()
+    await candidate_ranking_index.stop()
+    await email_service.aclose()
+    await async_engine.dispose()
+    for replica in async_replica_engines:
+        await replica.dispose()
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 @app.get("/health")
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, Integer, String, Enum, Date, ARRAY,ForeignKey
+from sqlalchemy import Column, Computed, Integer, String, Text, Enum, Date, ARRAY,ForeignKey, Index, TIMESTAMP
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
+from sqlalchemy.sql import func
 import enum
 from app.db.base_class import Base
 from app.models.enums import RoundName
 
+# Text search configuration of Candidate.search_vector; queries must use the same one
+SEARCH_CONFIG = "english"
 
 
 class Candidate(Base):
@@ -13,7 +18,42 @@ class Candidate(Base):
     status = Column(Enum(RoundName), default=RoundName.ASSESSMENT, nullable=True)
     address = Column(String, nullable=True)
     resume_name = Column(String, nullable=True)
-    application_date = Column(Date, nullable=True)
+    application_date = Column(Date, nullable=True, index=True)
     source = Column(String, nullable=True)
     skills = Column(String, nullable=True)
-    college_id = Column(Integer, ForeignKey("college.id"), nullable=False)
+    college_id = Column(Integer, ForeignKey("college.id"), nullable=False, index=True)
+    # Full resume text, only needed for search; deferred so lists never load it
+    resume_text = deferred(Column(Text, nullable=True))
+    # Lets the ranking index (app/services/candidate_ranking.py) pick up changes incrementally
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False, index=True)
+    # Maintained by Postgres on every insert/update: name and skills weigh
+    # most, then university, then the resume body. Left out of the mapping
+    # (see __mapper_args__), so eager_defaults never reads it back; queries
+    # use Candidate.__table__.c.search_vector.
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(full_name, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(skills, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(university, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(resume_text, '')), 'C')",
+            persisted=True,
+        ),
+    )
+
+    __mapper_args__ = {**Base.__mapper_args__, "exclude_properties": ["search_vector"]}
+
+    __table_args__ = (
+        # Status lists and per-college pipeline views: WHERE status = ... [AND college_id = ...]
+        Index("ix_candidate_status_college_id", "status", "college_id"),
+        Index("ix_candidate_search_vector", "search_vector", postgresql_using="gin"),
+        # Fuzzy (similarity) matching on names and universities
+        Index(
+            "ix_candidate_full_name_trgm", "full_name",
+            postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_candidate_university_trgm", "university",
+            postgresql_using="gin", postgresql_ops={"university": "gin_trgm_ops"},
+        ),
+    )
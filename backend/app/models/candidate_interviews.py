@@ -11,7 +11,7 @@ class InterviewStatus(PyEnum):
 
 class CandidateInterviews(Base):
     id = Column(Integer, primary_key=True, index=True)
-    candidate_id = Column(Integer, ForeignKey("candidate.id"), nullable=False)
+    candidate_id = Column(Integer, ForeignKey("candidate.id"), nullable=False, index=True)
     round_id = Column(Integer, ForeignKey("interviewrounds.id"), nullable=False)
     score = Column(Integer, nullable=True)
     feedback = Column(Text, nullable=True)
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy.orm import relationship
+from datetime import datetime
+import enum
+from app.db.base_class import Base
+
+
+class CampaignRecipientStatus(str, enum.Enum):
+    QUEUED = "queued"    # college created, invitation in the email outbox
+    SKIPPED = "skipped"  # not imported (duplicate or already registered)
+
+
+class CollegeCampaign(Base):
+    __tablename__ = "college_campaigns"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    send_rate_per_minute = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    recipients = relationship(
+        "CollegeCampaignRecipient",
+        back_populates="campaign",
+        cascade="all, delete-orphan",
+        order_by="CollegeCampaignRecipient.id",
+    )
+
+
+class CollegeCampaignRecipient(Base):
+    __tablename__ = "college_campaign_recipients"
+
+    id = Column(Integer, primary_key=True, index=True)
+    campaign_id = Column(Integer, ForeignKey("college_campaigns.id"), nullable=False, index=True)
+    college_id = Column(Integer, ForeignKey("college.id"), nullable=True)
+    outbox_id = Column(Integer, ForeignKey("email_outbox.id"), nullable=True)
+    college_name = Column(String, nullable=False)
+    email = Column(String, nullable=False)
+    status = Column(Enum(CampaignRecipientStatus), nullable=False)
+    detail = Column(Text, nullable=True)
+
+    campaign = relationship("CollegeCampaign", back_populates="recipients")
+    college = relationship("College")
+    outbox = relationship("EmailOutbox")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Date
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.base_class import Base
@@ -29,6 +29,11 @@ class UploadedFile(Base):
     file_size = Column(Integer, nullable=False)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Keyset pagination of the uploads list: ORDER BY uploaded_at DESC, id DESC
+        Index("ix_uploaded_files_uploaded_at_id", "uploaded_at", "id"),
+    )
+
 class StudentResume(Base):
     __tablename__ = "student_resumes"
 
@@ -37,4 +42,9 @@ class StudentResume(Base):
     file_path = Column(String, nullable=False)
     file_size = Column(Integer, nullable=False)
     uploaded_at = Column(DateTime, default=datetime.utcnow)
-    college_id = Column(Integer,ForeignKey("college.id"),nullable=True)
\ No newline at end of file
+    college_id = Column(Integer,ForeignKey("college.id"),nullable=True)
+
+    __table_args__ = (
+        # A college's resumes, newest first
+        Index("ix_student_resumes_college_id_uploaded_at", "college_id", "uploaded_at"),
+    )
\ No newline at end of file
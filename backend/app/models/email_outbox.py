@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, JSON, Index
+from datetime import datetime
+import enum
+from app.db.base_class import Base
+
+
+class OutboxStatus(str, enum.Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    DEAD = "dead"
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    email_to = Column(JSON, nullable=False)
+    cc = Column(JSON, nullable=True)
+    bcc = Column(JSON, nullable=True)
+    subject = Column(String, nullable=False)
+    html_content = Column(Text, nullable=False)
+    content_type = Column(String, nullable=False, default="HTML")
+    attachments = Column(JSON, nullable=True)  # list of file paths
+    status = Column(Enum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_until = Column(DateTime, nullable=True)  # lease held by a dispatcher worker
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Dispatcher poll: WHERE status = ... AND next_attempt_at <= now
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
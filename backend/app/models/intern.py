@@ -18,9 +18,9 @@ class Intern(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     university = Column(String, index=True)
     department = Column(String, index=True)
-    start_date = Column(Date)
+    start_date = Column(Date, index=True)
     end_date = Column(Date)
-    status = Column(Enum(InternStatus), default=InternStatus.ONBOARDING)
+    status = Column(Enum(InternStatus), default=InternStatus.ONBOARDING, index=True)
     address = Column(String, index = True)
     job_position = Column(String,index = True)
     salary = Column(String,index = True,default = "25,000")
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+from app.db.base_class import Base
+
+
+class Skill(Base):
+    """A canonical skill, e.g. "JavaScript"."""
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), unique=True, index=True, nullable=False)
+
+
+class SkillAlias(Base):
+    """A normalized spelling ("js", "javascript", "java script") of a skill."""
+    __tablename__ = "skill_aliases"
+
+    alias = Column(String(100), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skill.id", ondelete="CASCADE"), nullable=False, index=True)
+
+
+class CandidateSkill(Base):
+    __tablename__ = "candidate_skills"
+
+    candidate_id = Column(Integer, ForeignKey("candidate.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skill.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        # The inverted index: skill -> candidates, answered from the index alone
+        Index("ix_candidate_skills_skill_id_candidate_id", "skill_id", "candidate_id"),
+    )
@@ -1,8 +1,10 @@
 from sqlalchemy import Column, String, Text, Enum, Integer, TIMESTAMP, ForeignKey, Date
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
 import enum
 from datetime import date
+from typing import Optional
 
 class TaskStatus(str, enum.Enum):
     TODO = "TODO"
@@ -19,10 +21,29 @@ class Task(Base):
     task_id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False)
-    position = Column(Integer, nullable=False)
-    due_date = Column(Date, nullable=False)
-    priority = Column(Enum(TaskPriority),nullable = False)
-    created_by = Column(Integer, ForeignKey("user.id"), nullable=False)
+    status = Column(Enum(TaskStatus), default=TaskStatus.TODO, nullable=False, index=True)
+    position = Column(Integer, nullable=False, index=True)
+    # Board order (see app/services/task_rank.py); byte-wise comparison
+    rank = Column(
+        String(255).with_variant(String(255, collation="C"), "postgresql"), nullable=False, index=True
+    )
+    due_date = Column(Date, nullable=False, index=True)
+    priority = Column(Enum(TaskPriority),nullable = False, index=True)
+    created_by = Column(Integer, ForeignKey("user.id"), nullable=False, index=True)
     created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
-    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False, index=True)
+
+    # selectin: any load of tasks fetches their assignments in one extra
+    # query for the whole batch, never one per task
+    assignments = relationship(
+        "TaskAssignment",
+        back_populates="task",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+        order_by="TaskAssignment.assigned_at",
+    )
+
+    @property
+    def assigned_intern(self) -> Optional[str]:
+        """The board shows a single assignee: the first intern assigned."""
+        return str(self.assignments[0].intern_id) if self.assignments else None
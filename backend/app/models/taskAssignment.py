@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, TIMESTAMP, ForeignKey
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
 
@@ -7,5 +8,9 @@ class TaskAssignment(Base):
     __tablename__ = "task_assignments"
 
     task_id = Column(Integer, ForeignKey("task.task_id"), primary_key=True, nullable=False)
-    intern_id = Column(Integer, ForeignKey("intern.id"), primary_key=True, nullable=False)
-    assigned_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
\ No newline at end of file
+    # Second PK column, so lookups by intern need their own index
+    intern_id = Column(Integer, ForeignKey("intern.id"), primary_key=True, nullable=False, index=True)
+    assigned_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False, index=True)
+
+    task = relationship("Task", back_populates="assignments")
@@ -0,0 +1,39 @@
+from sqlalchemy import Column, Integer, String, TIMESTAMP, event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+from app.models.candidate import Candidate
+from app.models.task import Task
+from app.models.taskAssignment import TaskAssignment
+
+
+class Tombstone(Base):
+    """
+    Record of a deleted task, task assignment or candidate, so delta sync
+    can tell clients what to remove (see app/services/task_sync_service.py)
+    and the ranking index can drop the candidate.
+    """
+    __tablename__ = "tombstones"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String(32), nullable=False)       # Task / TaskAssignment / Candidate table name
+    entity_id = Column(Integer, nullable=False)       # task_id or candidate id
+    secondary_id = Column(Integer, nullable=True)     # intern_id, for assignments
+    # Same clock as the updated_at columns it is compared with
+    deleted_at = Column(TIMESTAMP, server_default=func.now(), nullable=False, index=True)
+
+
+@event.listens_for(Session, "before_flush")
+def _record_deletes(session, flush_context, instances):
+    """Every ORM delete of a task, assignment or candidate leaves a tombstone in the same transaction."""
+    for instance in list(session.deleted):
+        if isinstance(instance, Task):
+            session.add(Tombstone(entity=Task.__tablename__, entity_id=instance.task_id))
+        elif isinstance(instance, TaskAssignment):
+            session.add(Tombstone(
+                entity=TaskAssignment.__tablename__,
+                entity_id=instance.task_id,
+                secondary_id=instance.intern_id,
+            ))
+        elif isinstance(instance, Candidate):
+            session.add(Tombstone(entity=Candidate.__tablename__, entity_id=instance.id))
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
 from app.models.enums import RoundName
 from datetime import date
@@ -25,10 +25,12 @@ class CandidateCreate(CandidateBase):
     source: str
     skills: str
     college_id: int
+    # Indexed for search, never returned
+    resume_text: Optional[str] = None
 
 
 class CandidateUpdate(CandidateBase):
-    pass
+    resume_text: Optional[str] = None
 
 
 class Candidate(CandidateBase):
@@ -54,3 +56,20 @@ class Candidate(CandidateBase):
                 "college_id": 1
             }
         }
+
+
+class CandidateSearchResult(Candidate):
+    # Relevance: text rank plus name/university similarity, higher is better
+    score: float
+
+
+class CandidateRankRequest(BaseModel):
+    job_description: str = Field(..., min_length=2, max_length=50000)
+    limit: int = Field(50, ge=1, le=100)
+    # Only rank this college's candidates, e.g. for a campus drive
+    college_id: Optional[int] = None
+
+
+class CandidateRankResult(Candidate):
+    # Cosine similarity of skills and resume with the job description, 0 to 1
+    score: float
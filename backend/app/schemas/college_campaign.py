@@ -0,0 +1,57 @@
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import datetime
+from app.schemas.college import CollegeCreate
+
+
+class CollegeCampaignCreate(BaseModel):
+    name: str
+    subject: Optional[str] = None
+    send_rate_per_minute: Optional[int] = Field(default=None, gt=0)
+    colleges: List[CollegeCreate] = Field(..., min_length=1)
+
+
+class CollegeCampaignRecipient(BaseModel):
+    college_id: Optional[int] = None
+    college_name: str
+    email: str
+    # skipped | pending | sending | sent | dead
+    delivery_state: str
+    attempts: int = 0
+    detail: Optional[str] = None
+    scheduled_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+
+
+class CollegeCampaign(BaseModel):
+    id: int
+    name: str
+    subject: str
+    send_rate_per_minute: int
+    created_at: datetime
+    summary: Dict[str, int]
+    recipients: List[CollegeCampaignRecipient]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "id": 1,
+                "name": "Spring 2026 drive",
+                "subject": "Invitation to Participate in Recruitment Drive",
+                "send_rate_per_minute": 30,
+                "created_at": "2026-02-01T10:00:00",
+                "summary": {"sent": 2, "pending": 1, "skipped": 1},
+                "recipients": [
+                    {
+                        "college_id": 7,
+                        "college_name": "Example Institute of Technology",
+                        "email": "placements@example.edu",
+                        "delivery_state": "sent",
+                        "attempts": 1,
+                        "detail": None,
+                        "scheduled_at": "2026-02-01T10:00:00",
+                        "sent_at": "2026-02-01T10:00:03"
+                    }
+                ]
+            }
+        }
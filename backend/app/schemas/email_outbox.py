@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+from app.models.email_outbox import OutboxStatus
+
+
+class EmailOutbox(BaseModel):
+    id: int
+    email_to: List[str]
+    cc: Optional[List[str]] = None
+    bcc: Optional[List[str]] = None
+    subject: str
+    status: OutboxStatus
+    attempts: int
+    next_attempt_at: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
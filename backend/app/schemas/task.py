@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
 from typing import Optional, List
 from datetime import datetime,date
 from app.models.task import TaskStatus , TaskPriority
+from app.schemas.task_assignment import TaskAssignment
 
 class TaskBase(BaseModel):
     title: str
@@ -25,8 +26,34 @@ class TaskUpdate(TaskBase):
     priority: Optional[TaskPriority] = None
     assigned_intern: Optional[int] = None
 
+class TaskMove(BaseModel):
+    """Place a task between two neighbours; leave one out to move to the start / end."""
+    before_id: Optional[int] = None   # task that ends up directly above
+    after_id: Optional[int] = None    # task that ends up directly below
+    status: Optional[TaskStatus] = None  # set when the card changes column
+
+# Bulk operations run as one transaction; the caps keep them to one statement's worth
+class TaskBulkCreate(BaseModel):
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=500)
+
+class TaskBulkAssign(BaseModel):
+    task_ids: List[int] = Field(..., min_length=1, max_length=500)
+    intern_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+class TaskBulkAssignResult(BaseModel):
+    assigned: int  # new assignments; pairs that already existed are not counted
+
+class TaskBulkStatus(BaseModel):
+    task_ids: List[int] = Field(..., min_length=1, max_length=500)
+    status: TaskStatus
+
+class TaskBulkStatusResult(BaseModel):
+    updated_ids: List[int]
+    missing_ids: List[int]
+
 class TaskInDBBase(TaskBase):
     task_id: int
+    rank: str
     created_by: int
     created_at: datetime
     updated_at: datetime
@@ -35,7 +62,22 @@ class TaskInDBBase(TaskBase):
         orm_mode = True
 
 class Task(TaskInDBBase):
-    assignedIntern:Optional[str] = None
+    # Read from Task.assigned_intern when validating an ORM object
+    assignedIntern: Optional[str] = Field(
+        None, validation_alias=AliasChoices("assignedIntern", "assigned_intern")
+    )
 
 class TaskInDB(TaskInDBBase):
-    pass
\ No newline at end of file
+    pass
+
+class DeletedAssignment(BaseModel):
+    task_id: int
+    intern_id: int
+
+class TaskChanges(BaseModel):
+    """Board changes since a sync cursor; apply deletions before upserts."""
+    tasks: List[Task]
+    assignments: List[TaskAssignment]
+    deleted_task_ids: List[int]
+    deleted_assignments: List[DeletedAssignment]
+    cursor: str  # pass back as ?cursor= on the next poll
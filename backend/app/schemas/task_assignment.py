@@ -13,5 +13,8 @@ class TaskAssignmentBase(BaseModel):
 class TaskAssignmentCreate(TaskAssignmentBase):
     pass 
 
+class TaskAssignment(TaskAssignmentBase):
+    updated_at: datetime
+
 class TaskAssignmentUpdate(BaseModel):
     assigned_at: Optional[datetime] = None
\ No newline at end of file
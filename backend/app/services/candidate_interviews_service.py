@@ -1,14 +1,16 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from app.db.unit_of_work import save, remove
+from app.db.pagination import Page, paginate
 from app.models.candidate_interviews import CandidateInterviews, InterviewStatus
 from app.schemas.candidate_interviews import CandidateInterviewsCreate, CandidateInterviewsUpdate
 
 
 class CandidateInterviewsService:
     def get_candidate_interviews(
-        self, db: Session, skip: int = 0, limit: int = 100
-    ) -> List[CandidateInterviews]:
-        return db.query(CandidateInterviews).offset(skip).limit(limit).all()
+        self, db: Session, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[CandidateInterviews]:
+        return paginate(db.query(CandidateInterviews), [CandidateInterviews.id], cursor, limit)
 
     def get_candidate_interview_by_id(
         self, db: Session, candidate_interview_id: int
@@ -25,9 +27,7 @@ class CandidateInterviewsService:
             feedback=candidate_interview_in.feedback,
             status=candidate_interview_in.status,
         )
-        db.add(db_candidate_interview)
-        db.commit()
-        db.refresh(db_candidate_interview)
+        save(db, db_candidate_interview)
         return db_candidate_interview
 
     def update_candidate_interview(
@@ -40,9 +40,7 @@ class CandidateInterviewsService:
         for field, value in update_data.items():
             setattr(db_candidate_interview, field, value)
 
-        db.add(db_candidate_interview)
-        db.commit()
-        db.refresh(db_candidate_interview)
+        save(db, db_candidate_interview)
         return db_candidate_interview
 
     def delete_candidate_interview(
@@ -50,8 +48,7 @@ class CandidateInterviewsService:
     ) -> Optional[CandidateInterviews]:
         db_candidate_interview = self.get_candidate_interview_by_id(db, candidate_interview_id)
         if db_candidate_interview:
-            db.delete(db_candidate_interview)
-            db.commit()
+            remove(db, db_candidate_interview)
         return db_candidate_interview
 
 
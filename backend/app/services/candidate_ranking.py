@@ -0,0 +1,345 @@
+"""
+Ranking candidates against a job description, in process.
+
+Each candidate's skills and resume text become a sparse term vector:
+tokens are hashed straight to one of RANKING_HASH_FEATURES columns, so
+there is no vocabulary to keep in sync, and known skill spellings are
+folded into the canonical name ("k8s" -> "kubernetes", see
+skill_service.SYNONYMS). The vectors are the rows of a scipy sparse
+matrix. Ranking a job description is a single sparse matrix-vector
+product over the whole pool (TF-IDF cosine similarity) and a partial sort
+for the top rows; nothing leaves the process.
+
+The index is held in memory by each worker and kept current by a
+background refresher:
+
+- Candidates whose updated_at moved past the last refresh are re-hashed
+  into a small delta segment and their old rows are masked out; candidate
+  tombstones mask out deletions. Like task delta sync, each refresh
+  re-reads RANKING_SYNC_OVERLAP_SECONDS before the previous one, since
+  updated_at is the start time of the writing transaction.
+- Once the delta holds RANKING_MERGE_FRACTION of the index, both segments
+  are merged in memory and the IDF weights are recomputed.
+- Every RANKING_REBUILD_INTERVAL the index is rebuilt from the database.
+
+Each refresh swaps in a new immutable snapshot, so ranking never waits for
+a refresh to finish.
+"""
+import asyncio
+import math
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+import numpy as np
+from scipy import sparse
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.session import SessionLocal, db_now, use_primary
+from app.models.candidate import Candidate
+from app.models.tombstone import Tombstone
+from app.services.skill_service import CANONICAL_NAMES, parse_skills, skill_key
+
+REBUILD_BATCH_SIZE = 2000
+
+# Declared skills say more about a candidate than a passing mention in the resume
+SKILL_WEIGHT = 2.0
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+_STOP_WORDS = frozenset("""
+    a about an and are as at be been but by can for from has have in into is it its of on or our
+    that the their this to was we were will with you your etc using used use work worked working
+""".split())
+
+# Single-word spellings of known skills -> the tokens of the canonical name
+_SYNONYM_TOKENS = {
+    alias: tuple(skill_key(name).split())
+    for alias, name in CANONICAL_NAMES.items()
+    if " " not in alias and alias != skill_key(name)
+}
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    tokens = []
+    for token in _TOKEN.findall((text or "").casefold()):
+        if token in _STOP_WORDS:
+            continue
+        tokens.extend(_SYNONYM_TOKENS.get(token, (token,)))
+    return tokens
+
+
+@lru_cache(maxsize=1 << 16)
+def _column(token: str) -> int:
+    return zlib.crc32(token.encode()) % settings.RANKING_HASH_FEATURES
+
+
+def term_weights(skills: Optional[str], text: Optional[str]) -> Counter:
+    """Hashed column -> sublinear term frequency, skills counting SKILL_WEIGHT times."""
+    counts: Counter = Counter()
+    for token in tokenize(text):
+        counts[_column(token)] += 1.0
+    # Each skill entry once, canonical name first ("js" and "javascript" are one skill)
+    for name in parse_skills(skills).values():
+        for token in tokenize(name):
+            counts[_column(token)] += SKILL_WEIGHT
+    return Counter({column: 1.0 + math.log(count) for column, count in counts.items()})
+
+
+def _encode(rows: Sequence[Tuple[Optional[str], Optional[str]]]) -> sparse.csr_matrix:
+    """One CSR row of sublinear term frequencies per (skills, resume_text)."""
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    indices: List[int] = []
+    data: List[float] = []
+    for i, (skills, text) in enumerate(rows):
+        weights = term_weights(skills, text)
+        if len(weights) > settings.RANKING_MAX_TERMS:
+            weights = dict(weights.most_common(settings.RANKING_MAX_TERMS))
+        indices.extend(weights.keys())
+        data.extend(weights.values())
+        indptr[i + 1] = len(indices)
+    return sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), indptr),
+        shape=(len(rows), settings.RANKING_HASH_FEATURES),
+    )
+
+
+class _Segment:
+    """
+    Rows of the index: a CSC matrix (ranking reads a few columns of every
+    row) with the candidate id, college id, TF-IDF norm and liveness of
+    each row.
+    """
+
+    def __init__(self, matrix, ids, college_ids, norms, alive=None):
+        self.matrix = matrix
+        self.ids = ids
+        self.college_ids = college_ids
+        self.norms = norms
+        self.alive = np.ones(len(ids), dtype=bool) if alive is None else alive
+
+    @classmethod
+    def build(cls, csr: sparse.csr_matrix, ids, college_ids, idf: np.ndarray) -> "_Segment":
+        squared = csr.copy()
+        squared.data = squared.data ** 2
+        norms = np.sqrt(squared @ (idf ** 2)).astype(np.float32)
+        return cls(
+            csr.tocsc(), np.asarray(ids, dtype=np.int64), np.asarray(college_ids, dtype=np.int64), norms
+        )
+
+    @classmethod
+    def empty(cls) -> "_Segment":
+        return cls(
+            sparse.csc_matrix((0, settings.RANKING_HASH_FEATURES), dtype=np.float32),
+            np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32),
+        )
+
+    @property
+    def live_rows(self) -> int:
+        return int(self.alive.sum())
+
+    def without(self, candidate_ids: Iterable[int]) -> "_Segment":
+        """The same rows with those candidates masked out."""
+        stale = np.isin(self.ids, np.fromiter(candidate_ids, dtype=np.int64))
+        if not stale.any():
+            return self
+        return _Segment(self.matrix, self.ids, self.college_ids, self.norms, self.alive & ~stale)
+
+    def scores(self, columns: np.ndarray, weights: np.ndarray, college_id: Optional[int]) -> np.ndarray:
+        """Cosine similarity of every row with the query; 0 for masked rows."""
+        dot = self.matrix[:, columns] @ weights
+        usable = self.alive & (self.norms > 0)
+        if college_id is not None:
+            usable &= self.college_ids == college_id
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        scores[usable] = dot[usable] / self.norms[usable]
+        return scores
+
+
+def _merge(segments: Sequence[_Segment]) -> Tuple[sparse.csr_matrix, np.ndarray, np.ndarray]:
+    """The live rows of the segments, as one CSR matrix with their ids."""
+    matrix = sparse.vstack([segment.matrix.tocsr()[segment.alive] for segment in segments], format="csr")
+    ids = np.concatenate([segment.ids[segment.alive] for segment in segments])
+    college_ids = np.concatenate([segment.college_ids[segment.alive] for segment in segments])
+    return matrix, ids, college_ids
+
+
+def _idf(matrix: sparse.csr_matrix) -> np.ndarray:
+    """Smoothed inverse document frequency of every column."""
+    document_frequency = np.bincount(matrix.indices, minlength=settings.RANKING_HASH_FEATURES)
+    return (np.log((1.0 + matrix.shape[0]) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+
+
+class _Snapshot:
+    def __init__(
+        self, base: _Segment, delta: _Segment, idf: np.ndarray,
+        changed_through: datetime, built_at: float,
+    ):
+        self.base = base
+        self.delta = delta
+        self.idf = idf
+        self.changed_through = changed_through  # database time the last refresh read up to
+        self.built_at = built_at                # monotonic time of the last full rebuild
+        self.refreshed_at = time.monotonic()
+
+
+class CandidateRankingIndex:
+    def __init__(self):
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+        self._refresher: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    # Ranking
+
+    def rank(
+        self, job_description: str, limit: int = 50, college_id: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        (candidate id, score) of the best matches, best first. Builds the
+        index on first use, and refreshes it inline when the background
+        refresher is not running.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or (
+            self._refresher is None
+            and time.monotonic() - snapshot.refreshed_at >= settings.RANKING_REFRESH_INTERVAL
+        ):
+            self._refresh_in_thread()
+            snapshot = self._snapshot
+
+        query = term_weights(None, job_description)
+        if not query:
+            return []
+        columns = np.fromiter(query.keys(), dtype=np.int64)
+        weights = np.fromiter(query.values(), dtype=np.float32) * snapshot.idf[columns]
+        weights /= np.linalg.norm(weights)
+        # Candidate rows carry raw term frequencies; apply their IDF here
+        weights *= snapshot.idf[columns]
+
+        scores = np.concatenate([
+            snapshot.base.scores(columns, weights, college_id),
+            snapshot.delta.scores(columns, weights, college_id),
+        ])
+        ids = np.concatenate([snapshot.base.ids, snapshot.delta.ids])
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(ids[i]), float(scores[i])) for i in top if scores[i] > 0]
+
+    # Maintenance
+
+    def refresh(self, db: Session) -> None:
+        """Bring the index up to date: a full rebuild when due, otherwise the changes since the last refresh."""
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or time.monotonic() - snapshot.built_at >= settings.RANKING_REBUILD_INTERVAL:
+                self._rebuild(db)
+            else:
+                self._apply_changes(db, snapshot)
+
+    def _rebuild(self, db: Session) -> None:
+        started = time.monotonic()
+        # Read before the scan: anything written during it is picked up by the next refresh
+        changed_through = db_now(db)
+        parts, ids, college_ids, last_id = [], [], [], 0
+        while True:
+            batch = db.execute(
+                select(Candidate.id, Candidate.college_id, Candidate.skills, Candidate.resume_text)
+                .where(Candidate.id > last_id)
+                .order_by(Candidate.id)
+                .limit(REBUILD_BATCH_SIZE)
+            ).all()
+            if not batch:
+                break
+            parts.append(_encode([(row.skills, row.resume_text) for row in batch]))
+            ids.extend(row.id for row in batch)
+            college_ids.extend(row.college_id for row in batch)
+            last_id = batch[-1].id
+
+        matrix = sparse.vstack(parts, format="csr") if parts else _encode([])
+        idf = _idf(matrix)
+        self._snapshot = _Snapshot(
+            _Segment.build(matrix, ids, college_ids, idf), _Segment.empty(), idf, changed_through, time.monotonic()
+        )
+        logger.info(f"Candidate ranking index built: {len(ids)} candidates in {time.monotonic() - started:.1f}s")
+
+    def _apply_changes(self, db: Session, snapshot: _Snapshot) -> None:
+        now = db_now(db)
+        since = snapshot.changed_through - timedelta(seconds=settings.RANKING_SYNC_OVERLAP_SECONDS)
+        changed = db.execute(
+            select(Candidate.id, Candidate.college_id, Candidate.skills, Candidate.resume_text)
+            .where(Candidate.updated_at > since)
+            .order_by(Candidate.id)
+        ).all()
+        deleted = db.scalars(
+            select(Tombstone.entity_id)
+            .where(Tombstone.entity == Candidate.__tablename__, Tombstone.deleted_at > since)
+        ).all()
+        if not changed and not deleted:
+            self._snapshot = _Snapshot(snapshot.base, snapshot.delta, snapshot.idf, now, snapshot.built_at)
+            return
+
+        stale = {row.id for row in changed} | set(deleted)
+        base, delta = snapshot.base.without(stale), snapshot.delta.without(stale)
+        if changed:
+            added = _Segment.build(
+                _encode([(row.skills, row.resume_text) for row in changed]),
+                [row.id for row in changed], [row.college_id for row in changed], snapshot.idf,
+            )
+            matrix, ids, college_ids = _merge([delta, added])
+            delta = _Segment.build(matrix, ids, college_ids, snapshot.idf)
+
+        if delta.live_rows > settings.RANKING_MERGE_FRACTION * max(base.live_rows, 1):
+            matrix, ids, college_ids = _merge([base, delta])
+            idf = _idf(matrix)
+            self._snapshot = _Snapshot(
+                _Segment.build(matrix, ids, college_ids, idf), _Segment.empty(), idf, now, snapshot.built_at
+            )
+        else:
+            self._snapshot = _Snapshot(base, delta, snapshot.idf, now, snapshot.built_at)
+
+    def _refresh_in_thread(self) -> None:
+        db = SessionLocal()
+        use_primary(db)
+        try:
+            self.refresh(db)
+        finally:
+            db.close()
+
+    async def start(self) -> None:
+        if self._refresher:
+            return
+        self._stopping = asyncio.Event()
+        self._refresher = asyncio.create_task(self._run(), name="candidate-ranking-refresher")
+        logger.info("Candidate ranking refresher started")
+
+    async def stop(self) -> None:
+        if not self._refresher:
+            return
+        self._stopping.set()
+        await asyncio.gather(self._refresher, return_exceptions=True)
+        self._refresher = None
+        logger.info("Candidate ranking refresher stopped")
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.to_thread(self._refresh_in_thread)
+            except Exception as e:
+                logger.error(f"Candidate ranking: refresh failed: {str(e)}")
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.RANKING_REFRESH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+
+candidate_ranking_index = CandidateRankingIndex()
@@ -1,14 +1,71 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import cast, func, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.models.candidate import Candidate
+from app.db.unit_of_work import async_unit_of_work, save, remove, save_async, remove_async, unit_of_work
+from app.db.filters import ALL, EQUALITY, FilterSet
+from app.db.pagination import Page, paginate, paginate_async
+from app.models.candidate import SEARCH_CONFIG, Candidate
 from app.schemas.candidate import CandidateCreate, CandidateUpdate
+from app.services.candidate_ranking import candidate_ranking_index
+from app.services.skill_service import skill_service
+
+CANDIDATE_FILTERS = FilterSet(
+    fields={
+        "status": (Candidate.status, EQUALITY),
+        "college_id": (Candidate.college_id, EQUALITY),
+        "university": (Candidate.university, EQUALITY),
+        "email": (Candidate.email, ("eq",)),
+        "application_date": (Candidate.application_date, ALL),
+        "updated_at": (Candidate.updated_at, ("gt", "gte", "lt", "lte")),
+    },
+    # Keyset sorts need NOT NULL columns, so full_name and application_date
+    # can be filtered on but not sorted by
+    sorts={"id": Candidate.id, "updated_at": Candidate.updated_at},
+    tiebreaker=Candidate.id,
+)
+
+
+def _search_stmt(q: str, limit: int, filters: Optional[List[str]]):
+    """
+    Candidates whose search vector matches the words of q (web search syntax:
+    "quoted phrases", -excluded, or) or whose name or university is similar
+    to q, best first. Each predicate is served by its own GIN index.
+    """
+    search_vector = Candidate.__table__.c.search_vector
+    query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), q)
+    # Normalization 32 scales the text rank to 0..1, like similarity()
+    score = (
+        func.ts_rank_cd(search_vector, query, 32)
+        + func.greatest(func.similarity(Candidate.full_name, q), func.similarity(Candidate.university, q))
+    ).label("score")
+    return (
+        select(Candidate, score)
+        .where(
+            or_(
+                search_vector.bool_op("@@")(query),
+                Candidate.full_name.bool_op("%")(q),
+                Candidate.university.bool_op("%")(q),
+            ),
+            *CANDIDATE_FILTERS.where(filters),
+        )
+        .order_by(score.desc(), Candidate.id)
+        .limit(limit)
+    )
 
 
 class CandidateService:
     def get_candidates(
-        self, db: Session, skip: int = 0, limit: int = 100
-    ) -> List[Candidate]:
-        return db.query(Candidate).offset(skip).limit(limit).all()
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[Candidate]:
+        query, order_by = CANDIDATE_FILTERS.apply(db.query(Candidate), filters, sort)
+        return paginate(query, order_by, cursor, limit)
 
     def get_candidate_by_id(
         self, db: Session, candidate_id: int
@@ -20,10 +77,8 @@ class CandidateService:
     ) -> Optional[Candidate]:
         return db.query(Candidate).filter(Candidate.email == email).first()
 
-    def create_candidate(
-        self, db: Session, candidate_in: CandidateCreate
-    ) -> Candidate:
-        db_candidate = Candidate(
+    def _build_candidate(self, candidate_in: CandidateCreate) -> Candidate:
+        return Candidate(
             full_name=candidate_in.full_name,
             email=candidate_in.email,
             university=candidate_in.university,
@@ -33,11 +88,18 @@ class CandidateService:
             application_date = candidate_in.application_date,
             source = candidate_in.source,
             skills = candidate_in.skills,
-            college_id = candidate_in.college_id
+            college_id = candidate_in.college_id,
+            resume_text = candidate_in.resume_text
         )
-        db.add(db_candidate)
-        db.commit()
-        db.refresh(db_candidate)
+
+    def create_candidate(
+        self, db: Session, candidate_in: CandidateCreate
+    ) -> Candidate:
+        # The candidate and its normalized skills are committed together
+        with unit_of_work(db):
+            db_candidate = self._build_candidate(candidate_in)
+            save(db, db_candidate)
+            skill_service.sync_candidate_skills(db, {db_candidate.id: db_candidate.skills})
         return db_candidate
 
     def update_candidate(
@@ -47,12 +109,13 @@ class CandidateService:
         candidate_in: CandidateUpdate,
     ) -> Candidate:
         update_data = candidate_in.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_candidate, field, value)
+        with unit_of_work(db):
+            for field, value in update_data.items():
+                setattr(db_candidate, field, value)
 
-        db.add(db_candidate)
-        db.commit()
-        db.refresh(db_candidate)
+            save(db, db_candidate)
+            if "skills" in update_data:
+                skill_service.sync_candidate_skills(db, {db_candidate.id: db_candidate.skills})
         return db_candidate
 
     def delete_candidate(
@@ -60,14 +123,143 @@ class CandidateService:
     ) -> Optional[Candidate]:
         db_candidate = self.get_candidate_by_id(db, candidate_id)
         if db_candidate:
-            db.delete(db_candidate)
-            db.commit()
+            remove(db, db_candidate)
         return db_candidate
 
     def get_candidates_by_status(
-        self, db: Session, status: str, skip: int = 0, limit: int = 100
-    ) -> List[Candidate]:
-        return db.query(Candidate).filter(Candidate.status == status).offset(skip).limit(limit).all()
+        self,
+        db: Session,
+        status: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        college_id: Optional[int] = None,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[Candidate]:
+        query = db.query(Candidate).filter(Candidate.status == status)
+        if college_id is not None:
+            # (status, college_id) is indexed; filter before the page is cut
+            query = query.filter(Candidate.college_id == college_id)
+        query, order_by = CANDIDATE_FILTERS.apply(query, filters, sort)
+        return paginate(query, order_by, cursor, limit)
+
+    def get_candidates_by_skills(
+        self,
+        db: Session,
+        all_of: Optional[List[str]] = None,
+        any_of: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[Candidate]:
+        """Candidates with every skill in all_of and at least one in any_of (any spelling)."""
+        conditions = skill_service.skill_conditions(db, all_of, any_of)
+        if conditions is None:
+            return Page()
+        query, order_by = CANDIDATE_FILTERS.apply(db.query(Candidate).filter(*conditions), filters, sort)
+        return paginate(query, order_by, cursor, limit)
+
+    def search_candidates(
+        self, db: Session, q: str, limit: int = 20, filters: Optional[List[str]] = None
+    ) -> List[Tuple[Candidate, float]]:
+        """(candidate, score) pairs matching q, best first."""
+        return db.execute(_search_stmt(q, limit, filters)).all()
+
+    def rank_candidates(
+        self, db: Session, job_description: str, limit: int = 50, college_id: Optional[int] = None
+    ) -> List[Tuple[Candidate, float]]:
+        """(candidate, score) pairs best matching a job description, best first (see candidate_ranking)."""
+        ranked = candidate_ranking_index.rank(job_description, limit=limit, college_id=college_id)
+        if not ranked:
+            return []
+        by_id = {
+            candidate.id: candidate
+            for candidate in db.scalars(select(Candidate).where(Candidate.id.in_([id for id, _ in ranked])))
+        }
+        # Candidates deleted since the last index refresh are skipped
+        return [(by_id[id], score) for id, score in ranked if id in by_id]
+
+    # Async variants, for endpoints running on an AsyncSession
+
+    async def get_candidates_async(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[Candidate]:
+        stmt, order_by = CANDIDATE_FILTERS.apply(select(Candidate), filters, sort)
+        return await paginate_async(db, stmt, order_by, cursor, limit)
+
+    async def get_candidate_by_id_async(
+        self, db: AsyncSession, candidate_id: int
+    ) -> Optional[Candidate]:
+        return await db.scalar(select(Candidate).where(Candidate.id == candidate_id))
+
+    async def get_candidate_by_email_async(
+        self, db: AsyncSession, email: str
+    ) -> Optional[Candidate]:
+        return await db.scalar(select(Candidate).where(Candidate.email == email).limit(1))
+
+    async def create_candidate_async(
+        self, db: AsyncSession, candidate_in: CandidateCreate
+    ) -> Candidate:
+        async with async_unit_of_work(db):
+            db_candidate = self._build_candidate(candidate_in)
+            await save_async(db, db_candidate)
+            await db.run_sync(
+                skill_service.sync_candidate_skills, {db_candidate.id: db_candidate.skills}
+            )
+        return db_candidate
+
+    async def update_candidate_async(
+        self,
+        db: AsyncSession,
+        db_candidate: Candidate,
+        candidate_in: CandidateUpdate,
+    ) -> Candidate:
+        update_data = candidate_in.model_dump(exclude_unset=True)
+        async with async_unit_of_work(db):
+            for field, value in update_data.items():
+                setattr(db_candidate, field, value)
+
+            await save_async(db, db_candidate)
+            if "skills" in update_data:
+                await db.run_sync(
+                    skill_service.sync_candidate_skills, {db_candidate.id: db_candidate.skills}
+                )
+        return db_candidate
+
+    async def delete_candidate_async(
+        self, db: AsyncSession, candidate_id: int
+    ) -> Optional[Candidate]:
+        db_candidate = await self.get_candidate_by_id_async(db, candidate_id)
+        if db_candidate:
+            await remove_async(db, db_candidate)
+        return db_candidate
+
+    async def get_candidates_by_status_async(
+        self,
+        db: AsyncSession,
+        status: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        college_id: Optional[int] = None,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[Candidate]:
+        stmt = select(Candidate).where(Candidate.status == status)
+        if college_id is not None:
+            stmt = stmt.where(Candidate.college_id == college_id)
+        stmt, order_by = CANDIDATE_FILTERS.apply(stmt, filters, sort)
+        return await paginate_async(db, stmt, order_by, cursor, limit)
+
+    async def search_candidates_async(
+        self, db: AsyncSession, q: str, limit: int = 20, filters: Optional[List[str]] = None
+    ) -> List[Tuple[Candidate, float]]:
+        return (await db.execute(_search_stmt(q, limit, filters))).all()
 
 
 candidate_service = CandidateService()
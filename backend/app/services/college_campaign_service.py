@@ -0,0 +1,114 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
+from app.core.config import settings
+from app.db.unit_of_work import save
+from app.models.college import College
+from app.models.college_campaign import CollegeCampaign, CollegeCampaignRecipient, CampaignRecipientStatus
+from app.schemas.college_campaign import CollegeCampaignCreate
+from app.services.email_outbox_service import email_outbox_service
+from app.services.email_templates import COLLEGE_INVITATION_SUBJECT, render_college_invitation
+
+
+class CollegeCampaignService:
+    def create_campaign(self, db: Session, campaign_in: CollegeCampaignCreate) -> CollegeCampaign:
+        """
+        Import colleges in bulk and queue one invitation per new college.
+
+        Invitations go through the email outbox, scheduled send_rate_per_minute
+        apart, so the dispatcher paces the campaign on its own. Colleges whose
+        email is already registered (or repeated in the request) are recorded
+        as skipped. Everything is written in one transaction.
+        """
+        send_rate = campaign_in.send_rate_per_minute or settings.CAMPAIGN_SEND_RATE_PER_MINUTE
+        db_campaign = CollegeCampaign(
+            name=campaign_in.name,
+            subject=campaign_in.subject or COLLEGE_INVITATION_SUBJECT,
+            send_rate_per_minute=send_rate,
+        )
+        db.add(db_campaign)
+
+        # One lookup for every email in the import instead of one per college
+        emails = {college_in.email.lower() for college_in in campaign_in.colleges}
+        registered = {
+            email.lower()
+            for (email,) in db.query(College.email).filter(func.lower(College.email).in_(emails))
+        }
+
+        interval = timedelta(seconds=60 / send_rate)
+        send_at = datetime.utcnow()
+        seen = set()
+        for college_in in campaign_in.colleges:
+            email = college_in.email.lower()
+            recipient = CollegeCampaignRecipient(
+                campaign=db_campaign,
+                college_name=college_in.college_name,
+                email=college_in.email,
+            )
+            if email in registered:
+                recipient.status = CampaignRecipientStatus.SKIPPED
+                recipient.detail = "A college with this email already exists."
+            elif email in seen:
+                recipient.status = CampaignRecipientStatus.SKIPPED
+                recipient.detail = "Duplicate email in this campaign."
+            else:
+                recipient.status = CampaignRecipientStatus.QUEUED
+                recipient.college = College(**college_in.model_dump())
+                recipient.outbox = email_outbox_service.enqueue(
+                    db,
+                    email_to=[college_in.email],
+                    subject=db_campaign.subject,
+                    html_content=render_college_invitation(college_in.college_name),
+                    send_after=send_at,
+                )
+                send_at += interval
+            seen.add(email)
+            db.add(recipient)
+
+        save(db, db_campaign)
+        # The commit expired everything; reload the recipients and their
+        # outbox rows in bulk so build_report does not load them one by one
+        return self.get_campaign(db, db_campaign.id)
+
+    def get_campaign(self, db: Session, campaign_id: int) -> Optional[CollegeCampaign]:
+        return (
+            db.query(CollegeCampaign)
+            .options(selectinload(CollegeCampaign.recipients).selectinload(CollegeCampaignRecipient.outbox))
+            .filter(CollegeCampaign.id == campaign_id)
+            .first()
+        )
+
+    def build_report(self, db_campaign: CollegeCampaign) -> Dict[str, Any]:
+        """Per-college delivery state, read from the outbox rows."""
+        recipients = []
+        for recipient in db_campaign.recipients:
+            outbox = recipient.outbox
+            if recipient.status == CampaignRecipientStatus.SKIPPED or outbox is None:
+                state = CampaignRecipientStatus.SKIPPED.value
+            else:
+                state = outbox.status.value
+            recipients.append({
+                "college_id": recipient.college_id,
+                "college_name": recipient.college_name,
+                "email": recipient.email,
+                "delivery_state": state,
+                "attempts": outbox.attempts if outbox else 0,
+                "detail": recipient.detail or (outbox.last_error if outbox else None),
+                "scheduled_at": outbox.next_attempt_at if outbox else None,
+                "sent_at": outbox.sent_at if outbox else None,
+            })
+
+        return {
+            "id": db_campaign.id,
+            "name": db_campaign.name,
+            "subject": db_campaign.subject,
+            "send_rate_per_minute": db_campaign.send_rate_per_minute,
+            "created_at": db_campaign.created_at,
+            "summary": dict(Counter(recipient["delivery_state"] for recipient in recipients)),
+            "recipients": recipients,
+        }
+
+
+college_campaign_service = CollegeCampaignService()
@@ -1,11 +1,33 @@
 from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.db.unit_of_work import save, remove, save_async, remove_async
+from app.db.filters import FilterSet
+from app.db.pagination import Page, paginate, paginate_async
 from app.models.college import College
 from app.schemas.college import CollegeCreate, CollegeUpdate
 
+COLLEGE_FILTERS = FilterSet(
+    fields={
+        "college_name": (College.college_name, ("eq",)),
+        "email": (College.email, ("eq",)),
+    },
+    sorts={"id": College.id, "college_name": College.college_name},
+    tiebreaker=College.id,
+)
+
 class CollegeService:
-    def get_colleges(self, db: Session, skip: int = 0, limit: int = 100) -> List[College]:
-        return db.query(College).offset(skip).limit(limit).all()
+    def get_colleges(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[College]:
+        query, order_by = COLLEGE_FILTERS.apply(db.query(College), filters, sort)
+        return paginate(query, order_by, cursor, limit)
 
     def get_college_by_id(self, db: Session, college_id: int) -> Optional[College]:
         return db.query(College).filter(College.id == college_id).first()
@@ -13,8 +35,8 @@ class CollegeService:
     def get_college_by_email(self, db: Session, email: str) -> Optional[College]:
         return db.query(College).filter(College.email == email).first()
 
-    def create_college(self, db: Session, college_in: CollegeCreate) -> College:
-        db_college = College(
+    def _build_college(self, college_in: CollegeCreate) -> College:
+        return College(
             college_name=college_in.college_name,
             email=college_in.email,
             phone=college_in.phone,
@@ -22,9 +44,10 @@ class CollegeService:
             head_name=college_in.head_name,
             head_phone=college_in.head_phone,
         )
-        db.add(db_college)
-        db.commit()
-        db.refresh(db_college)
+
+    def create_college(self, db: Session, college_in: CollegeCreate) -> College:
+        db_college = self._build_college(college_in)
+        save(db, db_college)
         return db_college
 
     def update_college(self, db: Session, db_college: College, college_in: CollegeUpdate) -> College:
@@ -32,16 +55,51 @@ class CollegeService:
         for field, value in update_data.items():
             setattr(db_college, field, value)
         
-        db.add(db_college)
-        db.commit()
-        db.refresh(db_college)
+        save(db, db_college)
         return db_college
 
     def delete_college(self, db: Session, college_id: int) -> Optional[College]:
         db_college = self.get_college_by_id(db, college_id)
         if db_college:
-            db.delete(db_college)
-            db.commit()
+            remove(db, db_college)
+        return db_college
+
+    # Async variants, for endpoints running on an AsyncSession
+
+    async def get_colleges_async(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[College]:
+        stmt, order_by = COLLEGE_FILTERS.apply(select(College), filters, sort)
+        return await paginate_async(db, stmt, order_by, cursor, limit)
+
+    async def get_college_by_id_async(self, db: AsyncSession, college_id: int) -> Optional[College]:
+        return await db.scalar(select(College).where(College.id == college_id))
+
+    async def get_college_by_email_async(self, db: AsyncSession, email: str) -> Optional[College]:
+        return await db.scalar(select(College).where(College.email == email).limit(1))
+
+    async def create_college_async(self, db: AsyncSession, college_in: CollegeCreate) -> College:
+        db_college = self._build_college(college_in)
+        await save_async(db, db_college)
+        return db_college
+
+    async def update_college_async(self, db: AsyncSession, db_college: College, college_in: CollegeUpdate) -> College:
+        update_data = college_in.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_college, field, value)
+
+        await save_async(db, db_college)
+        return db_college
+
+    async def delete_college_async(self, db: AsyncSession, college_id: int) -> Optional[College]:
+        db_college = await self.get_college_by_id_async(db, college_id)
+        if db_college:
+            await remove_async(db, db_college)
         return db_college
 
 college_service = CollegeService()
\ No newline at end of file
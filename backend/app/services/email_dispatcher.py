@@ -0,0 +1,137 @@
+"""
+Background dispatcher that drains the email outbox.
+
+A small pool of asyncio workers claims due messages in batches, sends each
+batch through Graph JSON batching and records the per-message outcome. Database work runs
+in worker threads so the event loop is only ever waiting on Graph.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.session import SessionLocal, use_primary
+from app.models.email_outbox import OutboxStatus
+from app.services.email_outbox_service import email_outbox_service
+from app.services.email_service import email_service, EmailDeliveryResult, EmailMessage
+
+
+class EmailDispatcher:
+    def __init__(self):
+        self._workers: List[asyncio.Task] = []
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._stopping = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._run_worker(worker_id), name=f"email-dispatcher-{worker_id}")
+            for worker_id in range(settings.EMAIL_OUTBOX_WORKERS)
+        ]
+        logger.info(f"Email dispatcher started with {len(self._workers)} worker(s)")
+
+    async def stop(self) -> None:
+        if not self._workers:
+            return
+        self._stopping.set()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("Email dispatcher stopped")
+
+    async def _run_worker(self, worker_id: int) -> None:
+        while not self._stopping.is_set():
+            try:
+                batch = await asyncio.to_thread(self._claim_batch)
+            except Exception as e:
+                logger.error(f"Email dispatcher {worker_id}: failed to claim outbox batch: {str(e)}")
+                batch = []
+
+            if batch:
+                await self._deliver_batch(batch)
+                continue
+
+            # Nothing due: sleep until the next poll or until shutdown
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=settings.EMAIL_OUTBOX_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+
+    def _claim_batch(self) -> List[Dict[str, Any]]:
+        """Claim a batch and copy what is needed to send it out of the session."""
+        db = SessionLocal()
+        use_primary(db)
+        try:
+            messages = email_outbox_service.claim_batch(
+                db,
+                batch_size=settings.EMAIL_OUTBOX_BATCH_SIZE,
+                lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+            )
+            return [
+                {
+                    "id": message.id,
+                    "email_to": message.email_to,
+                    "cc": message.cc,
+                    "bcc": message.bcc,
+                    "subject": message.subject,
+                    "html_content": message.html_content,
+                    "content_type": message.content_type,
+                    "attachments": message.attachments,
+                }
+                for message in messages
+            ]
+        finally:
+            db.close()
+
+    async def _deliver_batch(self, batch: List[Dict[str, Any]]) -> None:
+        messages = [
+            EmailMessage(
+                email_to=message["email_to"],
+                subject=message["subject"],
+                html_content=message["html_content"],
+                cc=message["cc"],
+                bcc=message["bcc"],
+                content_type=message["content_type"],
+                attachments=message["attachments"],
+            )
+            for message in batch
+        ]
+        try:
+            # Throttled messages go back to the outbox with backoff rather
+            # than holding this worker
+            results = await email_service.send_bulk(messages, max_retries=0)
+        except Exception as e:
+            results = [EmailDeliveryResult(success=False, error=str(e), retryable=True) for _ in batch]
+
+        for message, result in zip(batch, results):
+            try:
+                await asyncio.to_thread(self._record_result, message["id"], result)
+            except Exception as e:
+                # The lease expires and the message is retried, so it is not lost
+                logger.error(f"Failed to record outcome for outbox message {message['id']}: {str(e)}")
+
+    def _record_result(self, message_id: int, result: EmailDeliveryResult) -> None:
+        db = SessionLocal()
+        use_primary(db)
+        try:
+            if result.success:
+                email_outbox_service.mark_sent(db, message_id)
+                return
+
+            db_message = email_outbox_service.mark_failed(
+                db,
+                message_id,
+                error=result.error,
+                retryable=result.retryable,
+                retry_after=result.retry_after,
+            )
+            if db_message is not None and db_message.status == OutboxStatus.DEAD:
+                logger.error(
+                    f"Outbox message {message_id} dead-lettered after {db_message.attempts} attempt(s): {result.error}"
+                )
+            else:
+                logger.warning(f"Outbox message {message_id} failed, will retry: {result.error}")
+        finally:
+            db.close()
+
+
+email_dispatcher = EmailDispatcher()
@@ -0,0 +1,152 @@
+import random
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.pagination import Page, paginate
+from app.db.unit_of_work import save
+from app.models.email_outbox import EmailOutbox, OutboxStatus
+
+
+class EmailOutboxService:
+    def enqueue(
+        self,
+        db: Session,
+        email_to: List[str],
+        subject: str,
+        html_content: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        content_type: str = "HTML",
+        attachments: Optional[List[str]] = None,
+        send_after: Optional[datetime] = None,
+    ) -> EmailOutbox:
+        """
+        Queue an email for background delivery.
+
+        The row is only added to the session, not committed: it is written
+        in the same transaction as the business change that triggered it,
+        so the email exists if and only if that change does.
+        """
+        db_message = EmailOutbox(
+            email_to=list(email_to),
+            cc=list(cc) if cc else None,
+            bcc=list(bcc) if bcc else None,
+            subject=subject,
+            html_content=html_content,
+            content_type=content_type,
+            attachments=[str(path) for path in attachments] if attachments else None,
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            next_attempt_at=send_after or datetime.utcnow(),
+        )
+        db.add(db_message)
+        return db_message
+
+    def claim_batch(self, db: Session, batch_size: int, lease_seconds: int) -> List[EmailOutbox]:
+        """
+        Lock up to batch_size due messages and lease them to the caller.
+
+        Rows are selected with FOR UPDATE SKIP LOCKED so concurrent workers
+        (in this or other processes) never claim the same message. Messages
+        left in SENDING by a crashed worker become claimable again once
+        their lease expires, unless that was their last attempt: a message
+        that keeps crashing the worker is dead-lettered instead of being
+        leased forever.
+        """
+        now = datetime.utcnow()
+        messages = (
+            db.query(EmailOutbox)
+            .filter(
+                or_(
+                    and_(EmailOutbox.status == OutboxStatus.PENDING, EmailOutbox.next_attempt_at <= now),
+                    and_(EmailOutbox.status == OutboxStatus.SENDING, EmailOutbox.locked_until < now),
+                )
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        claimed = []
+        for message in messages:
+            if message.status == OutboxStatus.SENDING and message.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                message.status = OutboxStatus.DEAD
+                message.locked_until = None
+                message.last_error = "Lease expired on the last attempt without a recorded outcome"
+                continue
+            message.status = OutboxStatus.SENDING
+            message.locked_until = now + timedelta(seconds=lease_seconds)
+            message.attempts += 1
+            claimed.append(message)
+        db.commit()
+        return claimed
+
+    def mark_sent(self, db: Session, message_id: int) -> None:
+        db_message = db.query(EmailOutbox).filter(EmailOutbox.id == message_id).first()
+        if db_message:
+            db_message.status = OutboxStatus.SENT
+            db_message.sent_at = datetime.utcnow()
+            db_message.locked_until = None
+            db_message.last_error = None
+            db.commit()
+
+    def mark_failed(
+        self,
+        db: Session,
+        message_id: int,
+        error: Optional[str],
+        retryable: bool = True,
+        retry_after: Optional[float] = None,
+    ) -> Optional[EmailOutbox]:
+        """
+        Schedule a retry with exponential backoff, or dead-letter the message
+        once it is not retryable or has used up EMAIL_OUTBOX_MAX_ATTEMPTS.
+        """
+        db_message = db.query(EmailOutbox).filter(EmailOutbox.id == message_id).first()
+        if not db_message:
+            return None
+
+        db_message.last_error = error
+        db_message.locked_until = None
+        if not retryable or db_message.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            db_message.status = OutboxStatus.DEAD
+        else:
+            db_message.status = OutboxStatus.PENDING
+            db_message.next_attempt_at = datetime.utcnow() + timedelta(
+                seconds=self._backoff_seconds(db_message.attempts, retry_after)
+            )
+        db.commit()
+        return db_message
+
+    def get_dead_letters(
+        self, db: Session, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[EmailOutbox]:
+        query = db.query(EmailOutbox).filter(EmailOutbox.status == OutboxStatus.DEAD)
+        return paginate(query, [EmailOutbox.id], cursor, limit)
+
+    def get_message_by_id(self, db: Session, message_id: int) -> Optional[EmailOutbox]:
+        return db.query(EmailOutbox).filter(EmailOutbox.id == message_id).first()
+
+    def requeue(self, db: Session, db_message: EmailOutbox) -> EmailOutbox:
+        """Give a dead-lettered message a fresh set of attempts."""
+        db_message.status = OutboxStatus.PENDING
+        db_message.attempts = 0
+        db_message.next_attempt_at = datetime.utcnow()
+        db_message.locked_until = None
+        save(db, db_message)
+        return db_message
+
+    @staticmethod
+    def _backoff_seconds(attempts: int, retry_after: Optional[float] = None) -> float:
+        """Exponential backoff with full jitter, never sooner than Retry-After."""
+        ceiling = min(
+            settings.EMAIL_OUTBOX_BACKOFF_MAX,
+            settings.EMAIL_OUTBOX_BACKOFF_BASE * (2 ** max(attempts - 1, 0)),
+        )
+        delay = random.uniform(ceiling / 2, ceiling)
+        return max(delay, retry_after or 0)
+
+
+email_outbox_service = EmailOutboxService()
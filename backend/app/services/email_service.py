@@ -1,13 +1,111 @@
 import msal
-import requests
-import os
-import atexit
+import httpx
+import asyncio
+import importlib.util
 import json
 import base64
-from typing import List, Optional
+import copy
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from app.core.config import settings
 from app.core.logger import logger
+from app.services.token_cache import FileTokenCache
+
+# Graph responses worth retrying: throttling, timeouts and server-side errors
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+# Hard limit on sub-requests in one Graph $batch call
+GRAPH_BATCH_LIMIT = 20
+
+
+@dataclass
+class EmailMessage:
+    """An email to send through Graph."""
+    email_to: List[str]
+    subject: str
+    html_content: str
+    cc: Optional[List[str]] = None
+    bcc: Optional[List[str]] = None
+    content_type: str = "HTML"
+    attachments: Optional[List[str]] = None  # file paths
+
+
+@dataclass
+class EmailDeliveryResult:
+    """Outcome of a single Graph send."""
+    success: bool
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    retryable: bool = False
+    retry_after: Optional[float] = None  # seconds, from the Retry-After header
+
+
+class _StreamedJsonBody:
+    """
+    A JSON request body with file attachments base64-encoded on the fly.
+
+    `payload` is serialized as usual, except that the list found at `path`
+    is replaced by fileAttachment objects whose contentBytes are streamed
+    from disk. With single=True the body is one fileAttachment object
+    instead (for POST /messages/{id}/attachments). The total length is known
+    up front so Graph gets a Content-Length rather than a chunked upload.
+    """
+
+    _MARKER = "__STREAMED_ATTACHMENTS__"
+    _READ_SIZE = 3 * 64 * 1024  # multiple of 3, so chunks encode without padding
+
+    def __init__(self, payload: dict, path: Tuple[str, ...], attachments: List[Tuple[Path, int]], single: bool = False):
+        self.attachments = attachments
+        if single:
+            self.head, self.tail = b"", b""
+        else:
+            payload = copy.deepcopy(payload)
+            target = payload
+            for key in path[:-1]:
+                target = target[key]
+            target[path[-1]] = self._MARKER
+            before, _, after = json.dumps(payload).rpartition(json.dumps(self._MARKER))
+            self.head, self.tail = (before + "[").encode(), ("]" + after).encode()
+
+    @staticmethod
+    def _prefix(file_path: Path) -> bytes:
+        return (
+            '{"@odata.type": "#microsoft.graph.fileAttachment", "name": '
+            + json.dumps(file_path.name)
+            + ', "contentBytes": "'
+        ).encode()
+
+    def __len__(self) -> int:
+        length = len(self.head) + len(self.tail) + max(len(self.attachments) - 1, 0)
+        for file_path, size in self.attachments:
+            length += len(self._prefix(file_path)) + 4 * ((size + 2) // 3) + 2
+        return length
+
+    async def __aiter__(self):
+        yield self.head
+        for position, (file_path, _) in enumerate(self.attachments):
+            if position:
+                yield b","
+            yield self._prefix(file_path)
+            with open(file_path, "rb") as f:
+                while True:
+                    chunk = await asyncio.to_thread(f.read, self._READ_SIZE)
+                    if not chunk:
+                        break
+                    yield base64.b64encode(chunk)
+            yield b'"}'
+        yield self.tail
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Graph sends Retry-After as a number of seconds."""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
 
 class EmailService:
     def __init__(self):
@@ -16,18 +114,9 @@ class EmailService:
         self.scopes = settings.GRAPH_USER_SCOPES
         self.username = settings.MAIL_USERNAME
         
-        # Token Cache Setup
-        self.cache_file = "token_cache.bin"
-        self.cache = msal.SerializableTokenCache()
-        
-        if os.path.exists(self.cache_file):
-            self.cache.deserialize(open(self.cache_file, "r").read())
-            
-        # Register a callback to save the cache on exit
-        atexit.register(lambda: 
-            open(self.cache_file, "w").write(self.cache.serialize()) 
-            if self.cache.has_state_changed else None
-        )
+        # Token cache shared by all workers through a locked file
+        self.cache_file = settings.GRAPH_TOKEN_CACHE_PATH
+        self.cache = FileTokenCache(self.cache_file)
 
         self.authority = f"https://login.microsoftonline.com/{self.tenant_id}"
         
@@ -37,7 +126,101 @@ class EmailService:
             token_cache=self.cache
         )
 
-    def _get_access_token(self) -> Optional[str]:
+        # Shared HTTP client for Graph calls, created lazily on first use
+        self.graph_base_url = settings.GRAPH_API_BASE_URL.rstrip("/")
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # Current access token, kept in memory and refreshed ahead of expiry
+        self._access_token: Optional[str] = None
+        self._token_expires_at: float = 0.0
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return the shared Graph HTTP client, creating it on first use.
+        Connections are kept alive and reused across sends; HTTP/2 is
+        negotiated when the optional `h2` package is installed.
+        """
+        if self._client is None or self._client.is_closed:
+            http2 = settings.GRAPH_HTTP2 and importlib.util.find_spec("h2") is not None
+            self._client = httpx.AsyncClient(
+                base_url=self.graph_base_url,
+                http2=http2,
+                timeout=httpx.Timeout(
+                    settings.GRAPH_HTTP_TIMEOUT,
+                    connect=settings.GRAPH_HTTP_CONNECT_TIMEOUT
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.GRAPH_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GRAPH_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.GRAPH_HTTP_KEEPALIVE_EXPIRY
+                )
+            )
+            logger.info(f"Graph HTTP client created (http2={http2})")
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared Graph HTTP client and stop the token refresher."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def get_access_token(self) -> Optional[str]:
+        """
+        Return the in-memory access token for Graph API.
+
+        Sends only wait on MSAL when there is no usable token yet (first
+        send, or after a failed refresh). Otherwise the cached token is
+        returned immediately and a background task replaces it
+        GRAPH_TOKEN_REFRESH_MARGIN seconds before it expires.
+        """
+        if self._token_is_usable():
+            return self._access_token
+
+        async with self._token_lock:
+            # Another send may have acquired a token while we waited
+            if not self._token_is_usable():
+                await self._refresh_access_token(force_refresh=False)
+            return self._access_token if self._token_is_usable() else None
+
+    def _token_is_usable(self) -> bool:
+        # Keep a small buffer so a token never expires mid-request
+        return self._access_token is not None and time.time() < self._token_expires_at - 30
+
+    async def _refresh_access_token(self, force_refresh: bool) -> None:
+        """Acquire a token through MSAL (in a worker thread) and schedule the next refresh."""
+        try:
+            result = await asyncio.to_thread(self._acquire_token_silent, force_refresh)
+        except Exception as e:
+            logger.error(f"Failed to acquire Graph access token: {str(e)}")
+            result = None
+
+        if not result:
+            return
+
+        self._access_token = result["access_token"]
+        self._token_expires_at = time.time() + float(result.get("expires_in", 0))
+        self._schedule_token_refresh()
+
+    def _schedule_token_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            if self._refresh_task is not asyncio.current_task():
+                self._refresh_task.cancel()
+        self._refresh_task = asyncio.create_task(self._run_token_refresh(), name="graph-token-refresh")
+
+    async def _run_token_refresh(self) -> None:
+        delay = self._token_expires_at - settings.GRAPH_TOKEN_REFRESH_MARGIN - time.time()
+        await asyncio.sleep(max(delay, 0))
+        async with self._token_lock:
+            # force_refresh: MSAL would otherwise hand back the cached token
+            # until shortly before it expires
+            await self._refresh_access_token(force_refresh=True)
+
+    def _acquire_token_silent(self, force_refresh: bool = False) -> Optional[dict]:
         """
         Acquire token for Graph API.
         Attempts to acquire token silently from cache.
@@ -49,10 +232,12 @@ class EmailService:
             # Try to get token silently using the first available account
             # (Or filter by self.username if multiple accounts exist)
             chosen_account = next((a for a in accounts if a.get("username") == self.username), accounts[0])
-            result = self.app.acquire_token_silent(self.scopes, account=chosen_account)
+            result = self.app.acquire_token_silent(
+                self.scopes, account=chosen_account, force_refresh=force_refresh
+            )
 
         if result and "access_token" in result:
-            return result["access_token"]
+            return result
         
         logger.error("No valid token found in cache. Please run the authentication setup manually.")
         return None
@@ -105,74 +290,336 @@ class EmailService:
             content_type: Content type (HTML or Text)
             attachments: List of file paths to attach (e.g., generated DOCX files)
         """
-        access_token = self._get_access_token()
+        result = await self.deliver(
+            EmailMessage(
+                email_to=email_to,
+                subject=subject,
+                html_content=html_content,
+                cc=cc,
+                bcc=bcc,
+                content_type=content_type,
+                attachments=attachments
+            )
+        )
+        return result.success
+
+    async def deliver(self, message: EmailMessage) -> EmailDeliveryResult:
+        """
+        Same as send_email, but reports why a send failed and whether
+        it is worth retrying (used by the outbox dispatcher).
+        """
+        access_token = await self.get_access_token()
         if not access_token:
             logger.error("Cannot send email: Authorization required.")
-            return False
+            return EmailDeliveryResult(success=False, error="Authorization required", retryable=True)
 
-        to_recipients = [{"emailAddress": {"address": email}} for email in email_to]
-        cc_recipients = [{"emailAddress": {"address": email}} for email in (cc or [])]
-        bcc_recipients = [{"emailAddress": {"address": email}} for email in (bcc or [])]
-
-        # Prepare attachments
-        attachment_data = []
-        if attachments:
-            for file_path in attachments:
-                try:
-                    file_path_obj = Path(file_path)
-                    if not file_path_obj.exists():
-                        logger.error(f"Attachment file not found: {file_path}")
-                        continue
-                    
-                    with open(file_path, "rb") as f:
-                        file_content = f.read()
-                        encoded_content = base64.b64encode(file_content).decode("utf-8")
-                    
-                    attachment_data.append({
-                        "@odata.type": "#microsoft.graph.fileAttachment",
-                        "name": file_path_obj.name,
-                        "contentBytes": encoded_content
-                    })
-                    logger.info(f"Added attachment: {file_path_obj.name}")
-                except Exception as e:
-                    logger.error(f"Failed to attach file {file_path}: {str(e)}")
-
-        email_data = {
-            "message": {
-                "subject": subject,
-                "body": {
-                    "contentType": content_type,
-                    "content": html_content
-                },
-                "toRecipients": to_recipients,
-                "ccRecipients": cc_recipients,
-                "bccRecipients": bcc_recipients
-            },
-            "saveToSentItems": "true"
-        }
-        
-        # Add attachments if any were successfully processed
-        if attachment_data:
-            email_data["message"]["attachments"] = attachment_data
-
-        endpoint = "https://graph.microsoft.com/v1.0/me/sendMail"
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
-        }
+        attachments = self._resolve_attachments(message.attachments)
 
         try:
-            response = requests.post(endpoint, headers=headers, json=email_data)
+            if sum(size for _, size in attachments) <= settings.GRAPH_INLINE_ATTACHMENT_LIMIT:
+                response = await self._post_send_mail(access_token, message, attachments)
+            else:
+                response = await self._send_with_upload_sessions(access_token, message, attachments)
             
             if response.status_code == 202:
-                logger.info(f"Email sent successfully to {email_to}")
-                return True
+                logger.info(f"Email sent successfully to {message.email_to}")
+                return EmailDeliveryResult(success=True, status_code=response.status_code)
             else:
                 logger.error(f"Failed to send email. Status: {response.status_code}. Response: {response.text}")
-                return False
+                return self._failure_result(
+                    response.status_code, response.text, response.headers.get("Retry-After")
+                )
                 
         except Exception as e:
             logger.error(f"Exception sending email via Graph API: {str(e)}")
-            return False
+            return EmailDeliveryResult(success=False, error=str(e), retryable=True)
+
+    async def _post_send_mail(
+        self,
+        access_token: str,
+        message: EmailMessage,
+        attachments: List[Tuple[Path, int]]
+    ) -> httpx.Response:
+        """
+        POST /me/sendMail with attachments inline.
+
+        The JSON body is streamed: attachments are read and base64-encoded
+        chunk by chunk while the request is sent, so memory use does not
+        grow with attachment size.
+        """
+        payload = self._build_send_mail_payload(message)
+        body = _StreamedJsonBody(payload, path=("message", "attachments"), attachments=attachments)
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body))
+        }
+        return await self._get_client().post("/me/sendMail", headers=headers, content=body)
+
+    async def _send_with_upload_sessions(
+        self,
+        access_token: str,
+        message: EmailMessage,
+        attachments: List[Tuple[Path, int]]
+    ) -> httpx.Response:
+        """
+        Send a message whose attachments are too large to inline.
+
+        Creates a draft, adds small attachments with a streamed POST and
+        large ones through chunked upload sessions, then sends the draft.
+        The draft is deleted if any step fails. Returns the response of the
+        failing step, or of the final send.
+        """
+        client = self._get_client()
+        headers = {"Authorization": f"Bearer {access_token}"}
+
+        response = await client.post("/me/messages", headers=headers, json=self._build_send_mail_payload(message)["message"])
+        if response.status_code != 201:
+            return response
+        message_id = response.json()["id"]
+
+        try:
+            for path, size in attachments:
+                if size < settings.GRAPH_INLINE_ATTACHMENT_LIMIT:
+                    body = _StreamedJsonBody({}, path=(), attachments=[(path, size)], single=True)
+                    response = await client.post(
+                        f"/me/messages/{message_id}/attachments",
+                        headers={**headers, "Content-Type": "application/json", "Content-Length": str(len(body))},
+                        content=body
+                    )
+                    if response.status_code != 201:
+                        break
+                else:
+                    response = await self._upload_large_attachment(headers, message_id, path, size)
+                    if response.status_code not in (200, 201):
+                        break
+            else:
+                response = await client.post(f"/me/messages/{message_id}/send", headers=headers)
+        except Exception:
+            await self._delete_draft(headers, message_id)
+            raise
+
+        if response.status_code != 202:
+            await self._delete_draft(headers, message_id)
+        return response
+
+    async def _upload_large_attachment(
+        self,
+        headers: Dict[str, str],
+        message_id: str,
+        path: Path,
+        size: int
+    ) -> httpx.Response:
+        """Upload one attachment to a draft through a Graph upload session, one chunk in memory at a time."""
+        client = self._get_client()
+        response = await client.post(
+            f"/me/messages/{message_id}/attachments/createUploadSession",
+            headers=headers,
+            json={"AttachmentItem": {"attachmentType": "file", "name": path.name, "size": size}}
+        )
+        if response.status_code != 201:
+            return response
+        upload_url = response.json()["uploadUrl"]
+
+        chunk_size = settings.GRAPH_UPLOAD_CHUNK_SIZE
+        with open(path, "rb") as f:
+            start = 0
+            while start < size:
+                chunk = await asyncio.to_thread(f.read, chunk_size)
+                if not chunk:
+                    break
+                end = start + len(chunk) - 1
+                # The upload URL is pre-authenticated; Graph rejects an Authorization header here
+                response = await client.put(
+                    upload_url,
+                    headers={"Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(len(chunk))},
+                    content=chunk
+                )
+                if response.status_code not in (200, 201):
+                    return response
+                start = end + 1
+
+        logger.info(f"Uploaded large attachment: {path.name} ({size} bytes)")
+        return response
+
+    async def _delete_draft(self, headers: Dict[str, str], message_id: str) -> None:
+        try:
+            await self._get_client().delete(f"/me/messages/{message_id}", headers=headers)
+        except Exception as e:
+            logger.error(f"Failed to delete draft message {message_id}: {str(e)}")
+
+    @staticmethod
+    def _resolve_attachments(file_paths: Optional[List[str]]) -> List[Tuple[Path, int]]:
+        """Return (path, size) for each attachment that exists on disk."""
+        attachments = []
+        for file_path in file_paths or []:
+            file_path_obj = Path(file_path)
+            if not file_path_obj.is_file():
+                logger.error(f"Attachment file not found: {file_path}")
+                continue
+            attachments.append((file_path_obj, file_path_obj.stat().st_size))
+            logger.info(f"Added attachment: {file_path_obj.name}")
+        return attachments
+
+    async def send_bulk(
+        self,
+        messages: List[EmailMessage],
+        max_retries: Optional[int] = None
+    ) -> List[EmailDeliveryResult]:
+        """
+        Send many emails with Graph JSON batching.
+
+        Messages are packed into $batch calls of up to GRAPH_BATCH_SIZE
+        sendMail sub-requests each. Sub-requests throttled with 429 are
+        retried after the longest Retry-After in their batch, up to
+        max_retries times (defaults to GRAPH_BATCH_MAX_RETRIES).
+
+        Messages with attachments are sent individually (concurrently),
+        since $batch bodies cannot stream and are capped at 4 MB.
+
+        Returns one EmailDeliveryResult per message, in input order.
+        """
+        if max_retries is None:
+            max_retries = settings.GRAPH_BATCH_MAX_RETRIES
+        results: List[Optional[EmailDeliveryResult]] = [None] * len(messages)
+        if not messages:
+            return []
+
+        access_token = await self.get_access_token()
+        if not access_token:
+            logger.error("Cannot send email: Authorization required.")
+            return [
+                EmailDeliveryResult(success=False, error="Authorization required", retryable=True)
+                for _ in messages
+            ]
+
+        # Build each payload once; retries reuse it
+        payloads = {}
+        with_attachments = []
+        for index, message in enumerate(messages):
+            if message.attachments:
+                with_attachments.append(index)
+                continue
+            try:
+                payloads[index] = self._build_send_mail_payload(message)
+            except Exception as e:
+                results[index] = EmailDeliveryResult(success=False, error=str(e), retryable=False)
+
+        if with_attachments:
+            individual = await asyncio.gather(*(self.deliver(messages[index]) for index in with_attachments))
+            for index, result in zip(with_attachments, individual):
+                results[index] = result
+
+        pending = list(payloads)
+        batch_size = max(1, min(settings.GRAPH_BATCH_SIZE, GRAPH_BATCH_LIMIT))
+        for attempt in range(max_retries + 1):
+            throttled: List[int] = []
+            retry_after = 0.0
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                chunk_results = await self._post_batch(access_token, chunk, payloads)
+                for index, result in chunk_results.items():
+                    results[index] = result
+                    if result.status_code == 429:
+                        throttled.append(index)
+                        retry_after = max(retry_after, result.retry_after or 0)
+
+            if not throttled or attempt == max_retries:
+                break
+            delay = min(retry_after or settings.GRAPH_BATCH_RETRY_DELAY, settings.GRAPH_BATCH_MAX_RETRY_DELAY)
+            logger.warning(f"{len(throttled)} batched email(s) throttled by Graph, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            pending = throttled
+
+        sent = sum(1 for result in results if result is not None and result.success)
+        logger.info(f"Bulk email: {sent}/{len(messages)} sent")
+        return results
+
+    async def _post_batch(
+        self,
+        access_token: str,
+        indexes: List[int],
+        payloads: Dict[int, dict]
+    ) -> Dict[int, EmailDeliveryResult]:
+        """POST one $batch call and map each sub-response back to its message index."""
+        batch = {
+            "requests": [
+                {
+                    "id": str(index),
+                    "method": "POST",
+                    "url": "/me/sendMail",
+                    "headers": {"Content-Type": "application/json"},
+                    "body": payloads[index]
+                }
+                for index in indexes
+            ]
+        }
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
+
+        try:
+            response = await self._get_client().post("/$batch", headers=headers, json=batch)
+        except Exception as e:
+            logger.error(f"Exception sending email batch via Graph API: {str(e)}")
+            return {index: EmailDeliveryResult(success=False, error=str(e), retryable=True) for index in indexes}
+
+        if response.status_code != 200:
+            # The whole batch was rejected (throttled, auth, malformed)
+            logger.error(f"Failed to send email batch. Status: {response.status_code}. Response: {response.text}")
+            failure = self._failure_result(
+                response.status_code, response.text, response.headers.get("Retry-After")
+            )
+            return {index: failure for index in indexes}
+
+        results: Dict[int, EmailDeliveryResult] = {}
+        for sub_response in response.json().get("responses", []):
+            index = int(sub_response["id"])
+            status_code = sub_response.get("status")
+            if status_code == 202:
+                results[index] = EmailDeliveryResult(success=True, status_code=status_code)
+            else:
+                sub_headers = {key.lower(): value for key, value in (sub_response.get("headers") or {}).items()}
+                results[index] = self._failure_result(
+                    status_code, json.dumps(sub_response.get("body")), sub_headers.get("retry-after")
+                )
+
+        for index in indexes:
+            if index not in results:
+                results[index] = EmailDeliveryResult(
+                    success=False, error="Missing response in Graph batch", retryable=True
+                )
+        return results
+
+    @staticmethod
+    def _failure_result(status_code: int, body: str, retry_after: Optional[str]) -> EmailDeliveryResult:
+        return EmailDeliveryResult(
+            success=False,
+            status_code=status_code,
+            error=f"HTTP {status_code}: {body}",
+            retryable=status_code in RETRYABLE_STATUS_CODES,
+            retry_after=_parse_retry_after(retry_after)
+        )
+
+    def _build_send_mail_payload(self, message: EmailMessage) -> dict:
+        """Build the JSON body for POST /me/sendMail, without attachments."""
+        to_recipients = [{"emailAddress": {"address": email}} for email in message.email_to]
+        cc_recipients = [{"emailAddress": {"address": email}} for email in (message.cc or [])]
+        bcc_recipients = [{"emailAddress": {"address": email}} for email in (message.bcc or [])]
+
+        return {
+            "message": {
+                "subject": message.subject,
+                "body": {
+                    "contentType": message.content_type,
+                    "content": message.html_content
+                },
+                "toRecipients": to_recipients,
+                "ccRecipients": cc_recipients,
+                "bccRecipients": bcc_recipients
+            },
+            "saveToSentItems": "true"
+        }
 
 email_service = EmailService()
@@ -0,0 +1,23 @@
+"""
+Email templates rendered with Jinja2.
+
+Templates are compiled once at import and reused for every send, so
+rendering a campaign of hundreds of invitations costs one compile.
+"""
+from pathlib import Path
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+_env = Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    autoescape=select_autoescape(["html"]),
+)
+
+college_invitation_template = _env.get_template("college_invitation.html")
+
+COLLEGE_INVITATION_SUBJECT = "Invitation to Participate in Recruitment Drive"
+
+
+def render_college_invitation(college_name: str) -> str:
+    return college_invitation_template.render(college_name=college_name)
@@ -0,0 +1,129 @@
+"""
+Fan-out of change events to WebSocket subscribers.
+
+Each worker process keeps one dedicated asyncpg connection LISTENing on
+REALTIME_CHANNEL; whichever worker committed a change, every worker
+receives its pg_notify (app/db/change_events.py) and hands each event to
+the queues of the local subscribers allowed to see it.
+
+A subscriber whose queue is full (a slow or stalled client) has its
+backlog replaced by a single {"type": "resync"} event, telling the client
+to refetch instead of letting memory grow.
+"""
+import asyncio
+import json
+from typing import Any, Dict, Optional, Set
+import asyncpg
+from app.core.config import settings
+from app.core.logger import logger
+from app.models.user import UserRole
+
+# Event types each role may receive, before scope checks
+_ROLE_TYPES = {
+    UserRole.ADMIN: {"task", "assignment", "board", "candidate", "interview"},
+    UserRole.PANEL: {"candidate", "interview"},
+    UserRole.INTERN: {"task", "assignment", "board"},
+    UserRole.COLLEGE: {"candidate", "interview"},
+}
+
+
+class Subscriber:
+    def __init__(self, role: UserRole, intern_id: Optional[int] = None, college_id: Optional[int] = None):
+        self.role = role
+        self.intern_id = intern_id
+        self.college_id = college_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.REALTIME_QUEUE_SIZE)
+
+    def accepts(self, event: Dict[str, Any]) -> bool:
+        if event.get("type") == "resync":
+            return True
+        if event.get("type") not in _ROLE_TYPES.get(self.role, ()):
+            return False
+        if self.role is UserRole.INTERN and event["type"] != "board":
+            return self.intern_id in (event.get("intern_ids") or ())
+        if self.role is UserRole.COLLEGE:
+            return self.college_id is not None and event.get("college_id") == self.college_id
+        return True
+
+    def offer(self, event: Dict[str, Any]) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+
+
+class EventHub:
+    def __init__(self):
+        self._subscribers: Set[Subscriber] = set()
+        self._listener: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    def subscribe(self, subscriber: Subscriber) -> Subscriber:
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    def dispatch(self, events) -> None:
+        for event in events:
+            for subscriber in self._subscribers:
+                if subscriber.accepts(event):
+                    subscriber.offer(event)
+
+    async def start(self) -> None:
+        if self._listener:
+            return
+        self._stopping = asyncio.Event()
+        self._listener = asyncio.create_task(self._listen(), name="event-hub-listener")
+        logger.info(f"Event hub listening on channel {settings.REALTIME_CHANNEL}")
+
+    async def stop(self) -> None:
+        if not self._listener:
+            return
+        self._stopping.set()
+        await asyncio.gather(self._listener, return_exceptions=True)
+        self._listener = None
+        logger.info("Event hub stopped")
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            events = json.loads(payload)
+        except ValueError:
+            logger.error(f"Event hub: ignoring malformed notification: {payload[:200]}")
+            return
+        self.dispatch(events)
+
+    async def _listen(self) -> None:
+        """Hold a LISTEN connection to the primary, reconnecting until stopped."""
+        while not self._stopping.is_set():
+            lost = asyncio.Event()
+            connection = None
+            try:
+                connection = await asyncpg.connect(settings.SQLALCHEMY_DATABASE_URI)
+                connection.add_termination_listener(lambda _: lost.set())
+                await connection.add_listener(settings.REALTIME_CHANNEL, self._on_notify)
+                # Events committed while disconnected are gone; have every client refetch
+                self.dispatch([{"type": "resync"}])
+                stop_wait = asyncio.create_task(self._stopping.wait())
+                lost_wait = asyncio.create_task(lost.wait())
+                await asyncio.wait({stop_wait, lost_wait}, return_when=asyncio.FIRST_COMPLETED)
+                stop_wait.cancel()
+                lost_wait.cancel()
+                if lost.is_set():
+                    logger.warning("Event hub: LISTEN connection lost, reconnecting")
+            except Exception as e:
+                logger.error(f"Event hub: LISTEN connection failed: {str(e)}")
+            finally:
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            if not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=settings.REALTIME_RECONNECT_DELAY)
+                except asyncio.TimeoutError:
+                    pass
+
+
+event_hub = EventHub()
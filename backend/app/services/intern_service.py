@@ -1,11 +1,36 @@
 from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.db.unit_of_work import save, remove, save_async, remove_async
+from app.db.filters import ALL, EQUALITY, FilterSet
+from app.db.pagination import Page, paginate, paginate_async
 from app.models.intern import Intern
 from app.schemas.intern import InternCreate, InternUpdate
 
+INTERN_FILTERS = FilterSet(
+    fields={
+        "status": (Intern.status, EQUALITY),
+        "university": (Intern.university, EQUALITY),
+        "department": (Intern.department, EQUALITY),
+        "job_position": (Intern.job_position, EQUALITY),
+        "start_date": (Intern.start_date, ALL),
+    },
+    sorts={"id": Intern.id, "full_name": Intern.full_name},
+    tiebreaker=Intern.id,
+)
+
 class InternService:
-    def get_interns(self, db: Session, skip: int = 0, limit: int = 100) -> List[Intern]:
-        return db.query(Intern).offset(skip).limit(limit).all()
+    def get_interns(
+        self,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[Intern]:
+        query, order_by = INTERN_FILTERS.apply(db.query(Intern), filters, sort)
+        return paginate(query, order_by, cursor, limit)
 
     def get_intern_by_id(self, db: Session, intern_id: int) -> Optional[Intern]:
         return db.query(Intern).filter(Intern.id == intern_id).first()
@@ -13,8 +38,8 @@ class InternService:
     def get_intern_by_email(self, db: Session, email: str) -> Optional[Intern]:
         return db.query(Intern).filter(Intern.email == email).first()
 
-    def create_intern(self, db: Session, intern_in: InternCreate) -> Intern:
-        db_intern = Intern(
+    def _build_intern(self, intern_in: InternCreate) -> Intern:
+        return Intern(
             full_name=intern_in.full_name,
             email=intern_in.email,
             university=intern_in.university,
@@ -27,9 +52,10 @@ class InternService:
             salary = intern_in.salary,
             gender = intern_in.gender,
         )
-        db.add(db_intern)
-        db.commit()
-        db.refresh(db_intern)
+
+    def create_intern(self, db: Session, intern_in: InternCreate) -> Intern:
+        db_intern = self._build_intern(intern_in)
+        save(db, db_intern)
         return db_intern
 
     def update_intern(self, db: Session, db_intern: Intern, intern_in: InternUpdate) -> Intern:
@@ -37,16 +63,51 @@ class InternService:
         for field, value in update_data.items():
             setattr(db_intern, field, value)
         
-        db.add(db_intern)
-        db.commit()
-        db.refresh(db_intern)
+        save(db, db_intern)
         return db_intern
 
     def delete_intern(self, db: Session, intern_id: int) -> Optional[Intern]:
         db_intern = self.get_intern_by_id(db, intern_id)
         if db_intern:
-            db.delete(db_intern)
-            db.commit()
+            remove(db, db_intern)
+        return db_intern
+
+    # Async variants, for endpoints running on an AsyncSession
+
+    async def get_interns_async(
+        self,
+        db: AsyncSession,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        filters: Optional[List[str]] = None,
+        sort: Optional[str] = None,
+    ) -> Page[Intern]:
+        stmt, order_by = INTERN_FILTERS.apply(select(Intern), filters, sort)
+        return await paginate_async(db, stmt, order_by, cursor, limit)
+
+    async def get_intern_by_id_async(self, db: AsyncSession, intern_id: int) -> Optional[Intern]:
+        return await db.scalar(select(Intern).where(Intern.id == intern_id))
+
+    async def get_intern_by_email_async(self, db: AsyncSession, email: str) -> Optional[Intern]:
+        return await db.scalar(select(Intern).where(Intern.email == email).limit(1))
+
+    async def create_intern_async(self, db: AsyncSession, intern_in: InternCreate) -> Intern:
+        db_intern = self._build_intern(intern_in)
+        await save_async(db, db_intern)
+        return db_intern
+
+    async def update_intern_async(self, db: AsyncSession, db_intern: Intern, intern_in: InternUpdate) -> Intern:
+        update_data = intern_in.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_intern, field, value)
+
+        await save_async(db, db_intern)
+        return db_intern
+
+    async def delete_intern_async(self, db: AsyncSession, intern_id: int) -> Optional[Intern]:
+        db_intern = await self.get_intern_by_id_async(db, intern_id)
+        if db_intern:
+            await remove_async(db, db_intern)
         return db_intern
 
 intern_service = InternService()
@@ -1,14 +1,16 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from app.db.unit_of_work import save, remove
+from app.db.pagination import Page, paginate
 from app.models.interviewRounds import InterviewRounds, RoundName
 from app.schemas.interview_rounds import InterviewRoundsCreate, InterviewRoundsUpdate
 
 
 class InterviewRoundsService:
     def get_interview_rounds(
-        self, db: Session, skip: int = 0, limit: int = 100
-    ) -> List[InterviewRounds]:
-        return db.query(InterviewRounds).offset(skip).limit(limit).all()
+        self, db: Session, cursor: Optional[str] = None, limit: int = 100
+    ) -> Page[InterviewRounds]:
+        return paginate(db.query(InterviewRounds), [InterviewRounds.id], cursor, limit)
 
     def get_interview_round_by_id(
         self, db: Session, interview_round_id: int
@@ -22,9 +24,7 @@ class InterviewRoundsService:
             round_number=interview_round_in.round_number,
             round_name=interview_round_in.round_name,
         )
-        db.add(db_interview_round)
-        db.commit()
-        db.refresh(db_interview_round)
+        save(db, db_interview_round)
         return db_interview_round
 
     def update_interview_round(
@@ -37,9 +37,7 @@ class InterviewRoundsService:
         for field, value in update_data.items():
             setattr(db_interview_round, field, value)
 
-        db.add(db_interview_round)
-        db.commit()
-        db.refresh(db_interview_round)
+        save(db, db_interview_round)
         return db_interview_round
 
     def delete_interview_round(
@@ -47,8 +45,7 @@ class InterviewRoundsService:
     ) -> Optional[InterviewRounds]:
         db_interview_round = self.get_interview_round_by_id(db, interview_round_id)
         if db_interview_round:
-            db.delete(db_interview_round)
-            db.commit()
+            remove(db, db_interview_round)
         return db_interview_round
 
 
@@ -0,0 +1,223 @@
+"""
+Normalized candidate skills.
+
+Candidate.skills stays the free-text string the resume parser (or a
+recruiter) wrote. Whenever it is written, it is split into entries, each
+entry is normalized to an alias key ("Java Script " -> "java script") and
+resolved through skill_aliases to a canonical Skill, and the candidate's
+rows in candidate_skills are replaced. Skill queries then read the
+(skill_id, candidate_id) index instead of scanning candidate.skills.
+
+Unknown skills are created on first sight, named after that spelling.
+SYNONYMS gives the common ones a canonical name up front.
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.core.logger import logger
+from app.db.session import SessionLocal, use_primary
+from app.models.candidate import Candidate
+from app.models.skill import CandidateSkill, Skill, SkillAlias
+
+MAX_SKILL_LENGTH = 100
+
+_SEPARATORS = re.compile(r"[,;|\n•]+")
+_SPACES = re.compile(r"\s+")
+
+# Canonical name -> other spellings (as alias keys)
+SYNONYMS = {
+    "JavaScript": ["js", "java script", "ecmascript"],
+    "TypeScript": ["ts"],
+    "Python": ["py", "python3", "python 3"],
+    "Go": ["golang"],
+    "C++": ["cpp", "c plus plus"],
+    "C#": ["csharp", "c sharp"],
+    "Node.js": ["node", "nodejs", "node js"],
+    "React": ["reactjs", "react.js", "react js"],
+    "Vue.js": ["vue", "vuejs"],
+    "Angular": ["angularjs", "angular.js"],
+    "Kubernetes": ["k8s"],
+    "PostgreSQL": ["postgres", "postgre sql", "psql"],
+    "MySQL": ["my sql"],
+    "MongoDB": ["mongo"],
+    "SQL": [],
+    "HTML": ["html5"],
+    "CSS": ["css3"],
+    "AWS": ["amazon web services"],
+    "Google Cloud": ["gcp", "google cloud platform"],
+    "Azure": ["microsoft azure"],
+    "Docker": [],
+    "Git": [],
+    "Machine Learning": ["ml"],
+    "Deep Learning": ["dl"],
+    "Natural Language Processing": ["nlp"],
+    "Data Analysis": ["data analytics"],
+    "REST APIs": ["rest", "rest api", "restful apis", "restful api"],
+}
+
+
+def skill_key(raw: str) -> str:
+    """Normalized alias key: case-folded, single-spaced, without bullet or trailing dot."""
+    return _SPACES.sub(" ", raw).strip(" .-*\t").casefold()
+
+
+# Alias key -> canonical name, including each canonical name's own key
+CANONICAL_NAMES = {
+    **{skill_key(name): name for name in SYNONYMS},
+    **{alias: name for name, aliases in SYNONYMS.items() for alias in aliases},
+}
+
+
+def parse_skills(text: Optional[str]) -> Dict[str, str]:
+    """Alias key -> name to create the skill with, for each entry of a skills string."""
+    entries: Dict[str, str] = {}
+    for raw in _SEPARATORS.split(text or ""):
+        key = skill_key(raw)
+        if not key or len(key) > MAX_SKILL_LENGTH or key in entries:
+            continue
+        entries[key] = CANONICAL_NAMES.get(key) or _SPACES.sub(" ", raw).strip(" .-*\t")
+    return entries
+
+
+class SkillService:
+    def lookup_skill_ids(self, db: Session, names: Iterable[str]) -> Dict[str, int]:
+        """Alias key -> skill id for the names that are known; never creates skills."""
+        keys = {skill_key(name) for name in names} - {""}
+        if not keys:
+            return {}
+        # A synonym nobody has written yet still finds its canonical skill
+        canonical = {key: skill_key(CANONICAL_NAMES[key]) for key in keys if key in CANONICAL_NAMES}
+        stored = dict(db.execute(
+            select(SkillAlias.alias, SkillAlias.skill_id).where(SkillAlias.alias.in_(keys | set(canonical.values())))
+        ).all())
+        found = {}
+        for key in keys:
+            skill_id = stored.get(key) or stored.get(canonical.get(key))
+            if skill_id is not None:
+                found[key] = skill_id
+        return found
+
+    def resolve_skills(self, db: Session, entries: Dict[str, str]) -> Dict[str, int]:
+        """
+        Alias key -> skill id, creating missing skills and aliases. Takes
+        three statements however many entries there are; concurrent
+        ingestions of the same new skill converge on one row.
+        """
+        found = self.lookup_skill_ids(db, entries)
+        missing = {key: name for key, name in entries.items() if key not in found}
+        if not missing:
+            return found
+
+        names = set(missing.values())
+        db.execute(pg_insert(Skill).values([{"name": name} for name in names]).on_conflict_do_nothing())
+        ids_by_name = dict(db.execute(select(Skill.name, Skill.id).where(Skill.name.in_(names))).all())
+        # The canonical name's own key is stored too, which is what synonym lookups fall back to
+        aliases = {**{skill_key(name): name for name in names}, **missing}
+        db.execute(
+            pg_insert(SkillAlias)
+            .values([{"alias": key, "skill_id": ids_by_name[name]} for key, name in aliases.items()])
+            .on_conflict_do_nothing()
+        )
+        # Another transaction may have stored one of these aliases first
+        found.update(self.lookup_skill_ids(db, missing))
+        return found
+
+    def sync_candidate_skills(self, db: Session, skills_by_candidate: Dict[int, Optional[str]]) -> None:
+        """
+        Replace the candidate_skills rows of each candidate with the skills
+        parsed from its skills string. Flushes only; the caller commits.
+        """
+        if not skills_by_candidate:
+            return
+        parsed = {candidate_id: parse_skills(text) for candidate_id, text in skills_by_candidate.items()}
+        all_entries: Dict[str, str] = {}
+        for entries in parsed.values():
+            for key, name in entries.items():
+                all_entries.setdefault(key, name)
+        skill_ids = self.resolve_skills(db, all_entries) if all_entries else {}
+
+        rows = {
+            (candidate_id, skill_ids[key])
+            for candidate_id, entries in parsed.items()
+            for key in entries
+            if key in skill_ids
+        }
+        db.execute(delete(CandidateSkill).where(CandidateSkill.candidate_id.in_(list(parsed))))
+        if rows:
+            db.execute(
+                pg_insert(CandidateSkill)
+                .values([{"candidate_id": candidate_id, "skill_id": skill_id} for candidate_id, skill_id in rows])
+                .on_conflict_do_nothing()
+            )
+
+    def skill_conditions(
+        self, db: Session, all_of: Optional[List[str]] = None, any_of: Optional[List[str]] = None
+    ) -> Optional[List[Any]]:
+        """
+        WHERE clauses on Candidate.id for candidates having every skill in
+        all_of and at least one in any_of, or None when no candidate can
+        match (an all_of skill nobody has, or no known any_of skill).
+        """
+        all_of, any_of = all_of or [], any_of or []
+        known = self.lookup_skill_ids(db, [*all_of, *any_of])
+
+        conditions = []
+        if all_of:
+            required: Set[int] = set()
+            for name in all_of:
+                if skill_key(name) not in known:
+                    return None
+                required.add(known[skill_key(name)])
+            # Spellings of one skill count once
+            conditions.append(Candidate.id.in_(
+                select(CandidateSkill.candidate_id)
+                .where(CandidateSkill.skill_id.in_(required))
+                .group_by(CandidateSkill.candidate_id)
+                .having(func.count() == len(required))
+            ))
+        if any_of:
+            optional = {known[skill_key(name)] for name in any_of if skill_key(name) in known}
+            if not optional:
+                return None
+            conditions.append(Candidate.id.in_(
+                select(CandidateSkill.candidate_id).where(CandidateSkill.skill_id.in_(optional))
+            ))
+        return conditions
+
+
+def backfill_candidate_skills(batch_size: int = 500) -> int:
+    """
+    Fill candidate_skills for every existing candidate, one transaction per
+    batch, so it can run against a live database. Returns the number of
+    candidates processed.
+    """
+    db = SessionLocal()
+    use_primary(db)
+    processed, last_id = 0, 0
+    try:
+        while True:
+            batch = db.execute(
+                select(Candidate.id, Candidate.skills)
+                .where(Candidate.id > last_id)
+                .order_by(Candidate.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+            skill_service.sync_candidate_skills(db, dict(batch))
+            db.commit()
+            processed += len(batch)
+            last_id = batch[-1].id
+            logger.info(f"Skill backfill: {processed} candidates done")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Skill backfill failed after candidate {last_id}: {e}")
+        raise
+    finally:
+        db.close()
+    return processed
+
+
+skill_service = SkillService()
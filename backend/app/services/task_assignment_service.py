@@ -1,12 +1,16 @@
+from typing import List
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.db.change_events import publish
+from app.db.unit_of_work import save, remove, save_async, remove_async
 from app.models.taskAssignment import TaskAssignment
 from app.schemas.task_assignment import TaskAssignmentCreate, TaskAssignmentUpdate
 
 def create_task_assignment(db: Session, task_assignment: TaskAssignmentCreate):
     db_task_assignment = TaskAssignment(**task_assignment.dict())
-    db.add(db_task_assignment)
-    db.commit()
-    db.refresh(db_task_assignment)
+    save(db, db_task_assignment)
     return db_task_assignment 
 
 def get_task_assignment(db: Session, task_id: int, intern_id: int):
@@ -21,14 +25,63 @@ def update_task_assignment(db: Session, task_id: int, intern_id: int, task_assig
         return None
     for key, value in task_assignment_update.dict(exclude_unset=True).items():
         setattr(db_task_assignment, key, value)
-    db.commit()
-    db.refresh(db_task_assignment)
+    save(db, db_task_assignment)
     return db_task_assignment
 
 def delete_task_assignment(db: Session, task_id: int, intern_id: int):
     db_task_assignment = get_task_assignment(db, task_id, intern_id)
     if not db_task_assignment:
         return None
-    db.delete(db_task_assignment)
-    db.commit()
-    return db_task_assignment
\ No newline at end of file
+    remove(db, db_task_assignment)
+    return db_task_assignment
+
+def assign_tasks(db: Session, task_ids: List[int], intern_ids: List[int]) -> int:
+    """
+    Assign every task to every intern with one multi-row INSERT. Pairs that
+    already exist are skipped; returns the number of new assignments.
+    """
+    rows = [
+        {"task_id": task_id, "intern_id": intern_id}
+        for task_id in dict.fromkeys(task_ids)
+        for intern_id in dict.fromkeys(intern_ids)
+    ]
+    inserted = db.execute(
+        pg_insert(TaskAssignment)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(TaskAssignment.task_id, TaskAssignment.intern_id)
+    ).all()
+    # Only pairs that were actually inserted; skipped ones already existed
+    for task_id, intern_id in inserted:
+        publish(db, "assignment", "created", task_id, intern_ids=[intern_id])
+    save(db)  # commits unless inside a unit of work
+    return len(inserted)
+
+# Async variants, for endpoints running on an AsyncSession
+
+async def create_task_assignment_async(db: AsyncSession, task_assignment: TaskAssignmentCreate):
+    db_task_assignment = TaskAssignment(**task_assignment.dict())
+    await save_async(db, db_task_assignment)
+    return db_task_assignment
+
+async def get_task_assignment_async(db: AsyncSession, task_id: int, intern_id: int):
+    return await db.scalar(select(TaskAssignment).where(
+        TaskAssignment.task_id == task_id,
+        TaskAssignment.intern_id == intern_id
+    ))
+
+async def update_task_assignment_async(db: AsyncSession, task_id: int, intern_id: int, task_assignment_update: TaskAssignmentUpdate):
+    db_task_assignment = await get_task_assignment_async(db, task_id, intern_id)
+    if not db_task_assignment:
+        return None
+    for key, value in task_assignment_update.dict(exclude_unset=True).items():
+        setattr(db_task_assignment, key, value)
+    await save_async(db, db_task_assignment)
+    return db_task_assignment
+
+async def delete_task_assignment_async(db: AsyncSession, task_id: int, intern_id: int):
+    db_task_assignment = await get_task_assignment_async(db, task_id, intern_id)
+    if not db_task_assignment:
+        return None
+    await remove_async(db, db_task_assignment)
+    return db_task_assignment
@@ -0,0 +1,108 @@
+"""
+Lexicographic rank keys for the task board.
+
+A task's place on the board is its rank: a string of base-36 digits read as
+a fraction (0.<digits>), compared byte-wise (the column uses the "C"
+collation). There is always a key strictly between two others, so moving a
+card rewrites that card only. Keys never end in "0", which keeps every key
+distinct from its zero-padded forms.
+
+Repeatedly inserting into the same gap makes keys longer; when one grows
+past TASK_RANK_REBALANCE_LENGTH the whole board is respaced in the
+background (rebalance_task_ranks).
+"""
+from typing import List, Optional
+from sqlalchemy import select, update
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.change_events import publish
+from app.db.session import SessionLocal, use_primary
+from app.models.task import Task
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    """Key strictly between low and high ("" is the start, None the end of the board)."""
+    if high is not None:
+        # Keep the common prefix (low is padded with zeros) and recurse on the rest
+        n = 0
+        while n < len(high) and (low[n] if n < len(low) else "0") == high[n]:
+            n += 1
+        if n:
+            return high[:n] + _midpoint(low[n:], high[n:])
+    digit_low = DIGITS.index(low[0]) if low else 0
+    digit_high = DIGITS.index(high[0]) if high is not None else BASE
+    if digit_high - digit_low > 1:
+        return DIGITS[(digit_low + digit_high) // 2]
+    # Adjacent first digits
+    if high is not None and len(high) > 1:
+        return high[0]
+    return DIGITS[digit_low] + _midpoint(low[1:], None)
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """
+    Rank for a task placed after `before` and ahead of `after`; either may be
+    None for the start / end of the board.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Rank {before!r} is not before {after!r}")
+    if before and after is None:
+        # Appending (the common case): step the key up instead of halving
+        # the remaining space, so keys grow by one digit per 35 appends
+        head = before.rstrip(DIGITS[-1])
+        if head:
+            return head[:-1] + DIGITS[DIGITS.index(head[-1]) + 1]
+        return before + DIGITS[1]
+    return _midpoint(before or "", after)
+
+
+def spaced_ranks(count: int) -> List[str]:
+    """`count` ascending keys of equal length, evenly spread over the key space."""
+    width = 1
+    while BASE ** width < (count + 1) * BASE:
+        width += 1
+    ranks = []
+    for i in range(1, count + 1):
+        value = i * BASE ** width // (count + 1)
+        digits = ""
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits = DIGITS[digit] + digits
+        ranks.append(digits.rstrip("0"))
+    return ranks
+
+
+def needs_rebalance(rank: str) -> bool:
+    return len(rank) > settings.TASK_RANK_REBALANCE_LENGTH
+
+
+def rebalance_task_ranks() -> None:
+    """
+    Respace every task's rank, keeping the board order. Runs as a background
+    task with its own session; the rows are locked so concurrent moves wait
+    for it instead of writing ranks from the old spacing.
+    """
+    db = SessionLocal()
+    use_primary(db)
+    try:
+        task_ids = db.scalars(
+            select(Task.task_id).order_by(Task.rank, Task.task_id).with_for_update()
+        ).all()
+        db.execute(
+            update(Task),
+            [
+                {"task_id": task_id, "rank": rank}
+                for task_id, rank in zip(task_ids, spaced_ranks(len(task_ids)))
+            ],
+        )
+        publish(db, "board", "rebalanced")
+        db.commit()
+        logger.info(f"Rebalanced ranks of {len(task_ids)} tasks")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Task rank rebalance failed: {e}")
+    finally:
+        db.close()
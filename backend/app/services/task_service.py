@@ -1,31 +1,206 @@
-from sqlalchemy.orm import Session
-from app.models.task import Task, TaskStatus
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, contains_eager
+from app.db.change_events import publish
+from app.db.unit_of_work import save, remove, save_async, remove_async
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.taskAssignment import TaskAssignment
+from app.models.tombstone import Tombstone
+from app.models.user import User
 from app.schemas.task import TaskCreate, TaskUpdate
-from typing import List
+from app.services.task_rank import rank_between
+from app.services.task_sync_service import prune_tombstones
+from datetime import date
+from typing import List, Optional
+from app.db.filters import ALL, EQUALITY, FilterSet
+from app.db.pagination import Page, paginate, paginate_async
 
-def create_task(db: Session, task_data: TaskCreate, user_id: int) -> Task:
-    """Create a new task."""
-    new_task = Task(
+TASK_FILTERS = FilterSet(
+    fields={
+        "status": (Task.status, EQUALITY),
+        "priority": (Task.priority, EQUALITY),
+        "due_date": (Task.due_date, ALL),
+        "created_by": (Task.created_by, EQUALITY),
+        "updated_at": (Task.updated_at, ("gt", "gte", "lt", "lte")),
+    },
+    sorts={"rank": Task.rank, "due_date": Task.due_date, "updated_at": Task.updated_at, "task_id": Task.task_id},
+    tiebreaker=Task.task_id,
+    # Board order
+    default_sort=[Task.rank, Task.task_id],
+)
+
+def _task_values(task_data: TaskCreate, user_id: int, last_rank: Optional[str]) -> dict:
+    return dict(
         title=task_data.title,
         description=task_data.description,
         status=task_data.status,
         position=task_data.position,
         due_date=task_data.due_date,
         priority=task_data.priority,
+        # New tasks go to the end of the board
+        rank=rank_between(last_rank, None),
         created_by=user_id
     )
-    db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
+
+def _build_task(task_data: TaskCreate, user_id: int, last_rank: Optional[str]) -> Task:
+    return Task(**_task_values(task_data, user_id, last_rank))
+
+def _apply_task_update(task: Task, task_data: TaskUpdate) -> None:
+    # assigned_intern is derived from the assignments, not a column
+    for key, value in task_data.dict(exclude_unset=True, exclude={"assigned_intern"}).items():
+        setattr(task, key, value)
+
+    if task_data.due_date is not None:
+        task.due_date = task_data.due_date
+
+    if task_data.priority is not None:
+        task.priority = task_data.priority
+
+def _intern_tasks_stmt(
+    intern_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    due_after: Optional[date] = None,
+    due_before: Optional[date] = None,
+):
+    """
+    user -> intern -> assignments -> tasks as a single joined SELECT.
+    The join also fills Task.assignments with this intern's assignment, so
+    assigned_intern is the intern asked for and no selectin query follows.
+    """
+    stmt = (
+        select(Task)
+        .join(Task.assignments)
+        .options(contains_eager(Task.assignments))
+        .order_by(Task.rank, Task.task_id)
+    )
+    if user_id is not None:
+        stmt = stmt.join(User, User.intern_id == TaskAssignment.intern_id).where(User.id == user_id)
+    else:
+        stmt = stmt.where(TaskAssignment.intern_id == intern_id)
+    if status is not None:
+        stmt = stmt.where(Task.status == status)
+    if priority is not None:
+        stmt = stmt.where(Task.priority == priority)
+    if due_after is not None:
+        stmt = stmt.where(Task.due_date >= due_after)
+    if due_before is not None:
+        stmt = stmt.where(Task.due_date <= due_before)
+    return stmt
+
+def create_task(db: Session, task_data: TaskCreate, user_id: int) -> Task:
+    """Create a new task."""
+    new_task = _build_task(task_data, user_id, db.scalar(select(func.max(Task.rank))))
+    save(db, new_task)
     return new_task
 
 def get_task(db: Session, task_id: str) -> Task:
     """Retrieve a task by its ID."""
     return db.query(Task).filter(Task.task_id == task_id).first()
 
-def get_tasks(db: Session) -> List[Task]:
-    """Retrieve all tasks created by a specific user."""
-    return db.query(Task).order_by(Task.position).all()
+def get_tasks(
+    db: Session,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: Optional[List[str]] = None,
+    sort: Optional[str] = None,
+) -> Page[Task]:
+    """Retrieve one page of tasks, in board order unless another sort is given."""
+    query, order_by = TASK_FILTERS.apply(db.query(Task), filters, sort)
+    return paginate(query, order_by, cursor, limit)
+
+def get_tasks_version(db: Session, filters: Optional[List[str]] = None) -> tuple:
+    """
+    A cheap fingerprint of the filtered tasks, read from indexes without
+    loading rows: any insert, update or delete of a task or assignment
+    changes it.
+    """
+    return tuple(db.execute(
+        select(
+            func.count(),
+            func.max(Task.updated_at),
+            select(func.max(TaskAssignment.updated_at)).scalar_subquery(),
+            select(func.max(Tombstone.id)).scalar_subquery(),
+        ).select_from(Task).where(*TASK_FILTERS.where(filters))
+    ).one())
+
+def get_intern_tasks(
+    db: Session,
+    intern_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    due_after: Optional[date] = None,
+    due_before: Optional[date] = None,
+) -> List[Task]:
+    """Retrieve an intern's tasks (by intern_id or user_id) in board order."""
+    return db.scalars(_intern_tasks_stmt(intern_id, user_id, status, priority, due_after, due_before)).unique().all()
+
+def create_tasks(db: Session, tasks_data: List[TaskCreate], user_id: int) -> List[Task]:
+    """
+    Create many tasks, appended to the board in the given order, with one
+    multi-row INSERT for the tasks and one for their assignments.
+    """
+    last_rank = db.scalar(select(func.max(Task.rank)))
+    rows = []
+    for task_data in tasks_data:
+        rows.append(_task_values(task_data, user_id, last_rank))
+        last_rank = rows[-1]["rank"]
+    task_ids = db.scalars(insert(Task).returning(Task.task_id, sort_by_parameter_order=True), rows).all()
+
+    assignments = [
+        {"task_id": task_id, "intern_id": task_data.assigned_intern}
+        for task_id, task_data in zip(task_ids, tasks_data)
+        if task_data.assigned_intern
+    ]
+    if assignments:
+        db.execute(pg_insert(TaskAssignment).values(assignments).on_conflict_do_nothing())
+    # Core statements bypass the flush, so their change events are queued by hand
+    for task_id, task_data in zip(task_ids, tasks_data):
+        intern_ids = [task_data.assigned_intern] if task_data.assigned_intern else []
+        publish(db, "task", "created", task_id, intern_ids=intern_ids)
+    save(db)  # commits unless inside a unit of work
+
+    # Read back with server defaults and assignees (two queries in all)
+    return db.scalars(
+        select(Task)
+        .where(Task.task_id.in_(task_ids))
+        .order_by(Task.rank)
+        .execution_options(populate_existing=True)
+    ).all()
+
+def update_tasks_status(db: Session, task_ids: List[int], status: TaskStatus) -> List[int]:
+    """Set the status of many tasks with one UPDATE; returns the ids that exist."""
+    updated_ids = db.scalars(
+        update(Task)
+        .where(Task.task_id.in_(task_ids))
+        .values(status=status)
+        .returning(Task.task_id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    for task_id in updated_ids:
+        publish(db, "task", "updated", task_id)
+    save(db)  # commits unless inside a unit of work
+    return updated_ids
+
+def get_tasks_by_ids(db: Session, task_ids) -> List[Task]:
+    return db.scalars(select(Task).where(Task.task_id.in_(task_ids))).all()
+
+def move_task(
+    db: Session, task: Task, before: Optional[Task], after: Optional[Task], status: Optional[TaskStatus] = None
+) -> Task:
+    """
+    Place a task between two neighbours by giving it a rank between theirs.
+    Only the moved task is written. Raises ValueError when the neighbours are
+    not in that order (the client's board is stale, or ranks collided).
+    """
+    task.rank = rank_between(before.rank if before else None, after.rank if after else None)
+    if status is not None:
+        task.status = status
+    save(db, task)
+    return task
 
 def update_task(db: Session, task_id: str, task_data: TaskUpdate) -> Task:
     """Update an existing task."""
@@ -33,17 +208,9 @@ def update_task(db: Session, task_id: str, task_data: TaskUpdate) -> Task:
     if not task:
         return None
 
-    for key, value in task_data.dict(exclude_unset=True).items():
-        setattr(task, key, value)
+    _apply_task_update(task, task_data)
 
-    if task_data.due_date is not None:
-        task.due_date = task_data.due_date
-
-    if task_data.priority is not None:
-        task.priority = task_data.priority
-
-    db.commit()
-    db.refresh(task)
+    save(db, task)
     return task
 
 def delete_task(db: Session, task_id: str) -> bool:
@@ -52,6 +219,63 @@ def delete_task(db: Session, task_id: str) -> bool:
     if not task:
         return False
 
-    db.delete(task)
-    db.commit()
-    return True
\ No newline at end of file
+    prune_tombstones(db)
+    remove(db, task)
+    return True
+
+# Async variants, for endpoints running on an AsyncSession
+
+async def create_task_async(db: AsyncSession, task_data: TaskCreate, user_id: int) -> Task:
+    """Create a new task."""
+    new_task = _build_task(task_data, user_id, await db.scalar(select(func.max(Task.rank))))
+    await save_async(db, new_task)
+    return new_task
+
+async def get_task_async(db: AsyncSession, task_id: str) -> Task:
+    """Retrieve a task by its ID."""
+    return await db.scalar(select(Task).where(Task.task_id == task_id))
+
+async def get_tasks_async(
+    db: AsyncSession,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    filters: Optional[List[str]] = None,
+    sort: Optional[str] = None,
+) -> Page[Task]:
+    """Retrieve one page of tasks, in board order unless another sort is given."""
+    stmt, order_by = TASK_FILTERS.apply(select(Task), filters, sort)
+    return await paginate_async(db, stmt, order_by, cursor, limit)
+
+async def get_intern_tasks_async(
+    db: AsyncSession,
+    intern_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    status: Optional[TaskStatus] = None,
+    priority: Optional[TaskPriority] = None,
+    due_after: Optional[date] = None,
+    due_before: Optional[date] = None,
+) -> List[Task]:
+    """Retrieve an intern's tasks (by intern_id or user_id) in board order."""
+    result = await db.scalars(_intern_tasks_stmt(intern_id, user_id, status, priority, due_after, due_before))
+    return result.unique().all()
+
+async def update_task_async(db: AsyncSession, task_id: str, task_data: TaskUpdate) -> Task:
+    """Update an existing task."""
+    task = await get_task_async(db, task_id)
+    if not task:
+        return None
+
+    _apply_task_update(task, task_data)
+
+    await save_async(db, task)
+    return task
+
+async def delete_task_async(db: AsyncSession, task_id: str) -> bool:
+    """Delete a task by its ID."""
+    task = await get_task_async(db, task_id)
+    if not task:
+        return False
+
+    await db.run_sync(prune_tombstones)
+    await remove_async(db, task)
+    return True
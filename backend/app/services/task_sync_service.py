@@ -0,0 +1,75 @@
+"""
+Delta sync for the task board.
+
+A client fetches the board once, then polls get_task_changes with the
+cursor from its previous call and gets back only the tasks and assignments
+whose updated_at moved past it, plus tombstones for deleted rows. Clients
+apply the deletions first, then upsert the rows.
+
+updated_at is the start time of the writing transaction, so a transaction
+that began before a cursor was issued can commit after it. Each poll
+therefore re-sends changes from TASK_SYNC_OVERLAP_SECONDS before the
+cursor; upserts are idempotent, so the overlap is harmless.
+"""
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.pagination import decode_cursor, encode_cursor
+from app.db.session import db_now
+from app.models.task import Task
+from app.models.taskAssignment import TaskAssignment
+from app.models.tombstone import Tombstone
+
+
+class SyncCursorExpiredError(ValueError):
+    """The cursor predates the tombstone retention window; refetch the board."""
+
+
+def get_task_changes(db: Session, cursor: Optional[str]) -> Dict[str, Any]:
+    """Changes since `cursor`; without one, only a cursor to start polling from."""
+    now = db_now(db)
+    changes = {
+        "tasks": [],
+        "assignments": [],
+        "deleted_task_ids": [],
+        "deleted_assignments": [],
+        "cursor": encode_cursor([now]),
+    }
+    if not cursor:
+        return changes
+
+    since = decode_cursor(cursor, [Task.updated_at])[0]
+    if since < now - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS):
+        raise SyncCursorExpiredError("Sync cursor has expired, fetch the full board again")
+    since -= timedelta(seconds=settings.TASK_SYNC_OVERLAP_SECONDS)
+
+    changes["tasks"] = db.scalars(
+        select(Task).where(Task.updated_at > since).order_by(Task.rank, Task.task_id)
+    ).all()
+    changes["assignments"] = db.scalars(
+        select(TaskAssignment).where(TaskAssignment.updated_at > since)
+    ).all()
+    tombstones = db.scalars(
+        select(Tombstone)
+        .where(
+            Tombstone.deleted_at > since,
+            Tombstone.entity.in_([Task.__tablename__, TaskAssignment.__tablename__]),
+        )
+        .order_by(Tombstone.id)
+    )
+    for tombstone in tombstones:
+        if tombstone.entity == Task.__tablename__:
+            changes["deleted_task_ids"].append(tombstone.entity_id)
+        else:
+            changes["deleted_assignments"].append(
+                {"task_id": tombstone.entity_id, "intern_id": tombstone.secondary_id}
+            )
+    return changes
+
+
+def prune_tombstones(db: Session) -> None:
+    """Drop tombstones no valid cursor can ask for any more (joins the caller's transaction)."""
+    cutoff = db_now(db) - timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS)
+    db.execute(delete(Tombstone).where(Tombstone.deleted_at < cutoff))
@@ -5,7 +5,7 @@ import os
 import json
 from openai import OpenAI
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, use_primary
 from app.services.candidate_service import CandidateService
 from app.services.college_service import CollegeService
 from app.schemas.candidate import CandidateCreate
@@ -55,6 +55,7 @@ class PDFExtractionService:
 
         # Create database session
         db = SessionLocal()
+        use_primary(db)
 
         try:
             for filename in pdf_files:
@@ -98,6 +99,7 @@ class PDFExtractionService:
                     college = self.college_service.get_college_by_id(db, college_id)
                     candidate_data["university"] = college.college_name if college else "Unknown"
                     candidate_data["skills"] = candidate_data.get("skills", "")
+                    candidate_data["resume_text"] = extracted_text
                     candidate_data["status"] = RoundName.ASSESSMENT
 
                     # Create candidate schema object
@@ -0,0 +1,131 @@
+"""
+MSAL token cache shared between processes through a locked file.
+
+Every API worker (and the authenticate_email.py script) points at the same
+cache file. Reads pick up changes written by other workers (read-through),
+and every change is written back immediately under an exclusive file lock
+after merging with the latest state on disk (write-on-change), so workers
+never overwrite each other's refreshed tokens.
+"""
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Tuple
+import msal
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileTokenCache(msal.SerializableTokenCache):
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._file_state: Optional[Tuple[int, int]] = None
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._reload_if_changed()
+
+    def add(self, event, **kwargs):
+        with self._exclusive_lock() as outermost:
+            if outermost:
+                self._reload_if_changed()
+            super().add(event, **kwargs)
+            if outermost:
+                self._write()
+
+    def modify(self, credential_type, old_entry, new_key_value_pairs=None):
+        with self._exclusive_lock() as outermost:
+            if outermost:
+                self._reload_if_changed()
+            super().modify(credential_type, old_entry, new_key_value_pairs)
+            if outermost:
+                self._write()
+
+    def search(self, credential_type, target=None, query=None, **kwargs):
+        self._reload_if_changed()
+        return super().search(credential_type, target=target, query=query, **kwargs)
+
+    def _current_file_state(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _reload_if_changed(self) -> None:
+        """Load the file if another process has written it since we last synced."""
+        file_state = self._current_file_state()
+        if file_state is None or file_state == self._file_state:
+            return
+        try:
+            state = self.path.read_text()
+        except FileNotFoundError:
+            return
+        self.deserialize(state)
+        self._file_state = file_state
+
+    def _write(self) -> None:
+        """Atomically replace the cache file so readers never see a partial write."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write(self.serialize())
+                tmp_file.flush()
+                os.fsync(tmp_file.fileno())
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._file_state = self._current_file_state()
+
+    @contextmanager
+    def _exclusive_lock(self):
+        """
+        Cross-process lock on a sidecar file, held while merging and writing.
+
+        Re-entrant within a thread, since MSAL's add() calls modify(); yields
+        True only for the outermost holder, which does the reload and write.
+        """
+        with self._thread_lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield False
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, "a+b") as lock_file:
+                _lock(lock_file)
+                self._lock_depth = 1
+                try:
+                    yield True
+                finally:
+                    self._lock_depth = 0
+                    _unlock(lock_file)
+
+
+def _lock(lock_file) -> None:
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock(lock_file) -> None:
+    if fcntl is not None:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -4,6 +4,8 @@ from typing import Optional
 import jwt
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.user import User
 
@@ -60,3 +62,13 @@ def get_college_id_by_user_id(db: Session, user_id: int) -> Optional[int]:
     if user:
         return user.college_id
     return None
+
+async def get_college_id_by_user_id_async(db: AsyncSession, user_id: int) -> Optional[int]:
+    """
+    Async variant of get_college_id_by_user_id.
+
+    :param db: Async database session
+    :param user_id: ID of the user
+    :return: college_id if found, otherwise None
+    """
+    return await db.scalar(select(User.college_id).where(User.id == user_id))
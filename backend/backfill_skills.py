@@ -0,0 +1,32 @@
+"""
+Skill Backfill Script
+
+Run this script ONCE after `alembic upgrade head` reaches revision 0008,
+to link every existing candidate to its normalized skills. New and
+updated candidates are linked automatically. It is safe to run again.
+
+Usage:
+    python backfill_skills.py
+"""
+
+import sys
+import os
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.services.skill_service import backfill_candidate_skills
+from app.core.logger import logger
+
+def main():
+    try:
+        processed = backfill_candidate_skills()
+        print(f"✓ Linked skills for {processed} candidates")
+        return 0
+    except Exception as e:
+        logger.error(f"Skill backfill error: {str(e)}")
+        print(f"\n✗ Error: {str(e)}\n")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ import React, { useState, useCallback } from 'react';
 import { useDropzone } from 'react-dropzone';
 import { useContext } from 'react';
 import { UserContext } from '@/context/UserContext';
+import { fetchAllPages } from '@/lib/pagination';
 
 const ResumeBulkUpload: React.FC = () => {
     const { user } = useContext(UserContext); // Access user context to get college_id
@@ -18,8 +19,10 @@ const ResumeBulkUpload: React.FC = () => {
 
     const fetchTotalResumes = useCallback(async () => {
         try {
-            const response = await fetch(`http://localhost:8000/api/v1/college-portal/resumes/${collegeId}`);
-            const data = await response.json();
+            const data = await fetchAllPages<any>(
+                `http://localhost:8000/api/v1/college-portal/resumes/${collegeId}?limit=500`,
+                'Failed to fetch total resumes'
+            );
             setTotalResumes(data.length);
             setUploadedResumes(data);
         } catch (err) {
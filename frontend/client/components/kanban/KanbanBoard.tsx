@@ -6,6 +6,7 @@ import { TaskModal } from "./TaskModal";
 import { Button } from "@/components/ui/button";
 import { Plus } from "lucide-react";
 import { useUser } from "../../context/UserContext";
+import { fetchAllPages } from "@/lib/pagination";
 
 type TaskStatus = "todo" | "in-progress" | "review" | "done";
 
@@ -121,25 +122,26 @@ export function KanbanBoard({ initialTasks }: KanbanBoardProps) {
   useEffect(() => {
     const fetchTasks = async () => {
       try {
-        let response;
+        let fetchedTasks: any[];
         
         // Use different API endpoint based on user role
         if (user?.role === "intern" && user?.id) {
-          response = await axios.get(`http://localhost:8000/api/v1/tasks/tasks/intern/${user.id}?id_type=user`, {
+          const response = await axios.get(`http://localhost:8000/api/v1/tasks/tasks/intern/${user.id}?id_type=user`, {
             headers: {
               accept: "application/json",
             },
           });
+          fetchedTasks = response.data;
         } else {
-          response = await axios.get("http://localhost:8000/api/v1/tasks/tasks", {
-            headers: {
-              accept: "application/json",
-            },
-          });
+          // The board needs every task, so follow the cursor through all pages
+          fetchedTasks = await fetchAllPages<any>(
+            "http://localhost:8000/api/v1/tasks/tasks?limit=500",
+            "Failed to fetch tasks"
+          );
         }
 
         // Convert the fetched data to match the dummy data structure
-        const convertedTasks = response.data.map((task: any) => ({
+        const convertedTasks = fetchedTasks.map((task: any) => ({
           id: task.task_id.toString(),
           title: task.title,
           description: task.description,
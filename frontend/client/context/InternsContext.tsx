@@ -1,5 +1,5 @@
 import React, { createContext, useContext, useEffect, useState } from "react";
-import axios from "axios";
+import { fetchAllPages } from "@/lib/pagination";
 
 interface Intern {
   id: number;
@@ -32,15 +32,11 @@ export const InternsProvider: React.FC<{ children: React.ReactNode }> = ({ child
   useEffect(() => {
     async function fetchInterns() {
       try {
-        const response = await axios.get(
-          "http://localhost:8000/api/v1/interns/?skip=0&limit=100",
-          {
-            headers: {
-              accept: "application/json",
-            },
-          }
+        setInterns(
+          await fetchAllPages<Intern>(
+            "http://localhost:8000/api/v1/interns/?limit=500"
+          )
         );
-        setInterns(response.data);
       } catch (err) {
         setError("Failed to fetch interns data");
         console.error(err);
@@ -0,0 +1,34 @@
+// List endpoints return one page per request and put the cursor for the next
+// page in this header; it is absent on the last page.
+export const NEXT_CURSOR_HEADER = "X-Next-Cursor";
+
+/**
+ * Fetch every page of a cursor-paginated list endpoint and return the rows
+ * in order. Throws `Error(errorMessage)` if any page fails.
+ */
+export async function fetchAllPages<T>(
+  url: string,
+  errorMessage = "Request failed",
+): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const pageUrl = new URL(url);
+    if (cursor) {
+      pageUrl.searchParams.set("cursor", cursor);
+    }
+    const response = await fetch(pageUrl.toString(), {
+      headers: {
+        Accept: "application/json",
+      },
+    });
+
+    if (!response.ok) {
+      throw new Error(errorMessage);
+    }
+
+    items.push(...((await response.json()) as T[]));
+    cursor = response.headers.get(NEXT_CURSOR_HEADER);
+  } while (cursor);
+  return items;
+}
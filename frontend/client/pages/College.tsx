@@ -5,6 +5,7 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Pencil, Trash2, Loader2, Plus } from "lucide-react";
 import { useToast } from "@/hooks/use-toast";
+import { fetchAllPages } from "@/lib/pagination";
 import {
   Dialog,
   DialogContent,
@@ -47,17 +48,10 @@ export default function College() {
     setIsLoading(true);
     setError(null);
     try {
-      const response = await fetch("http://localhost:8000/api/v1/colleges", {
-        headers: {
-          Accept: "application/json",
-        },
-      });
-
-      if (!response.ok) {
-        throw new Error("Failed to fetch colleges");
-      }
-
-      const data = await response.json();
+      const data = await fetchAllPages<CollegeData>(
+        "http://localhost:8000/api/v1/colleges/?limit=500",
+        "Failed to fetch colleges"
+      );
       setColleges(data);
     } catch (err) {
       const errorMessage =
@@ -5,6 +5,7 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Pencil, Trash2, Loader2,Upload } from "lucide-react";
 import { useToast } from "@/hooks/use-toast";
+import { fetchAllPages } from "@/lib/pagination";
 import { Input } from "@/components/ui/input";
 import { Search, Filter } from "lucide-react";
 import { useNavigate } from "react-router-dom";
@@ -37,19 +38,11 @@ export default function Candidates() {
     setIsLoading(true);
     setError(null);
     try {
-      const response = await fetch(`http://localhost:8000/api/v1/candidate/hired/${user_id}?skip=0&limit=100`, {
-        headers: {
-          "Accept": "application/json",
-        },
-      });
-
-      if (!response.ok) {
-        throw new Error("Failed to fetch candidates");
-      }
-
-      const data = await response.json();
-      // Ensure data is always an array
-      setCandidates(Array.isArray(data) ? data : []);
+      const data = await fetchAllPages<Candidate>(
+        `http://localhost:8000/api/v1/candidate/hired/${user_id}?limit=500`,
+        "Failed to fetch candidates"
+      );
+      setCandidates(data);
     } catch (err) {
       const errorMessage = err instanceof Error ? err.message : "Failed to fetch candidates";
       setError(errorMessage);
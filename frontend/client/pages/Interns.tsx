@@ -5,6 +5,7 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { Pencil, Trash2, Loader2 } from "lucide-react";
 import { useToast } from "@/hooks/use-toast";
+import { fetchAllPages } from "@/lib/pagination";
 import { Input } from "@/components/ui/input";
 import { Search, Filter } from "lucide-react";
 
@@ -35,17 +36,10 @@ export default function Interns() {
     setIsLoading(true);
     setError(null);
     try {
-      const response = await fetch("http://localhost:8000/api/v1/interns/?skip=0&limit=100", {
-        headers: {
-          "Accept": "application/json",
-        },
-      });
-
-      if (!response.ok) {
-        throw new Error("Failed to fetch interns");
-      }
-
-      const data = await response.json();
+      const data = await fetchAllPages<Intern>(
+        "http://localhost:8000/api/v1/interns/?limit=500",
+        "Failed to fetch interns"
+      );
       setInterns(data);
     } catch (err) {
       const errorMessage = err instanceof Error ? err.message : "Failed to fetch interns";
@@ -14,6 +14,7 @@ import {
 import { Textarea } from "@/components/ui/textarea";
 import { AlertCircle, CheckCircle } from "lucide-react";
 import { useToast } from "@/hooks/use-toast";
+import { fetchAllPages } from "@/lib/pagination";
 
 const DEPARTMENTS = ["COE", "Engineering", "Design", "Analytics", "Quality Assurance", "Product"];
 const ROLES = [
@@ -76,17 +77,10 @@ export default function Onboarding() {
     const fetchHiredCandidates = async () => {
       setCandidatesLoading(true);
       try {
-        const response = await fetch("http://localhost:8000/api/v1/candidate/status/HIRED?skip=0&limit=100", {
-          headers: {
-            "Accept": "application/json",
-          },
-        });
-
-        if (!response.ok) {
-          throw new Error("Failed to fetch candidates");
-        }
-
-        const data: Candidate[] = await response.json();
+        const data = await fetchAllPages<Candidate>(
+          "http://localhost:8000/api/v1/candidate/status/HIRED?limit=500",
+          "Failed to fetch candidates"
+        );
         // Filter only hired candidates
         const hiredCandidates = data.filter(candidate => candidate.status === "hired");
         setCandidates(hiredCandidates);